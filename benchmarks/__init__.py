@@ -0,0 +1,4 @@
+"""Micro-benchmarks for the physics kernels.
+
+Each module is runnable as `python -m benchmarks.<name>` from the repo root.
+"""
@@ -0,0 +1,140 @@
+"""Absorbing boundary layers: reflection quality and domain-size savings.
+
+Part 1 sends a wave packet of carrier frequency ω into the right wall and
+reports the reflected amplitude at a probe, relative to the incident one.
+The reflected wave is isolated by subtracting the same run on a grid long
+enough that nothing comes back in time. Hard walls reflect everything;
+the sponge fails for the slow waves that make up the wake.
+
+Part 2 runs the two-coupler Floquet drive of experiment 4D (T = 0) on
+three grids:
+- the 1000-point hard-wall default;
+- a 400-point grid with absorbing layers;
+- a 6000-point reference on which no reflection returns within the window.
+It reports the per-step cost and the force error against the reference.
+
+Usage:
+    python -m benchmarks.absorbing_layers
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import numpy as np
+
+from core import kernels
+from core.boundaries import AbsorbingLayer
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.vacuum_chamber import DiagnosticsPolicy, VacuumChamber
+
+DX = 0.1
+DT = 0.02
+C = 1.0
+
+LAYERS = {
+    "hard wall": None,
+    "sponge 40": AbsorbingLayer(40, kind="sponge"),
+    "pml 20": AbsorbingLayer(20),
+    "pml 40": AbsorbingLayer(40),
+    "pml 80": AbsorbingLayer(80),
+}
+OMEGAS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+
+def _probe_trace(
+    nx: int, absorber: Optional[AbsorbingLayer], omega: float, x0: float, probe: int, n_steps: int
+) -> np.ndarray:
+    """φ at `probe` for a right-moving packet exp(-(x-x0)²/2w²)·cos(k(x-x0))."""
+    k = omega / C
+    width = max(2 * np.pi / k, 3.0)
+    x = np.arange(nx) * DX
+
+    def packet(xs: np.ndarray) -> np.ndarray:
+        return np.exp(-((xs - x0) ** 2) / (2 * width**2)) * np.cos(k * (xs - x0))
+
+    sim = VacuumChamber(nx, DX, DiagnosticsPolicy.force_only(), absorber=absorber)
+    phi, phi_prev = packet(x), packet(x + C * DT)
+    phi[[0, -1]] = phi_prev[[0, -1]] = 0.0
+    sim.load_field(phi, phi_prev)
+
+    v_zero = np.zeros(nx)
+    trace = np.empty(n_steps)
+    for n in range(n_steps):
+        sim.step(dt=DT, c=C, v_potential=v_zero, support=slice(0, 0))
+        trace[n] = sim.phi[probe]
+    return trace
+
+
+def reflection_coefficient(absorber: Optional[AbsorbingLayer], omega: float) -> float:
+    width = max(2 * np.pi * C / omega, 3.0)
+    layer = absorber.width if absorber is not None else 0
+    nx = int(12 * width / DX) + 2 * layer
+    x0 = layer * DX + 6 * width
+    probe = int((x0 + 3 * width) / DX)
+    n_steps = int((2 * (nx * DX - x0) + 4 * width) / (C * DT))
+
+    trace = _probe_trace(nx, absorber, omega, x0, probe, n_steps)
+    # Same run with the right wall out of reach: only the incident wave
+    open_nx = nx + int(n_steps * C * DT / DX) + 10
+    incident = _probe_trace(open_nx, absorber, omega, x0, probe, n_steps)
+    return float(np.max(np.abs(trace - incident)) / np.max(np.abs(incident)))
+
+
+def _floquet_run(nx: int, absorber: Optional[AbsorbingLayer], n_steps: int, backend: str):
+    x = np.arange(nx) * DX
+    x_center = (nx / 2.0) * DX
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=DX)
+    schedule = FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=1.0, phi=np.pi / 2, dt=DT)
+
+    sim = LangevinVacuumChamber(
+        nx,
+        DX,
+        DT,
+        gamma=0.001,
+        diagnostics=DiagnosticsPolicy.force_only(),
+        backend=backend,
+        absorber=absorber,
+    )
+    # The same smooth pulse, centred between the couplers, on every grid
+    sim.load_field(np.exp(-((x - x_center) ** 2) / 2.0))
+    sim.run(2, schedule, c=C)  # warm-up (JIT compilation)
+
+    start = time.perf_counter()
+    force = sim.run(n_steps, schedule, c=C).mirror_force
+    return force, (time.perf_counter() - start) / n_steps
+
+
+def main() -> None:
+    print("Reflection coefficient |reflected| / |incident| vs carrier frequency ω")
+    print(f"{'layer':>10} " + " ".join(f"{f'ω={w:g}':>8}" for w in OMEGAS))
+    for name, absorber in LAYERS.items():
+        row = " ".join(f"{reflection_coefficient(absorber, w):>8.1e}" for w in OMEGAS)
+        print(f"{name:>10} {row}")
+
+    n_steps = 10_000  # 200 time units, ~32 drive cycles
+    backends = ["numpy"] + (["numba"] if kernels.HAVE_NUMBA else [])
+    timings = {}
+    for backend in backends:
+        reference, timings[backend] = _floquet_run(6000, None, n_steps, backend)
+    scale = np.sqrt(np.mean(reference**2))
+
+    print()
+    print(f"Floquet drive, {n_steps} steps: force error vs an open 6000-point domain")
+    print(f"{'grid':>18} {'rms rel err':>12} " + " ".join(f"{f'{b} (us)':>11}" for b in backends))
+    print(f"{'6000 (reference)':>18} {'-':>12} " + " ".join(f"{timings[b] * 1e6:>11.1f}" for b in backends))
+    for label, nx, absorber in (
+        ("1000 hard walls", 1000, None),
+        ("400 + pml 40", 400, AbsorbingLayer(40)),
+        ("400 + sponge 40", 400, AbsorbingLayer(40, kind="sponge")),
+    ):
+        for backend in backends:
+            force, timings[backend] = _floquet_run(nx, absorber, n_steps, backend)
+        error = np.sqrt(np.mean((force - reference) ** 2)) / scale
+        print(f"{label:>18} {error:>12.2e} " + " ".join(f"{timings[b] * 1e6:>11.1f}" for b in backends))
+
+if __name__ == "__main__":
+    main()
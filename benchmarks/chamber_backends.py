@@ -0,0 +1,84 @@
+"""NumPy vs fused Numba stepping kernels on the plain and Langevin chambers.
+
+Both backends run the same seeded trajectory; the table reports per-step
+cost and the largest force deviation relative to the force scale.
+
+Usage:
+    python -m benchmarks.chamber_backends
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from core import kernels
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.vacuum_chamber import DiagnosticsPolicy, VacuumChamber
+
+DX = 0.1
+DT = 0.02
+
+
+def _floquet_schedule(nx: int) -> FloquetCouplerSchedule:
+    x = np.arange(nx) * DX
+    x_center = (nx / 2.0) * DX
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=DX)
+    return FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=1.0, phi=np.pi / 2, dt=DT)
+
+
+def _make_chamber(kind: str, nx: int, backend: str) -> VacuumChamber:
+    if kind == "leapfrog":
+        sim = VacuumChamber(nx, DX, backend=backend)
+    else:
+        sim = LangevinVacuumChamber(
+            nx,
+            DX,
+            DT,
+            gamma=0.001,
+            temperature=0.02,
+            diagnostics=DiagnosticsPolicy.force_only(),
+            noise_seed=7,
+            backend=backend,
+        )
+    sim.seed_vacuum_noise(seed=42, sigma=0.001)
+    return sim
+
+
+def _run(kind: str, nx: int, n_steps: int, backend: str) -> tuple[float, np.ndarray]:
+    schedule = _floquet_schedule(nx)
+    # Warm-up (triggers JIT compilation) on a throwaway chamber
+    _make_chamber(kind, nx, backend).run(2, schedule, dt=DT, c=1.0)
+
+    sim = _make_chamber(kind, nx, backend)
+    start = time.perf_counter()
+    telemetry = sim.run(n_steps, schedule, dt=DT, c=1.0)
+    elapsed = time.perf_counter() - start
+    return elapsed / n_steps, telemetry.mirror_force
+
+
+def main() -> None:
+    if not kernels.HAVE_NUMBA:
+        print("numba is not installed; only the NumPy backend is available.")
+        return
+
+    print(
+        f"{'chamber':>9} {'nx':>8} {'numpy (us)':>11} {'numba (us)':>11} "
+        f"{'speedup':>9} {'max rel dev':>12}"
+    )
+    for kind in ("leapfrog", "langevin"):
+        for nx, n_steps in ((1_000, 20_000), (10_000, 5_000), (100_000, 500)):
+            t_np, f_np = _run(kind, nx, n_steps, "numpy")
+            t_nb, f_nb = _run(kind, nx, n_steps, "numba")
+            rel_dev = np.max(np.abs(f_nb - f_np)) / max(np.max(np.abs(f_np)), np.finfo(float).tiny)
+            print(
+                f"{kind:>9} {nx:>8} {t_np * 1e6:>11.2f} {t_nb * 1e6:>11.2f} "
+                f"{t_np / t_nb:>8.2f}x {rel_dev:>12.2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""float32 vs float64 chamber fields: per-step cost and net-impulse drift.
+
+Usage:
+    python -m benchmarks.chamber_precision
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from core.ensemble_chamber import EnsembleLangevinChamber
+from core.langevin import LangevinVacuumChamber
+from core.precision import reference_drift
+from core.vacuum_chamber import DiagnosticsPolicy
+
+
+def _langevin_step_time(nx: int, n_steps: int, dtype: type) -> float:
+    sim = LangevinVacuumChamber(
+        nx,
+        0.1,
+        0.02,
+        temperature=0.01,
+        diagnostics=DiagnosticsPolicy.force_only(),
+        noise_seed=0,
+        dtype=dtype,
+    )
+    sim.seed_vacuum_noise(seed=42)
+    V = 5.0 * np.exp(-((sim.x - sim.x[nx // 2]) ** 2) / 2.0)
+
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        sim.step_damped(c=1.0, v_potential=V)
+    return (time.perf_counter() - start) / n_steps
+
+
+def _ensemble_step_time(n_members: int, nx: int, n_steps: int, dtype: type) -> float:
+    ens = EnsembleLangevinChamber(
+        n_members, nx, 0.1, 0.02, gamma=0.001, temperatures=0.01, seed=0, dtype=dtype
+    )
+    ens.seed_members(list(range(n_members)))
+    V = 5.0 * np.exp(-((ens.x - ens.x[nx // 2]) ** 2) / 2.0)
+
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        ens.step(c=1.0, v_potential=V)
+    return (time.perf_counter() - start) / n_steps
+
+
+def main() -> None:
+    print(f"{'case':>22} {'float64 (us)':>13} {'float32 (us)':>13} {'speedup':>9}")
+    cases = [
+        (f"langevin nx={nx}", lambda dt, nx=nx, n=n: _langevin_step_time(nx, n, dt))
+        for nx, n in ((10_000, 5_000), (100_000, 500))
+    ]
+    cases.append(("ensemble 64x10000", lambda dt: _ensemble_step_time(64, 10_000, 50, dt)))
+    for label, timer in cases:
+        t64, t32 = timer(np.float64), timer(np.float32)
+        print(f"{label:>22} {t64 * 1e6:>13.1f} {t32 * 1e6:>13.1f} {t64 / t32:>8.2f}x")
+
+    print()
+    for temperature in (0.0, 0.01):
+        report = reference_drift(temperature=temperature)
+        print(
+            f"reference run T={temperature}: impulse64={report.impulse_float64:+.6e} "
+            f"impulse32={report.impulse_float32:+.6e} rel drift={report.rel_drift:.1e} "
+            f"[{'OK' if report.acceptable() else 'TOO LARGE'}]"
+        )
+
+
+if __name__ == "__main__":
+    main()
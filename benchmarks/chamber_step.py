@@ -0,0 +1,77 @@
+"""Per-step cost of `VacuumChamber.step` against the original allocating kernel.
+
+Usage:
+    python -m benchmarks.chamber_step
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from core.vacuum_chamber import VacuumChamber
+
+
+def _reference_step(sim: VacuumChamber, *, dt: float, c: float, v_potential: np.ndarray) -> None:
+    """The pre-optimization kernel (np.roll Laplacian, np.gradient, np.copy rotation)."""
+    laplacian = (np.roll(sim.phi, -1) - 2 * sim.phi + np.roll(sim.phi, 1)) / (sim.dx**2)
+    interaction = v_potential * sim.phi
+    sim.phi_next = 2 * sim.phi - sim.phi_prev + (dt**2) * ((c**2) * laplacian - interaction)
+    sim.phi_next[0] = 0.0
+    sim.phi_next[-1] = 0.0
+
+    grad_v = np.gradient(v_potential, sim.dx)
+    sim.mirror_force.append(-float(np.sum((sim.phi**2) * grad_v) * sim.dx))
+
+    dphi_dt = (sim.phi_next - sim.phi_prev) / (2 * dt)
+    dphi_dx = np.gradient(sim.phi, sim.dx)
+    sim.total_energy_field.append(
+        0.5 * float(np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * sim.phi**2) * sim.dx)
+    )
+
+    sim.phi_prev = np.copy(sim.phi)
+    sim.phi = np.copy(sim.phi_next)
+
+
+def _time_per_step(
+    step_fn: Callable[[VacuumChamber, np.ndarray], None],
+    *,
+    nx: int,
+    n_steps: int,
+    dx: float = 0.1,
+) -> tuple[float, np.ndarray]:
+    sim = VacuumChamber(nx, dx)
+    sim.seed_vacuum_noise(seed=42, sigma=0.001)
+    x_center = (nx / 2.0) * dx
+    V = 50.0 * np.exp(-((sim.x - x_center) ** 2) / (2 * 5.0**2))
+
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        step_fn(sim, V)
+    elapsed = time.perf_counter() - start
+    return elapsed / n_steps, np.asarray(sim.mirror_force)
+
+
+def main() -> None:
+    print(f"{'nx':>8} {'reference (us)':>16} {'in-place (us)':>15} {'speedup':>9} {'identical':>10}")
+    for nx, n_steps in ((1_000, 20_000), (10_000, 5_000), (100_000, 500)):
+        t_ref, f_ref = _time_per_step(
+            lambda sim, V: _reference_step(sim, dt=0.05, c=1.0, v_potential=V),
+            nx=nx,
+            n_steps=n_steps,
+        )
+        t_new, f_new = _time_per_step(
+            lambda sim, V: sim.step(dt=0.05, c=1.0, v_potential=V),
+            nx=nx,
+            n_steps=n_steps,
+        )
+        print(
+            f"{nx:>8} {t_ref * 1e6:>16.2f} {t_new * 1e6:>15.2f} "
+            f"{t_ref / t_new:>8.2f}x {str(np.array_equal(f_ref, f_new)):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
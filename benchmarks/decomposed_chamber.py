@@ -0,0 +1,79 @@
+"""Per-step cost of the domain-decomposed chamber against one process.
+
+Runs the two-coupler Floquet drive of experiment 4D on a long grid, first
+in a single `LangevinVacuumChamber` and then split across 1, 2, 4 and 8
+worker processes. The field after the run must be identical to the
+single-process one. `batch ms` is the fixed cost of one `run` call (a
+one-step batch: dispatch, field load and store), paid once per batch on
+top of the per-step cost.
+
+Each step costs a barrier across processes, so there is no speedup
+unless every worker has its own core (the core count is printed first)
+and a slab's step costs well above the barrier. With fewer cores the
+extra workers only add overhead, and ratios below 1 are expected.
+
+Usage:
+    python -m benchmarks.decomposed_chamber [nx]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from core.decomposed import DecomposedChamber
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.vacuum_chamber import DiagnosticsPolicy
+
+DX = 0.1
+DT = 0.02
+N_STEPS = 200
+WORKERS = (1, 2, 4, 8)
+
+
+def _schedule(nx: int) -> FloquetCouplerSchedule:
+    x = np.linspace(0, nx * DX, nx)
+    x_center = (nx / 2.0) * DX
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=DX)
+    return FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=1.0, phi=np.pi / 2, dt=DT)
+
+
+def main() -> None:
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    schedule = _schedule(nx)
+    diagnostics = DiagnosticsPolicy.force_only()
+
+    single = LangevinVacuumChamber(nx, DX, DT, diagnostics=diagnostics)
+    single.seed_vacuum_noise()
+    single.run(2, schedule, c=1.0)
+    start = time.perf_counter()
+    single.run(N_STEPS, schedule, c=1.0)
+    t_single = (time.perf_counter() - start) / N_STEPS
+
+    print(f"nx = {nx}, {N_STEPS} steps, {os.cpu_count()} cores")
+    print(f"{'workers':>8} {'ms/step':>9} {'speedup':>8} {'batch ms':>9} {'identical':>10}")
+    print(f"{'single':>8} {t_single * 1e3:>9.2f} {1.0:>8.2f} {'-':>9} {'-':>10}")
+    for n_workers in WORKERS:
+        with DecomposedChamber(nx, DX, DT, n_workers=n_workers, diagnostics=diagnostics) as sim:
+            sim.seed_vacuum_noise()
+            sim.run(2, schedule, c=1.0)  # worker start-up
+            start = time.perf_counter()
+            sim.run(N_STEPS, schedule, c=1.0)
+            per_step = (time.perf_counter() - start) / N_STEPS
+            identical = np.array_equal(sim.phi, single.phi)
+            start = time.perf_counter()
+            sim.run(1, schedule, c=1.0)
+            per_batch = time.perf_counter() - start
+        print(
+            f"{n_workers:>8} {per_step * 1e3:>9.2f} {t_single / per_step:>8.2f} "
+            f"{per_batch * 1e3:>9.1f} {str(identical):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Periodic steady state of the 4D drive at T = 0, against brute force.
+
+Solves for the periodic state of the 4D Floquet chamber (T = 0) by
+Newton–Krylov shooting and estimates its Floquet multipliers, then runs
+200 cycles from a seeded vacuum field the way experiment 4D does and
+prints the mean force over each block of 20 cycles. If the largest
+multiplier is below one, the blocks shrink towards the shooting force.
+If it is above one there is no steady state to reach: the blocks follow
+the growing Floquet mode, whose complex multiplier pair makes them
+change sign instead of settling. A power iteration on the 4D grid gives
+|λ|max ≈ 1.007; the Arnoldi estimate printed here runs about 1% high.
+
+The same shooting is repeated at γ = 0.1 from a seeded (nonzero) guess,
+where the damping makes the Newton–Krylov iteration itself do the work.
+
+Usage:
+    python -m benchmarks.floquet_shooting
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.steady_state import solve_periodic_state
+from core.vacuum_chamber import DiagnosticsPolicy
+
+NX = 1000
+DX = 0.1
+C = 1.0
+PERIOD = 314  # steps per drive cycle; dt is set so the drive repeats exactly
+DT = 2 * np.pi / PERIOD
+CYCLES = 200
+BLOCK = 20
+
+
+def _chamber(gamma: float) -> LangevinVacuumChamber:
+    return LangevinVacuumChamber(
+        NX, DX, DT, gamma=gamma, diagnostics=DiagnosticsPolicy.force_only()
+    )
+
+
+def main() -> None:
+    x = np.arange(NX) * DX
+    x_center = (NX / 2.0) * DX
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=DX)
+    schedule = FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=1.0, phi=np.pi / 2, dt=DT)
+
+    start = time.perf_counter()
+    state = solve_periodic_state(
+        _chamber(0.001), schedule, period=PERIOD, dt=DT, c=C, n_multipliers=80
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Shooting (γ = 0.001): {state.periods} periods, {elapsed:.2f} s")
+    print(f"  cycle-averaged force {state.mean_force:.3e}, |λ|max ≈ {state.spectral_radius:.4f}")
+    print(f"  cycles for a transient to fall by 1e-3: {state.decay_cycles():.0f}")
+
+    sim = _chamber(0.001)
+    sim.seed_vacuum_noise()
+    start = time.perf_counter()
+    force = sim.run(CYCLES * PERIOD, schedule, c=C).mirror_force
+    elapsed = time.perf_counter() - start
+    print(f"Brute force: {CYCLES} cycles, {elapsed:.2f} s")
+    print(f"{'cycles':>10} {'mean force':>12}")
+    for first in range(0, CYCLES, BLOCK):
+        block = force[first * PERIOD : (first + BLOCK) * PERIOD]
+        print(f"{first:>4}-{first + BLOCK:<5} {np.mean(block):>12.3e}")
+
+    guess = np.concatenate((sim.phi, sim.phi_prev))
+    start = time.perf_counter()
+    damped = solve_periodic_state(
+        _chamber(0.1), schedule, period=PERIOD, dt=DT, c=C, guess=guess * 1e-3
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"Shooting (γ = 0.1, seeded guess): {damped.newton_iterations} Newton steps, "
+        f"{damped.periods} periods, {elapsed:.2f} s, residual {damped.residual:.1e}, "
+        f"max|φ| {np.max(np.abs(damped.phi)):.1e}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Full-grid vs compact-support back-reaction force evaluation.
+
+The Gaussian mirror only matters within ±6σ of its centre, so restricting
+the force reduction to that window makes it O(width) instead of O(nx).
+
+Usage:
+    python -m benchmarks.force_support
+"""
+
+from __future__ import annotations
+
+import time
+
+from core.schedules import GaussianMirrorSchedule
+from core.vacuum_chamber import VacuumChamber
+
+
+def main() -> None:
+    print(f"{'nx':>8} {'full (us)':>10} {'window (us)':>12} {'speedup':>9} {'cells':>7} {'rel diff':>9}")
+    for nx, n_evals in ((1_000, 20_000), (10_000, 5_000), (100_000, 1_000)):
+        sim = VacuumChamber(nx, 0.1)
+        sim.seed_vacuum_noise(seed=42)
+        centre = (nx / 2.0) * 0.1
+        schedule = GaussianMirrorSchedule(sim.x, height=50.0, width=5.0, position=lambda step: centre)
+        V = schedule.potential(0)
+        support = schedule.support(0)
+
+        start = time.perf_counter()
+        for _ in range(n_evals):
+            f_full = sim._mirror_force(V)
+        t_full = (time.perf_counter() - start) / n_evals
+
+        start = time.perf_counter()
+        for _ in range(n_evals):
+            f_window = sim._mirror_force(V, support)
+        t_window = (time.perf_counter() - start) / n_evals
+
+        rel = abs(f_window - f_full) / abs(f_full)
+        print(
+            f"{nx:>8} {t_full * 1e6:>10.2f} {t_window * 1e6:>12.2f} "
+            f"{t_full / t_window:>8.2f}x {support.stop - support.start:>7} {rel:>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
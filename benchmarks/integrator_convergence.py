@@ -0,0 +1,105 @@
+"""Error vs wall time: leapfrog against the fourth-order Yoshida composition.
+
+A smooth pulse starts at rest between the two Floquet couplers of
+experiment 4D (damped, T = 0). Each run integrates it to the same
+horizon, and two quantities are compared against a Yoshida run at a very
+small dt (the continuum-in-time limit of the same finite-difference
+grid):
+- the net impulse ∫F dt on the mirror (Simpson's rule);
+- the final field.
+Both integrators start from the same second-order-consistent state
+φ_prev = φ + dt²/2·F(φ), so the start-up does not hide the leapfrog's
+order.
+
+The last table picks, for each target impulse accuracy, the cheapest
+integrator/dt pair that meets it.
+
+Usage:
+    python -m benchmarks.integrator_convergence
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.vacuum_chamber import DiagnosticsPolicy
+
+NX = 1000
+DX = 0.1
+C = 1.0
+GAMMA = 0.001
+T_END = 40.0  # ~6 drive cycles; divisible by every dt below
+REFERENCE_DT = 0.00125
+STEPS = {
+    "leapfrog": (0.04, 0.02, 0.01, 0.005, 0.0025),
+    "yoshida4": (0.05, 0.04, 0.02, 0.01, 0.005),
+}
+TARGETS = (1e-2, 1e-4, 1e-6, 1e-8)
+
+
+def _simpson(values: np.ndarray, dt: float) -> float:
+    weights = np.ones(len(values))
+    weights[1:-1:2] = 4.0
+    weights[2:-1:2] = 2.0
+    return float(weights @ values) * dt / 3.0
+
+
+def _run(integrator: str, dt: float) -> Tuple[float, np.ndarray, float]:
+    """(net impulse, final field, wall time) for one integrator and dt."""
+    x = np.arange(NX) * DX
+    x_center = (NX / 2.0) * DX
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=DX)
+    schedule = FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=1.0, phi=np.pi / 2, dt=dt)
+
+    phi = np.exp(-((x - x_center) ** 2) / 2.0)
+    phi[0] = phi[-1] = 0.0
+    force = np.zeros(NX)
+    v = drive.potential(*schedule.coefficients(0))
+    force[1:-1] = C**2 * (phi[2:] - 2 * phi[1:-1] + phi[:-2]) / DX**2 - v[1:-1] * phi[1:-1]
+
+    sim = LangevinVacuumChamber(
+        NX, DX, dt, gamma=GAMMA, diagnostics=DiagnosticsPolicy.force_only(), integrator=integrator
+    )
+    sim.load_field(phi, phi + 0.5 * dt**2 * force)
+    # Forces are recorded at t = 0 .. T_END inclusive
+    n_steps = int(round(T_END / dt)) + 1
+    start = time.perf_counter()
+    mirror_force = sim.run(n_steps, schedule, c=C).mirror_force
+    elapsed = time.perf_counter() - start
+    return _simpson(mirror_force, dt), sim.phi_prev.copy(), elapsed
+
+
+def main() -> None:
+    ref_impulse, ref_field, _ = _run("yoshida4", REFERENCE_DT)
+    field_scale = np.max(np.abs(ref_field))
+    print(f"Net impulse over t = 0..{T_END:g}: {ref_impulse:.10e} (reference, dt = {REFERENCE_DT})")
+
+    results: Dict[Tuple[str, float], Tuple[float, float]] = {}
+    print(f"{'integrator':>10} {'dt':>7} {'time (s)':>9} {'impulse err':>12} {'field err':>10}")
+    for integrator, dts in STEPS.items():
+        for dt in dts:
+            impulse, field, elapsed = _run(integrator, dt)
+            impulse_error = abs(impulse - ref_impulse) / abs(ref_impulse)
+            field_error = np.max(np.abs(field - ref_field)) / field_scale
+            results[integrator, dt] = (impulse_error, elapsed)
+            print(f"{integrator:>10} {dt:>7} {elapsed:>9.3f} {impulse_error:>12.2e} {field_error:>10.2e}")
+
+    print()
+    print(f"{'target':>8} {'cheapest':>10} {'dt':>7} {'time (s)':>9}")
+    for target in TARGETS:
+        passing = [(t, key) for key, (err, t) in results.items() if err <= target]
+        if not passing:
+            print(f"{target:>8.0e} {'(none)':>10}")
+            continue
+        elapsed, (integrator, dt) = min(passing)
+        print(f"{target:>8.0e} {integrator:>10} {dt:>7} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
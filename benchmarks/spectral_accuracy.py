@@ -0,0 +1,77 @@
+"""Accuracy per unit cost: finite-difference leapfrog vs the spectral backend.
+
+A smooth pulse travels through the two-coupler Floquet drive of
+experiment 4D (damped, T = 0) for a fixed time. Each run starts from the
+same exact free-wave state, and the final field is compared against a
+spectral run at a very small dt (the continuum limit). The leapfrog error
+is dominated by grid dispersion and does not shrink with dt. The spectral
+error is second order in dt.
+
+Usage:
+    python -m benchmarks.spectral_accuracy
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.spectral import SineSpectralPropagator
+from core.vacuum_chamber import DiagnosticsPolicy
+
+NX = 1000
+DX = 0.1
+C = 1.0
+T_END = 60.0
+REFERENCE_DT = 0.0025
+
+
+def _initial_state(x: np.ndarray, dt: float) -> tuple[np.ndarray, np.ndarray]:
+    """A Gaussian pulse at rest, and its exact free-wave value one step back."""
+    phi = np.exp(-((x - 30.0) ** 2) / 2.0)
+    phi[0] = phi[-1] = 0.0
+    phi_prev = np.zeros_like(phi)
+    SineSpectralPropagator(NX - 2, DX).at_rest_previous(phi[1:-1], phi_prev[1:-1], dt=dt, c=C)
+    return phi, phi_prev
+
+
+def _run(backend: str, dt: float) -> tuple[np.ndarray, int, float]:
+    x = np.arange(NX) * DX
+    x_center = (NX / 2.0) * DX
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=DX)
+    schedule = FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=1.0, phi=np.pi / 2, dt=dt)
+
+    sim = LangevinVacuumChamber(
+        NX, DX, dt, gamma=0.001, diagnostics=DiagnosticsPolicy.force_only(), backend=backend
+    )
+    sim.load_field(*_initial_state(x, dt))
+    n_steps = int(round(T_END / dt))
+    start = time.perf_counter()
+    sim.run(n_steps, schedule, c=C)
+    return sim.phi.copy(), n_steps, time.perf_counter() - start
+
+
+def main() -> None:
+    reference, _, _ = _run("spectral", REFERENCE_DT)
+    scale = np.max(np.abs(reference))
+
+    print(f"{'backend':>9} {'dt':>6} {'steps':>7} {'time (s)':>9} {'max rel err':>12}")
+    for backend, dt in (
+        ("numpy", 0.005),
+        ("numpy", 0.02),
+        ("spectral", 0.02),
+        ("spectral", 0.05),
+        ("spectral", 0.1),
+        ("spectral", 0.2),
+    ):
+        phi, n_steps, elapsed = _run(backend, dt)
+        error = np.max(np.abs(phi - reference)) / scale
+        print(f"{backend:>9} {dt:>6} {n_steps:>7} {elapsed:>9.2f} {error:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
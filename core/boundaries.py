@@ -0,0 +1,194 @@
+"""Absorbing boundary layers for the chamber walls.
+
+The chamber's hard walls reflect all radiated wake back onto the mirror,
+so the only defense used to be a large grid. An `AbsorbingLayer` turns
+the `width` cells in front of each wall into a graded absorber, with
+σ(d) = σ_max·d^order at depth d (0 at the layer's inner edge, 1 at the
+wall), so outgoing waves leave the physical region. Two kinds:
+
+    "pml"     1-D perfectly matched layer in second-order form
+                  φ_tt + 2σφ_t + σ²φ = c²(φ_xx - ψ),   ψ_t = -σψ + σ'φ_x
+              (the coordinate stretch ∂x → ∂x / (1 + σ/∂t)). Reflectionless
+              in the continuum at every frequency; what reflects is grid error.
+    "sponge"  plain graded damping φ_tt + σφ_t = c²φ_xx. Cheaper, but it
+              reflects waves with ω ≲ σ, i.e. exactly the slow wake.
+
+The layer is applied as a correction to the update the stepping backend
+has just written into φ_next, so it composes with every backend:
+
+    φ_next ← (D·φ_next + h·φ_prev - dt²(σ²φ + c²ψ)) / (D + h)
+
+with h = σ·dt (pml) or σ·dt/2 (sponge) and D the backend's own leapfrog
+denominator. ψ is advanced explicitly, so the PML keeps c·dt/dx < 1
+even on the spectral backend; the sponge has no step limit. The layer
+cells are taken out of the physical region: a chamber of `nx` cells
+with a layer of `width` keeps `nx - 2·width` cells of free space.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+
+ABSORBER_KINDS = ("pml", "sponge")
+
+
+@dataclass(frozen=True)
+class AbsorbingLayer:
+    """Which absorber to put in front of each chamber wall.
+
+    `strength` is σ_max in inverse time units. By default it is chosen so
+    that a wave crossing the layer and back is attenuated (in the
+    continuum) to `reflection` of its amplitude.
+    """
+
+    width: int = 40
+    order: int = 3
+    kind: str = "pml"
+    strength: Optional[float] = None
+    reflection: float = 1e-6
+
+    def __post_init__(self) -> None:
+        if self.kind not in ABSORBER_KINDS:
+            raise ValueError(f"unknown absorber {self.kind!r}; expected one of {ABSORBER_KINDS}")
+        if self.width < 1:
+            raise ValueError("absorbing layer width must be at least one cell")
+        if not 0.0 < self.reflection < 1.0:
+            raise ValueError("target reflection must lie in (0, 1)")
+
+    def sigma_max(self, *, dx: float, c: float) -> float:
+        if self.strength is not None:
+            return self.strength
+        # Round trip: exp(-2∫σ/c) for the pml, exp(-∫σ/c) for the sponge
+        passes = 2.0 if self.kind == "pml" else 1.0
+        depth = (self.width + 0.5) * dx
+        return (self.order + 1) * c * np.log(1.0 / self.reflection) / (passes * depth)
+
+
+@dataclass
+class BoundaryAbsorber:
+    """Runtime state of an `AbsorbingLayer` on a chamber of `nx` cells.
+
+    Both layers are handled as one gathered set of `cells`. `psi` is the
+    PML auxiliary field on those cells; it is part of the chamber state.
+    """
+
+    layer: AbsorbingLayer
+    nx: int
+    dx: float
+
+    cells: np.ndarray = field(init=False, repr=False)
+    _stencil: np.ndarray = field(init=False, repr=False)
+    psi: np.ndarray = field(init=False, repr=False)
+    _depth: np.ndarray = field(init=False, repr=False)
+    # d(depth)/dx: -1/L on the left layer, +1/L on the right one
+    _depth_slope: np.ndarray = field(init=False, repr=False)
+
+    _key: Optional[Tuple[float, float, float]] = field(default=None, init=False, repr=False)
+    _keep: np.ndarray = field(init=False, repr=False)
+    _prev: np.ndarray = field(init=False, repr=False)
+    _mass: np.ndarray = field(init=False, repr=False)
+    _aux: np.ndarray = field(init=False, repr=False)
+    _decay: np.ndarray = field(init=False, repr=False)
+    _drive: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        width = self.layer.width
+        if 2 * width + 2 >= self.nx:
+            raise ValueError(f"absorbing layers of {width} cells do not fit in nx={self.nx}")
+        left = np.arange(1, width + 1)
+        right = np.arange(self.nx - 1 - width, self.nx - 1)
+        self.cells = np.concatenate((left, right))
+        self._stencil = np.concatenate((self.cells - 1, self.cells, self.cells + 1))
+
+        span = width + 0.5
+        self._depth = np.concatenate((span - left, right - (self.nx - 2 - width) - 0.5)) / span
+        slope = 1.0 / (span * self.dx)
+        self._depth_slope = np.concatenate((np.full(width, -slope), np.full(width, slope)))
+        self.psi = np.zeros(2 * width)
+
+    @property
+    def is_pml(self) -> bool:
+        return self.layer.kind == "pml"
+
+    def sigma(self, c: float) -> np.ndarray:
+        """σ on the layer cells."""
+        return self.layer.sigma_max(dx=self.dx, c=c) * self._depth**self.layer.order
+
+    def reset(self) -> None:
+        self.psi[:] = 0.0
+
+    def coefficients(self, *, dt: float, c: float, denom: float) -> Tuple[np.ndarray, ...]:
+        """(keep, prev, mass, aux, decay, drive) per layer cell for this (dt, c, D)."""
+        key = (dt, c, denom)
+        if key != self._key:
+            if self.is_pml and c * dt >= self.dx:
+                # ψ is driven by an explicit φ_x, which reintroduces the CFL limit
+                # even on the spectral backend
+                raise ValueError(
+                    f"the PML layer needs c·dt/dx < 1, got {c * dt / self.dx:.3g}; "
+                    "use kind='sponge' for larger steps"
+                )
+            sigma = self.sigma(c)
+            h = sigma * dt if self.is_pml else 0.5 * sigma * dt
+            scale = 1.0 / (denom + h)
+            self._keep = denom * scale
+            self._prev = h * scale
+            if self.is_pml:
+                self._mass = sigma**2 * dt**2 * scale
+                self._aux = np.full_like(sigma, c**2 * dt**2) * scale
+                # Exponential update of ψ_t = -σψ + σ'φ_x over one step, with
+                # φ_x averaged over its ends (second order, like the field update)
+                self._decay = np.exp(-sigma * dt)
+                d_sigma = (
+                    self.layer.sigma_max(dx=self.dx, c=c)
+                    * self.layer.order
+                    * self._depth ** (self.layer.order - 1)
+                    * self._depth_slope
+                )
+                self._drive = -np.expm1(-sigma * dt) / sigma * d_sigma / (4.0 * self.dx)
+            else:
+                self._mass = self._aux = self._drive = np.zeros_like(sigma)
+                self._decay = np.ones_like(sigma)
+            self._key = key
+        return self._keep, self._prev, self._mass, self._aux, self._decay, self._drive
+
+    def apply(
+        self,
+        phi: np.ndarray,
+        phi_prev: np.ndarray,
+        phi_next: np.ndarray,
+        *,
+        dt: float,
+        c: float,
+        denom: float = 1.0,
+    ) -> None:
+        """Correct `phi_next` on the layer cells and advance ψ."""
+        keep, prev, mass, aux, decay, drive = self.coefficients(dt=dt, c=c, denom=denom)
+        cells = self.cells
+        corrected = phi_next[cells] * keep
+        corrected += phi_prev[cells] * prev
+        if not self.is_pml:
+            phi_next[cells] = corrected
+            return
+
+        # (φ[i-1], φ[i], φ[i+1]) on the layer cells in one gather
+        lo, mid, hi = phi[self._stencil].reshape(3, -1)
+        corrected -= mid * mass
+        corrected -= self.psi * aux
+        phi_next[cells] = corrected
+
+        # Central φ_x at both ends of the step (1/2dx and the average are in `drive`)
+        next_lo, _, next_hi = phi_next[self._stencil].reshape(3, -1)
+        gradient = (hi - lo) + (next_hi - next_lo)
+        self.psi *= decay
+        self.psi += gradient * drive
+
+
+def make_absorber(kind: str = "none", width: int = 40) -> Optional[AbsorbingLayer]:
+    """An `AbsorbingLayer` of `kind` in front of each wall, or None for hard walls ("none")."""
+    if kind == "none":
+        return None
+    return AbsorbingLayer(width, kind=kind)
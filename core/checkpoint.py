@@ -0,0 +1,128 @@
+"""Checkpoint / resume for long chamber integrations.
+
+A checkpoint is one `.npz` file in the run's `FlightRecorder` folder. It
+holds the chamber state from `VacuumChamber.checkpoint_state` (fields,
+step index, noise generator position, telemetry series), the experiment's
+own progress arrays (force series so far, finished sweep points) and a
+JSON `meta` record (experiment, seed, config, sweep position). Files are
+replaced atomically, so a run killed mid-save keeps its last checkpoint.
+
+`lab.py --resume <run-id>` continues a run bit-exactly from its last
+checkpoint. `load_warm_start` reuses a checkpointed (e.g. pre-thermalized)
+field as the initial state of a new run.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import glob
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+import numpy as np
+
+from core.vacuum_chamber import VacuumChamber
+
+CHECKPOINT_FILENAME = "checkpoint.npz"
+
+_CHAMBER_PREFIX = "chamber."
+_ARRAYS_PREFIX = "arrays."
+_META_KEY = "meta"
+
+ConfigT = TypeVar("ConfigT")
+
+
+@dataclass
+class Checkpoint:
+    chamber: Dict[str, np.ndarray]
+    arrays: Dict[str, np.ndarray] = field(default_factory=dict)
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+def checkpoint_path(path: str) -> str:
+    """The checkpoint file for a run folder (or `path` itself if it is a file)."""
+    return os.path.join(path, CHECKPOINT_FILENAME) if os.path.isdir(path) else path
+
+
+def save_checkpoint(folder: str, checkpoint: Checkpoint) -> str:
+    path = os.path.join(folder, CHECKPOINT_FILENAME)
+    payload = {_META_KEY: np.array(json.dumps(checkpoint.meta))}
+    payload.update({_CHAMBER_PREFIX + k: v for k, v in checkpoint.chamber.items()})
+    payload.update({_ARRAYS_PREFIX + k: np.asarray(v) for k, v in checkpoint.arrays.items()})
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **payload)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """Load the checkpoint in a run folder or at an `.npz` path."""
+    checkpoint = Checkpoint(chamber={})
+    with np.load(checkpoint_path(path)) as data:
+        for key in data.files:
+            if key == _META_KEY:
+                checkpoint.meta = json.loads(str(data[key]))
+            elif key.startswith(_CHAMBER_PREFIX):
+                checkpoint.chamber[key[len(_CHAMBER_PREFIX) :]] = data[key]
+            elif key.startswith(_ARRAYS_PREFIX):
+                checkpoint.arrays[key[len(_ARRAYS_PREFIX) :]] = data[key]
+    return checkpoint
+
+
+def find_run_folder(run_id: str, base_dir: str = "mission_logs") -> str:
+    """The `FlightRecorder` folder of run `run_id` anywhere under `base_dir`."""
+    pattern = os.path.join(base_dir, "**", f"*_{run_id}")
+    matches = [p for p in glob.glob(pattern, recursive=True) if os.path.isdir(p)]
+    if not matches:
+        raise FileNotFoundError(f"no run folder for id {run_id!r} under {base_dir}")
+    if len(matches) > 1:
+        raise ValueError(f"run id {run_id!r} is ambiguous: {sorted(matches)}")
+    return matches[0]
+
+
+def load_warm_start(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(phi, phi_prev) of a checkpoint, to seed a new run with a settled field."""
+    chamber = load_checkpoint(path).chamber
+    if "phi" not in chamber:
+        raise ValueError(f"checkpoint {checkpoint_path(path)} was taken between sweep points and has no field")
+    return chamber["phi"], chamber["phi_prev"]
+
+
+def config_from_meta(config_cls: Type[ConfigT], meta: Dict[str, Any]) -> ConfigT:
+    """Rebuild the frozen config dataclass recorded by `RunCheckpointer`."""
+    values = {k: tuple(v) if isinstance(v, list) else v for k, v in meta["config"].items()}
+    return config_cls(**values)
+
+
+@dataclass
+class RunCheckpointer:
+    """Writes the checkpoint of one experiment run into its run folder.
+
+    `meta` identifies the run (experiment, seed, config) so that
+    `lab.py --resume` can rebuild it; `save` adds the sweep position.
+    Between sweep points there is no chamber to save: `sim` is then None
+    and the checkpoint holds only the progress arrays.
+    """
+
+    folder: str
+    experiment: str
+    seed: int
+    config: Any
+
+    def save(
+        self,
+        sim: Optional[VacuumChamber],
+        arrays: Optional[Dict[str, np.ndarray]] = None,
+        **progress: Any,
+    ) -> str:
+        meta = {
+            "experiment": self.experiment,
+            "seed": self.seed,
+            "config": dataclasses.asdict(self.config),
+            **progress,
+        }
+        return save_checkpoint(self.folder, Checkpoint({} if sim is None else sim.checkpoint_state(), arrays or {}, meta))
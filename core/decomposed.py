@@ -0,0 +1,646 @@
+"""Domain-decomposed chamber for very large grids.
+
+`DecomposedChamber` integrates the damped leapfrog of
+`LangevinVacuumChamber` (γ = 0 is the plain `VacuumChamber` update) with
+the 1-D grid split into contiguous slabs, one per worker process. Each
+worker keeps its slab in private arrays with one ghost cell on each side.
+After every step it publishes its two edge cells into a halo table in
+`multiprocessing.shared_memory`, waits on a barrier, and reads its
+neighbours' edges into its ghost cells. The table is double-buffered by
+step parity, so a step needs one barrier.
+
+Workers run a whole `run` batch on their own and keep per-step partial
+force and energy sums, which the parent adds up in slab order when the
+batch returns. Between batches the field lives in a shared (phi_prev,
+phi) array, so loading and reading the field never pickles grid-sized
+arrays. Nor does the drive: for a separable schedule the parent sends
+each worker the batch's coefficient table and its slab's share of the
+support window, ghosts included. Any other schedule is pickled to the
+workers only when it differs from the one they already hold.
+
+Every step costs a barrier across processes (tens of microseconds), so
+slabs only pay off when a slab's step costs well above that and every
+worker has a core of its own. With fewer cores than workers, or on
+small grids, the decomposed chamber is slower than one process; see
+`benchmarks/decomposed_chamber.py`.
+
+Every cell is updated by the same operations as in the single-process
+chamber. At T = 0 the field therefore matches the "numpy" backend
+bit-for-bit, and the force and energy sums agree to rounding. At T > 0
+each slab draws from its own `NoiseStream`, spawned from `noise_seed`.
+A run is then reproducible for a given `n_workers`, but the noise
+realization changes with it. The walls are hard; absorbing layers and
+the "spectral" backend (a global transform) are not available here.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import threading
+import traceback
+import weakref
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from core import kernels
+from core.noise import SeedLike, make_noise_stream, spawn_seeds
+from core.vacuum_chamber import ChamberTelemetry, DiagnosticsPolicy, PotentialSchedule, field_dtype
+
+
+def _clip(lo: int, hi: int, bounds: Tuple[int, int]) -> Tuple[int, int]:
+    lo, hi = max(lo, bounds[0]), min(hi, bounds[1])
+    return lo, max(lo, hi)
+
+
+@dataclass(frozen=True)
+class Slab:
+    """Interior cells `[lo, hi)` of an `nx`-cell grid, integrated by worker `index`."""
+
+    index: int
+    lo: int
+    hi: int
+    nx: int
+
+    @property
+    def first(self) -> bool:
+        return self.lo == 1
+
+    @property
+    def last(self) -> bool:
+        return self.hi == self.nx - 1
+
+    @property
+    def offset(self) -> int:
+        """Global index of the slab's local cell 0 (its left ghost)."""
+        return self.lo - 1
+
+    @property
+    def n_local(self) -> int:
+        """Cells held by the worker, ghosts included."""
+        return self.hi - self.lo + 2
+
+    @property
+    def owned(self) -> Tuple[int, int]:
+        """Global cells this slab sums reductions over; the walls belong to the end slabs."""
+        return (0 if self.first else self.lo, self.nx if self.last else self.hi)
+
+    @property
+    def owned_local(self) -> Tuple[int, int]:
+        lo, hi = self.owned
+        return lo - self.offset, hi - self.offset
+
+    def local(self, window: Optional[slice]) -> Tuple[int, int]:
+        """A global cell window as a local `[lo, hi)`, clipped to the slab and its ghosts."""
+        if window is None:
+            return 0, self.n_local
+        lo, hi, _ = window.indices(self.nx)
+        return _clip(lo - self.offset, hi - self.offset, (0, self.n_local))
+
+
+def split_grid(nx: int, n_workers: int) -> List[Slab]:
+    """Split the `nx - 2` interior cells into `n_workers` near-equal slabs."""
+    n_interior = nx - 2
+    if not 1 <= n_workers <= n_interior:
+        raise ValueError(f"cannot split {n_interior} interior cells across {n_workers} workers")
+    bounds = 1 + (n_interior * np.arange(n_workers + 1)) // n_workers
+    return [Slab(w, int(bounds[w]), int(bounds[w + 1]), nx) for w in range(n_workers)]
+
+
+def _gradient_into(
+    f: np.ndarray, out: np.ndarray, dx: float, lo: int, hi: int
+) -> np.ndarray:
+    """`VacuumChamber._gradient_into` on a local slab array: central differences
+    on `[lo, hi)`, one-sided only where the range reaches the array ends."""
+    n = len(f)
+    a, b = max(lo, 1), min(hi, n - 1)
+    if a < b:
+        np.subtract(f[a + 1 : b + 1], f[a - 1 : b - 1], out=out[a:b])
+        np.divide(out[a:b], 2.0 * dx, out=out[a:b])
+    if lo == 0:
+        out[0] = (f[1] - f[0]) / dx
+    if hi == n:
+        out[-1] = (f[-1] - f[-2]) / dx
+    return out
+
+
+@dataclass(frozen=True)
+class _SlabDrive:
+    """A separable drive cut to one slab: `V = coefficients[k] @ profiles` on local `[w_lo, w_hi)`.
+
+    `grads` covers the owned part `[f_lo, f_hi)` of the window, where the
+    slab sums its share of the force.
+    """
+
+    coefficients: np.ndarray  # (n_steps, n_profiles)
+    w_lo: int
+    w_hi: int
+    profiles: np.ndarray
+    f_lo: int
+    f_hi: int
+    grads: np.ndarray
+
+
+@dataclass(frozen=True)
+class _WorkerSpec:
+    slab: Slab
+    n_workers: int
+    dx: float
+    dt: float
+    gamma: float
+    noise_scale: float
+    noise_seed: Optional[np.random.SeedSequence]
+    backend: str
+    dtype: np.dtype
+    diagnostics: DiagnosticsPolicy
+    field_name: str
+    halo_name: str
+
+
+class _SlabWorker:
+    """Worker-side state: the slab's three field buffers and its halo slots."""
+
+    def __init__(self, spec: _WorkerSpec, barrier: Any):
+        self.spec = spec
+        self.slab = spec.slab
+        self.barrier = barrier
+        self._field_shm = SharedMemory(spec.field_name)
+        self._halo_shm = SharedMemory(spec.halo_name)
+        nx = self.slab.nx
+        self.field = np.ndarray((2, nx), dtype=spec.dtype, buffer=self._field_shm.buf)
+        self.halo = np.ndarray((2, spec.n_workers, 2), dtype=spec.dtype, buffer=self._halo_shm.buf)
+
+        m = self.slab.n_local
+        self.phi = np.zeros(m, dtype=spec.dtype)
+        self.phi_prev = np.zeros(m, dtype=spec.dtype)
+        self.phi_next = np.zeros(m, dtype=spec.dtype)
+        self._scratch_a = np.empty(m, dtype=spec.dtype)
+        self._scratch_b = np.empty(m, dtype=spec.dtype)
+        self._v = np.zeros(m)
+        self.noise = make_noise_stream(m - 2, spec.noise_scale, spec.noise_seed)
+
+        # φ_next(1 + γdt/2) = 2φ - φ_prev(1 - γdt/2) + dt²·Forces
+        self._dt_sq = spec.dt**2
+        self._prev_coeff = 1.0 - (spec.gamma * spec.dt / 2.0)
+        self._denom = 1.0 + (spec.gamma * spec.dt / 2.0)
+
+        self._owned = self.slab.owned_local
+        self.schedule: Optional[PotentialSchedule] = None
+
+    def detach(self) -> None:
+        del self.field, self.halo
+        self._field_shm.close()
+        self._halo_shm.close()
+
+    def _load(self) -> None:
+        cells = slice(self.slab.offset, self.slab.offset + self.slab.n_local)
+        self.phi_prev[:] = self.field[0, cells]
+        self.phi[:] = self.field[1, cells]
+
+    def _store(self) -> None:
+        lo, hi = self.slab.owned
+        local = slice(*self._owned)
+        self.field[0, lo:hi] = self.phi_prev[local]
+        self.field[1, lo:hi] = self.phi[local]
+
+    def _update(self, *, c: float, v: np.ndarray, v_lo: int, v_hi: int) -> None:
+        """`LangevinVacuumChamber._update_field` on the slab, interaction on `[v_lo, v_hi)`."""
+        phi = self.phi
+        out = self._scratch_a
+        forces = out[1:-1]
+        np.multiply(phi[1:-1], 2, out=forces)
+        np.subtract(phi[2:], forces, out=forces)
+        np.add(forces, phi[:-2], out=forces)
+        np.divide(forces, self.spec.dx**2, out=forces)
+        np.multiply(forces, c**2, out=forces)
+        if v_lo < v_hi:
+            tmp = np.multiply(v[v_lo:v_hi], phi[v_lo:v_hi], out=self._scratch_b[v_lo:v_hi])
+            np.subtract(out[v_lo:v_hi], tmp, out=out[v_lo:v_hi])
+
+        if self.noise is not None:
+            np.add(forces, self.noise.next(), out=forces)
+        np.multiply(forces, self._dt_sq, out=forces)
+
+        inner = self.phi_next[1:-1]
+        damped_prev = self._scratch_b[1:-1]
+        np.multiply(phi[1:-1], 2.0, out=inner)
+        np.multiply(self.phi_prev[1:-1], self._prev_coeff, out=damped_prev)
+        np.subtract(inner, damped_prev, out=inner)
+        np.add(inner, forces, out=inner)
+        np.divide(inner, self._denom, out=inner)
+
+        # Walls on the end slabs; interior ghosts are filled by the halo exchange
+        self.phi_next[0] = 0.0
+        self.phi_next[-1] = 0.0
+
+    def _force(self, v: np.ndarray, grad_v: Optional[np.ndarray], lo: int, hi: int) -> float:
+        """Partial `-∫φ²∂V/∂x` over local cells `[lo, hi)`."""
+        if lo >= hi:
+            return 0.0
+        if grad_v is None:
+            grad_v = _gradient_into(v, self._scratch_b, self.spec.dx, lo, hi)
+        phi = self.phi[lo:hi]
+        weighted = np.multiply(phi, phi, out=self._scratch_a[lo:hi])
+        np.multiply(weighted, grad_v[lo:hi], out=weighted)
+        return -float(np.sum(weighted, dtype=np.float64) * self.spec.dx)
+
+    def _energy(self, *, c: float, v: np.ndarray) -> float:
+        """Partial field energy over the owned cells (`VacuumChamber._field_energy`)."""
+        lo, hi = self._owned
+        dphi_dt = self._scratch_a[lo:hi]
+        np.subtract(self.phi_next[lo:hi], self.phi_prev[lo:hi], out=dphi_dt)
+        np.divide(dphi_dt, 2 * self.spec.dt, out=dphi_dt)
+        np.multiply(dphi_dt, dphi_dt, out=dphi_dt)
+
+        dphi_dx = _gradient_into(self.phi, self._scratch_b, self.spec.dx, lo, hi)[lo:hi]
+        np.multiply(dphi_dx, dphi_dx, out=dphi_dx)
+        np.multiply(dphi_dx, c**2, out=dphi_dx)
+        np.add(dphi_dt, dphi_dx, out=dphi_dt)
+
+        np.multiply(self.phi[lo:hi], self.phi[lo:hi], out=dphi_dx)
+        np.multiply(v[lo:hi], dphi_dx, out=dphi_dx)
+        np.add(dphi_dt, dphi_dx, out=dphi_dt)
+        return 0.5 * float(np.sum(dphi_dt, dtype=np.float64) * self.spec.dx)
+
+    def _exchange_halos(self, parity: int) -> None:
+        slot = self.halo[parity]
+        w = self.slab.index
+        slot[w, 0] = self.phi_next[1]
+        slot[w, 1] = self.phi_next[-2]
+        self.barrier.wait()
+        if not self.slab.first:
+            self.phi_next[0] = slot[w - 1, 1]
+        if not self.slab.last:
+            self.phi_next[-1] = slot[w + 1, 0]
+
+    def run(
+        self, drive: Optional[_SlabDrive], start: int, n_steps: int, c: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Advance the slab `n_steps` steps; returns its partial (force, energy) series.
+
+        The potential is `drive` if given, else the worker's `schedule`.
+        """
+        spec, slab = self.spec, self.slab
+        offset, m = slab.offset, slab.n_local
+        interior = (1, m - 1)
+        cells = slice(offset, offset + m)
+
+        schedule = self.schedule
+        if drive is not None:
+            w_lo, w_hi, f_lo, f_hi = drive.w_lo, drive.w_hi, drive.f_lo, drive.f_hi
+            v_lo, v_hi = _clip(w_lo, w_hi, interior)
+            self._v[:] = 0.0
+        else:
+            support = getattr(schedule, "support", None)
+            with_gradient = getattr(schedule, "potential_and_gradient", None)
+
+        fused = spec.backend == "numba"
+        force = np.empty(n_steps)
+        energy = np.empty(len(spec.diagnostics.energy_steps(start, n_steps)))
+        n_energy = 0
+
+        self._load()
+        for k in range(n_steps):
+            step = start + k
+            grad_v = None
+            if drive is not None:
+                g = drive.coefficients[k]
+                v = self._v
+                np.dot(g, drive.profiles, out=v[w_lo:w_hi])
+                phi_sq = np.multiply(self.phi[f_lo:f_hi], self.phi[f_lo:f_hi], out=self._scratch_a[f_lo:f_hi])
+                force[k] = -float(g @ (drive.grads @ phi_sq)) * spec.dx
+                force_lo = force_hi = 0
+            else:
+                if with_gradient is not None:
+                    v_full, grad_full = with_gradient(step)
+                    grad_v = grad_full[cells]
+                else:
+                    v_full = schedule.potential(step)
+                v = v_full[cells]
+                v_lo, v_hi = interior
+                window = support(step) if support is not None else None
+                force_lo, force_hi = _clip(*slab.local(window), self._owned)
+
+            if fused:
+                force_k, _ = kernels.fused_step(
+                    self.phi,
+                    self.phi_prev,
+                    self.phi_next,
+                    v,
+                    kernels.NO_GRADIENT if grad_v is None else grad_v,
+                    self.noise.next() if self.noise is not None else kernels.NO_NOISE,
+                    spec.dx,
+                    spec.dt,
+                    c,
+                    self._prev_coeff,
+                    self._denom,
+                    force_lo,
+                    force_hi,
+                    False,
+                )
+            else:
+                self._update(c=c, v=v, v_lo=v_lo, v_hi=v_hi)
+                force_k = self._force(v, grad_v, force_lo, force_hi)
+            if drive is None:
+                force[k] = force_k
+            if spec.diagnostics.samples_energy(step):
+                energy[n_energy] = self._energy(c=c, v=v)
+                n_energy += 1
+
+            self._exchange_halos(step % 2)
+            self.phi_prev, self.phi, self.phi_next = self.phi, self.phi_next, self.phi_prev
+        self._store()
+        return force, energy
+
+
+def _serve(conn: Any, spec: _WorkerSpec, barrier: Any) -> None:
+    """Worker process loop: run batches until told to close."""
+    worker = _SlabWorker(spec, barrier)
+    try:
+        while True:
+            command = pickle.loads(conn.recv_bytes())
+            if command[0] == "close":
+                break
+            _, drive, schedule, start, n_steps, c = command
+            try:
+                if schedule is not None:  # a new schedule, pickled by the parent
+                    worker.schedule = pickle.loads(schedule)
+                conn.send(("ok", *worker.run(drive, start, n_steps, c)))
+            except Exception as exc:
+                # Release the other slabs from the step barrier
+                barrier.abort()
+                broken = isinstance(exc, threading.BrokenBarrierError)
+                conn.send(("error", broken, traceback.format_exc()))
+    finally:
+        worker.detach()
+        conn.close()
+
+
+def _shutdown(processes: List[Any], conns: List[Any], blocks: List[SharedMemory]) -> None:
+    for conn in conns:
+        try:
+            conn.send_bytes(pickle.dumps(("close",)))
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5.0)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    for conn in conns:
+        conn.close()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class DecomposedChamber:
+    """Langevin chamber integrated by `n_workers` processes over shared memory.
+
+    Mirrors the `LangevinVacuumChamber` API for batched runs: `load_field`,
+    `seed_vacuum_noise`, `run` (returning `ChamberTelemetry`), `phi` and
+    `phi_prev` (copies of the shared field) and `step_index`. There is no
+    per-step `step`; a batch is the unit of work, so drive it through
+    `run`. Worker processes live until `close` (or the end of a `with`
+    block).
+    """
+
+    def __init__(
+        self,
+        nx: int,
+        dx: float,
+        dt: float,
+        *,
+        n_workers: int,
+        gamma: float = 0.001,
+        temperature: float = 0.0,
+        diagnostics: DiagnosticsPolicy = DiagnosticsPolicy(),
+        noise_seed: SeedLike = None,
+        backend: str = "numpy",
+        dtype: DTypeLike = np.float64,
+    ):
+        self.nx = nx
+        self.dx = dx
+        self.dt = dt
+        self.gamma = gamma
+        self.temp = temperature
+        self.diagnostics = diagnostics
+        self.backend = kernels.resolve_backend(backend)
+        if self.backend == "spectral":
+            raise ValueError("the spectral backend needs the whole grid; use numpy or numba slabs")
+        self.dtype = field_dtype(dtype)
+        self.slabs = split_grid(nx, n_workers)
+        self.x = np.linspace(0, nx * dx, nx)
+        self.step_index = 0
+
+        if self.temp > 0 and self.gamma > 0:
+            noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
+        else:
+            noise_scale = 0.0
+        noise_seeds = spawn_seeds(noise_seed, n_workers) if noise_scale > 0 else [None] * n_workers
+
+        field_block = SharedMemory(create=True, size=2 * nx * self.dtype.itemsize)
+        halo_block = SharedMemory(create=True, size=4 * n_workers * self.dtype.itemsize)
+        self._field = np.ndarray((2, nx), dtype=self.dtype, buffer=field_block.buf)
+        self._field[:] = 0.0
+
+        context = multiprocessing.get_context()
+        self._barrier = context.Barrier(n_workers)
+        self._conns = []
+        self._processes = []
+        self._schedule_sent: Optional[bytes] = None
+        for slab, seed in zip(self.slabs, noise_seeds):
+            spec = _WorkerSpec(
+                slab=slab,
+                n_workers=n_workers,
+                dx=dx,
+                dt=dt,
+                gamma=gamma,
+                noise_scale=noise_scale,
+                noise_seed=seed,
+                backend=self.backend,
+                dtype=self.dtype,
+                diagnostics=diagnostics,
+                field_name=field_block.name,
+                halo_name=halo_block.name,
+            )
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_serve, args=(child_end, spec, self._barrier), name=f"slab-{slab.index}", daemon=True
+            )
+            process.start()
+            child_end.close()
+            self._conns.append(parent_end)
+            self._processes.append(process)
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._processes, self._conns, [field_block, halo_block]
+        )
+
+    @property
+    def n_workers(self) -> int:
+        return len(self.slabs)
+
+    @property
+    def phi(self) -> np.ndarray:
+        return self._field[1].copy()
+
+    @property
+    def phi_prev(self) -> np.ndarray:
+        return self._field[0].copy()
+
+    def load_field(self, phi: np.ndarray, phi_prev: Optional[np.ndarray] = None) -> None:
+        """Set the current field (and previous, default: at rest) in the chamber dtype."""
+        self._field[1] = phi
+        self._field[0] = phi if phi_prev is None else phi_prev
+
+    def seed_vacuum_noise(self, *, seed: int = 42, sigma: float = 0.001) -> None:
+        rng = np.random.default_rng(seed)
+        self.load_field(rng.normal(0.0, sigma, self.nx))
+
+    def run(
+        self,
+        n_steps: int,
+        potential_schedule: PotentialSchedule,
+        *,
+        c: float,
+        dt: Optional[float] = None,
+    ) -> ChamberTelemetry:
+        """Advance `n_steps` timesteps on all slabs; see `VacuumChamber.run`.
+
+        A separable schedule (one with `separable_potential`) is evaluated
+        here and sent as per-slab windows. Any other schedule must be
+        picklable; each worker evaluates it for its own slab, so schedules
+        that only touch their support window cost O(window) per worker and
+        step. If a worker fails or dies, the chamber is closed and a
+        RuntimeError raised.
+        """
+        if not self._finalizer.alive:
+            raise RuntimeError("DecomposedChamber is closed")
+        if dt is not None and dt != self.dt:
+            raise ValueError(f"DecomposedChamber integrates at dt={self.dt}, got dt={dt}")
+        start = self.step_index
+        separable = getattr(potential_schedule, "separable_potential", None)
+        if separable is not None:
+            drives = self._slab_drives(potential_schedule, separable, start, n_steps)
+            commands = [pickle.dumps(("run", drive, None, start, n_steps, c)) for drive in drives]
+        else:
+            schedule = pickle.dumps(potential_schedule)
+            if schedule == self._schedule_sent:
+                schedule = None
+            else:
+                self._schedule_sent = schedule
+            commands = [pickle.dumps(("run", None, schedule, start, n_steps, c))] * self.n_workers
+        replies = self._dispatch(commands)
+
+        force = np.zeros(n_steps)
+        energy_step = self.diagnostics.energy_steps(start, n_steps)
+        energy = np.zeros(len(energy_step))
+        for _, slab_force, slab_energy in replies:
+            force += slab_force
+            energy += slab_energy
+        self.step_index += n_steps
+
+        mirror_position = getattr(potential_schedule, "mirror_position", None)
+        positions = None
+        if mirror_position is not None:
+            positions = np.array([mirror_position(start + k) for k in range(n_steps)], dtype=float)
+        return ChamberTelemetry(
+            dt=self.dt,
+            mirror_force=force,
+            total_energy_field=energy,
+            energy_step=energy_step,
+            mirror_pos=positions,
+        )
+
+    def _slab_drives(
+        self, schedule: Any, separable: Any, start: int, n_steps: int
+    ) -> List[_SlabDrive]:
+        """The batch's coefficients and each slab's share of the support window."""
+        coefficient_table = getattr(schedule, "coefficient_table", None)
+        if coefficient_table is not None:
+            rows = coefficient_table(start, n_steps)
+        else:
+            rows = [schedule.coefficients(start + k) for k in range(n_steps)]
+        coefficients = np.array([separable.coefficients(*row) for row in rows], dtype=float)
+        coefficients = coefficients.reshape(n_steps, separable.n_profiles)
+
+        drives = []
+        for slab in self.slabs:
+            w_lo, w_hi = slab.local(separable.support())
+            f_lo, f_hi = _clip(w_lo, w_hi, slab.owned_local)
+            offset = slab.offset
+            drives.append(
+                _SlabDrive(
+                    coefficients=coefficients,
+                    w_lo=w_lo,
+                    w_hi=w_hi,
+                    profiles=np.ascontiguousarray(separable.profiles[:, w_lo + offset : w_hi + offset]),
+                    f_lo=f_lo,
+                    f_hi=f_hi,
+                    grads=np.ascontiguousarray(separable.grads[:, f_lo + offset : f_hi + offset]),
+                )
+            )
+        return drives
+
+    def _dispatch(self, commands: List[bytes]) -> List[Any]:
+        """Send each worker its command and return the replies in slab order.
+
+        Replies are awaited together with the worker processes, so a
+        worker that dies mid-batch (killed, out of memory) is noticed: the
+        step barrier is aborted to release the others, the chamber is
+        closed and a RuntimeError raised. So is a worker's exception.
+        """
+        lost = []
+        pending = {}
+        for index, (conn, command) in enumerate(zip(self._conns, commands)):
+            try:
+                conn.send_bytes(command)
+            except OSError:  # BrokenPipeError: the worker is gone
+                lost.append(index)
+            else:
+                pending[conn] = index
+        if lost:
+            self._barrier.abort()
+
+        replies = {}
+        while pending:
+            sentinels = {self._processes[index].sentinel: conn for conn, index in pending.items()}
+            for ready in wait([*pending, *sentinels]):
+                conn = sentinels.get(ready, ready)
+                if conn not in pending:
+                    continue
+                index = pending.pop(conn)
+                try:
+                    replies[index] = conn.recv()
+                except (EOFError, OSError):
+                    lost.append(index)
+                    self._barrier.abort()
+
+        if lost:
+            self.close()
+            exits = ", ".join(
+                f"slab-{index} (exit code {self._processes[index].exitcode})" for index in sorted(lost)
+            )
+            raise RuntimeError(f"slab worker died: {exits}")
+        failures = [reply for reply in replies.values() if reply[0] == "error"]
+        if failures:
+            # The step barrier is broken; the chamber cannot continue
+            cause = next((f for f in failures if not f[1]), failures[0])
+            self.close()
+            raise RuntimeError(f"slab worker failed:\n{cause[2]}")
+        return [replies[index] for index in range(self.n_workers)]
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        self._finalizer()
+
+    def __enter__(self) -> "DecomposedChamber":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
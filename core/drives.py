@@ -0,0 +1,89 @@
+"""Precomputed drive trajectories for the time-domain experiments.
+
+Every drive in the experiments (sawtooth mirror displacement, grip/slip
+coupling, Floquet coupler phases) is fully determined by the config
+before a run starts. The builders here evaluate the whole trajectory as
+one vectorized NumPy expression instead of one scalar call per step.
+
+Builders take only scalar arguments and are memoized, so repeated runs of
+the same config (sub-runs, temperature sweeps, seeds) share one array.
+Returned arrays are read-only for that reason.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+_CACHE_SIZE = 32
+
+
+def _frozen(a: np.ndarray) -> np.ndarray:
+    a.flags.writeable = False
+    return a
+
+
+def _smoothstep(progress: np.ndarray) -> np.ndarray:
+    # 3x^2 - 2x^3
+    return (3.0 * progress**2) - (2.0 * progress**3)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def sawtooth_displacement(
+    n_steps: int,
+    *,
+    amplitude: float,
+    start_time: int,
+    rise_time: int,
+    fall_time: int,
+) -> np.ndarray:
+    """Fast-out / slow-back displacement per step, with smooth corners.
+
+    Zero before `start_time`, rises to `amplitude` over `rise_time` steps,
+    falls back over `fall_time` steps and stays at zero afterwards.
+    """
+    t = np.arange(n_steps)
+    rise_end = start_time + rise_time
+    fall_end = rise_end + fall_time
+
+    displacement = np.zeros(n_steps)
+    rising = (t >= start_time) & (t < rise_end)
+    falling = (t >= rise_end) & (t < fall_end)
+    displacement[rising] = amplitude * _smoothstep((t[rising] - start_time) / rise_time)
+    displacement[falling] = amplitude * (1.0 - _smoothstep((t[falling] - rise_end) / fall_time))
+    return _frozen(displacement)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def grip_slip_coupling(
+    n_steps: int,
+    *,
+    start_time: int,
+    rise_time: int,
+    slip: float = 0.1,
+) -> np.ndarray:
+    """Mirror coupling per step: `slip` during the fast-out stroke, 1.0 (grip) otherwise."""
+    t = np.arange(n_steps)
+    coupling = np.ones(n_steps)
+    coupling[(t >= start_time) & (t < start_time + rise_time)] = slip
+    return _frozen(coupling)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def harmonic_phases(
+    start: int,
+    n_steps: int,
+    *,
+    dt: float,
+    omega: float,
+    phases: Tuple[float, ...] = (0.0,),
+) -> np.ndarray:
+    """`cos(Ω·t + phase_k)` for steps `start..start + n_steps`, shape `(n_steps, K)`.
+
+    t = step·dt as in the per-step loops, so drives built from this table
+    match their scalar counterparts.
+    """
+    t = np.arange(start, start + n_steps) * dt
+    return _frozen(np.cos(omega * t[:, None] + np.asarray(phases)))
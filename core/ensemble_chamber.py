@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from core.noise import EnsembleNoiseStream, SeedLike
+from core.potentials import SeparablePotential
+from core.vacuum_chamber import PotentialSchedule, field_dtype
+
+
+@dataclass
+class EnsembleTelemetry:
+    """Per-member force telemetry returned by `EnsembleLangevinChamber.run`.
+
+    `mirror_force[k, m]` is the back-reaction force on member `m` at step `k`.
+    """
+
+    dt: float
+    mirror_force: np.ndarray
+
+    @property
+    def n_steps(self) -> int:
+        return self.mirror_force.shape[0]
+
+    @property
+    def time(self) -> np.ndarray:
+        return np.arange(self.n_steps) * self.dt
+
+
+@dataclass
+class EnsembleLangevinChamber:
+    """Damped Langevin chamber that steps an ensemble of fields in one kernel.
+
+    Fields are stored as `(n_members, nx)` arrays and every member is advanced
+    by the same vectorized damped-Verlet update. Members differ in their
+    temperature (and therefore FDT noise scale), initial state and, through
+    a per-member potential, their drive. Each member draws its thermal
+    noise from its own stream spawned from `seed`, or seeded by `seed[m]`
+    when `seed` is a sequence of per-member `SeedSequence`s (so a member's
+    noise does not depend on its ensemble). `dtype` sets the field
+    precision as for `VacuumChamber`; forces accumulate in float64.
+
+    Equation: d²φ/dt² + γ∂φ/∂t - c²∂²φ/∂x² = -V(x,t)φ + ξ(t)
+    with FDT: σ_noise = sqrt(2γkT/dt)
+    """
+
+    n_members: int
+    nx: int
+    dx: float
+    dt: float
+    gamma: float
+    temperatures: np.ndarray
+    seed: Union[SeedLike, Sequence[np.random.SeedSequence]] = None
+    dtype: DTypeLike = np.float64
+
+    x: np.ndarray = field(init=False)
+    phi: np.ndarray = field(init=False)
+    phi_prev: np.ndarray = field(init=False)
+    phi_next: np.ndarray = field(init=False)
+    noise_scale: np.ndarray = field(init=False)
+    noise: Optional[EnsembleNoiseStream] = field(init=False, repr=False)
+
+    _scratch_a: np.ndarray = field(init=False, repr=False)
+    _scratch_b: np.ndarray = field(init=False, repr=False)
+    _window_v: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.temperatures = np.broadcast_to(
+            np.asarray(self.temperatures, dtype=float), (self.n_members,)
+        ).copy()
+
+        self.dtype = field_dtype(self.dtype)
+        shape = (self.n_members, self.nx)
+        self.x = np.arange(self.nx) * self.dx
+        self.phi = np.zeros(shape, dtype=self.dtype)
+        self.phi_prev = np.zeros(shape, dtype=self.dtype)
+        self.phi_next = np.zeros(shape, dtype=self.dtype)
+        self._scratch_a = np.empty(shape, dtype=self.dtype)
+        self._scratch_b = np.empty(shape, dtype=self.dtype)
+
+        # FDT noise scale per member (zero where T or γ vanish)
+        if self.gamma > 0:
+            temps = np.clip(self.temperatures, 0.0, None)
+            self.noise_scale = np.sqrt(2 * self.gamma * temps / self.dt)
+        else:
+            self.noise_scale = np.zeros(self.n_members)
+
+        self.noise = None
+        if np.any(self.noise_scale > 0):
+            if isinstance(self.seed, (list, tuple)):
+                self.noise = EnsembleNoiseStream(self.nx - 2, self.noise_scale, self.seed)
+            else:
+                self.noise = EnsembleNoiseStream.from_seed(self.nx - 2, self.noise_scale, self.seed)
+
+    def seed_members(self, seeds: Sequence[int], *, sigma: float = 0.001) -> None:
+        """Seed each member's vacuum state from its own RNG seed."""
+        if len(seeds) != self.n_members:
+            raise ValueError(f"expected {self.n_members} seeds, got {len(seeds)}")
+        for m, member_seed in enumerate(seeds):
+            self.phi[m] = np.random.default_rng(member_seed).normal(0, sigma, self.nx)
+        np.copyto(self.phi_prev, self.phi)
+
+    def _mirror_force(
+        self,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Per-member back-reaction force -∫ φ² ∂V/∂x dx, optionally over a `support` window."""
+        lo, hi = (0, self.nx) if support is None else support.indices(self.nx)[:2]
+        if grad_v is not None:
+            grad_v = grad_v[..., lo:hi]
+        else:
+            # One cell of padding gives the window edges their central differences
+            a, b = max(lo - 1, 0), min(hi + 1, self.nx)
+            grad_v = np.gradient(v_potential[..., a:b], self.dx, axis=-1)[..., lo - a : hi - a]
+        phi = self.phi[:, lo:hi]
+        phi_sq = np.multiply(phi, phi, out=self._scratch_b[:, lo:hi])
+        return -np.sum(phi_sq * grad_v, axis=-1, dtype=np.float64) * self.dx
+
+    def _wave_rhs(self, c: float) -> np.ndarray:
+        """c²∇²φ for the interior cells, written into (and returned as) `_scratch_a[:, 1:-1]`."""
+        phi = self.phi
+        forces = self._scratch_a[:, 1:-1]
+        np.multiply(phi[:, 1:-1], 2.0, out=forces)
+        np.subtract(phi[:, 2:], forces, out=forces)
+        np.add(forces, phi[:, :-2], out=forces)
+        np.multiply(forces, c**2 / self.dx**2, out=forces)
+        return forces
+
+    def _integrate(self, forces: np.ndarray) -> None:
+        """Add thermal noise to the interior `forces` and write the damped-Verlet update into `phi_next`."""
+        # Thermal noise (FDT-compliant, per-member amplitude)
+        if self.noise is not None:
+            np.add(forces, self.noise.next(), out=forces)
+
+        tmp = self._scratch_b[:, 1:-1]
+        half_gamma_dt = self.gamma * self.dt / 2.0
+        inner = self.phi_next[:, 1:-1]
+        np.multiply(forces, self.dt**2, out=inner)
+        np.multiply(self.phi_prev[:, 1:-1], 1.0 - half_gamma_dt, out=tmp)
+        np.subtract(inner, tmp, out=inner)
+        np.multiply(self.phi[:, 1:-1], 2.0, out=tmp)
+        np.add(inner, tmp, out=inner)
+        np.divide(inner, 1.0 + half_gamma_dt, out=inner)
+
+        # Boundary conditions
+        self.phi_next[:, 0] = 0.0
+        self.phi_next[:, -1] = 0.0
+
+    def _rotate_buffers(self) -> None:
+        self.phi_prev, self.phi, self.phi_next = self.phi, self.phi_next, self.phi_prev
+
+    def step(
+        self,
+        *,
+        c: float,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Advance every member one timestep and return the per-member force.
+
+        `v_potential` (and `grad_v`, its analytic gradient) is either
+        shared, shape `(nx,)`, or per member, shape `(n_members, nx)`.
+        `support` restricts the force reduction as in `VacuumChamber.step`.
+        """
+        forces = self._wave_rhs(c)
+
+        # Interaction
+        tmp = self._scratch_b[:, 1:-1]
+        np.multiply(v_potential[..., 1:-1], self.phi[:, 1:-1], out=tmp)
+        np.subtract(forces, tmp, out=forces)
+
+        self._integrate(forces)
+        force = self._mirror_force(v_potential, support, grad_v)
+        self._rotate_buffers()
+        return force
+
+    def step_separable(
+        self,
+        *,
+        c: float,
+        potential: SeparablePotential,
+        coefficients: np.ndarray,
+    ) -> np.ndarray:
+        """`step` for per-member potentials `V_m = Σ_k coefficients[m, k]·p_k`.
+
+        V is only formed on the potential's support window, as a
+        `(n_members, window)` product of the coefficients and the window
+        profiles, and the force comes from the moments Σφ²∂p_k there, so
+        no `(n_members, nx)` potential or gradient is built.
+        `coefficients` has shape `(n_members, n_profiles)` (or
+        `(n_profiles,)`, shared).
+        """
+        lo, hi = potential.support().indices(self.nx)[:2]
+        g = np.broadcast_to(np.asarray(coefficients, dtype=float), (self.n_members, potential.n_profiles))
+        forces = self._wave_rhs(c)
+
+        # Interaction, on the interior part of the support window only
+        a, b = max(lo, 1), min(hi, self.nx - 1)
+        if a < b:
+            window_v = self._window_buffer(b - a)
+            np.matmul(g, potential.window_profiles[:, a - lo : b - lo], out=window_v)
+            np.multiply(window_v, self.phi[:, a:b], out=window_v)
+            np.subtract(forces[:, a - 1 : b - 1], window_v, out=forces[:, a - 1 : b - 1])
+
+        self._integrate(forces)
+
+        # Back-reaction -dx·Σ_k g_k·Σφ²∂p_k over the support
+        phi = self.phi[:, lo:hi]
+        phi_sq = np.multiply(phi, phi, out=self._scratch_b[:, lo:hi])
+        moments = np.matmul(phi_sq, potential.window_grads.T)
+        force = -np.einsum("mk,mk->m", g, moments) * self.dx
+        self._rotate_buffers()
+        return force
+
+    def _window_buffer(self, width: int) -> np.ndarray:
+        if self._window_v is None or self._window_v.shape[1] != width:
+            self._window_v = np.empty((self.n_members, width), dtype=self.dtype)
+        return self._window_v
+
+    def run(self, n_steps: int, potential_schedule: PotentialSchedule, *, c: float) -> EnsembleTelemetry:
+        """Advance `n_steps` timesteps and return the `(n_steps, n_members)` force record."""
+        force = np.empty((n_steps, self.n_members))
+        support = getattr(potential_schedule, "support", None)
+        with_gradient = getattr(potential_schedule, "potential_and_gradient", None)
+        for k in range(n_steps):
+            if with_gradient is not None:
+                v_potential, grad_v = with_gradient(k)
+            else:
+                v_potential, grad_v = potential_schedule.potential(k), None
+            force[k] = self.step(
+                c=c,
+                v_potential=v_potential,
+                support=support(k) if support is not None else None,
+                grad_v=grad_v,
+            )
+        return EnsembleTelemetry(dt=self.dt, mirror_force=force)
@@ -0,0 +1,168 @@
+"""Optional fused stencil kernels for the chamber hot loop.
+
+The NumPy chamber step makes one pass over the grid per operation
+(Laplacian, interaction, update, potential gradient, force and energy
+reductions), so large grids are memory-bound. When Numba is installed,
+`fused_step` does the whole timestep in a single compiled loop. The
+arithmetic follows the NumPy path operation-for-operation; only the
+reductions are summed sequentially rather than pairwise, so telemetry
+agrees to floating-point tolerance rather than bit-for-bit.
+
+Backends are chosen by name at chamber construction (see
+`resolve_backend`).
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+BACKENDS = ("auto", "numpy", "numba", "spectral")
+HAVE_NUMBA = numba is not None
+
+# Passed in place of a noise row when a chamber draws no thermal kicks
+NO_NOISE = np.empty(0)
+# Passed in place of dV/dx when the kernel should difference V itself
+NO_GRADIENT = np.empty(0)
+
+
+def resolve_backend(name: str) -> str:
+    """Map a requested backend name to the concrete backend that will run.
+
+        "numpy"     the vectorized in-place kernel
+        "numba"     the fused kernel (ImportError if Numba is missing)
+        "auto"      "numba" when available, otherwise "numpy"
+        "spectral"  exact sine-series wave propagation with split-step
+                    potential/noise kicks (`core.spectral`); a different
+                    integrator, accurate at much larger dt
+
+    "auto" makes results depend on whether Numba is installed (to
+    floating-point tolerance), so experiment configs default to "numpy".
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend {name!r}; expected one of {BACKENDS}")
+    if name == "auto":
+        return "numba" if HAVE_NUMBA else "numpy"
+    if name == "numba" and not HAVE_NUMBA:
+        raise ImportError("backend='numba' requested but numba is not installed")
+    return name
+
+
+def _fused_step(
+    phi: np.ndarray,
+    phi_prev: np.ndarray,
+    phi_next: np.ndarray,
+    v_potential: np.ndarray,
+    grad_v: np.ndarray,
+    noise: np.ndarray,
+    dx: float,
+    dt: float,
+    c: float,
+    prev_coeff: float,
+    denom: float,
+    force_lo: int,
+    force_hi: int,
+    want_energy: bool,
+) -> Tuple[float, float]:
+    """One damped-leapfrog step plus force/energy telemetry in a single pass.
+
+    Writes `(2φ - φ_prev·prev_coeff + dt²(c²∇²φ - Vφ + ξ)) / denom` into
+    `phi_next` with hard walls, and returns (force, energy) for the current
+    field; energy is 0.0 unless `want_energy`. The force is summed over
+    cells `[force_lo, force_hi)` only, using `grad_v` when it is non-empty
+    and central differences of `v_potential` otherwise. With prev_coeff = denom = 1
+    and an empty `noise` this is the undamped leapfrog.
+    """
+    n = phi.shape[0]
+    dx_sq = dx**2
+    c_sq = c**2
+    dt_sq = dt**2
+    two_dx = 2.0 * dx
+    two_dt = 2 * dt
+    has_noise = noise.shape[0] > 0
+    has_grad = grad_v.shape[0] > 0
+
+    phi_next[0] = 0.0
+    phi_next[n - 1] = 0.0
+
+    # Reductions accumulate in float64 whatever the field precision
+    force_acc = 0.0
+
+    # Edge cells: one-sided gradients, wall values already in place
+    if force_lo == 0 and force_hi > 0:
+        dv = grad_v[0] if has_grad else (v_potential[1] - v_potential[0]) / dx
+        force_acc += phi[0] * phi[0] * dv
+    if force_hi == n and force_lo < n:
+        dv = grad_v[n - 1] if has_grad else (v_potential[n - 1] - v_potential[n - 2]) / dx
+        force_acc += phi[n - 1] * phi[n - 1] * dv
+
+    energy_acc = 0.0
+    if want_energy:
+        dphi_dt = (phi_next[0] - phi_prev[0]) / two_dt
+        dphi_dx = (phi[1] - phi[0]) / dx
+        energy_acc += dphi_dt * dphi_dt + dphi_dx * dphi_dx * c_sq + v_potential[0] * (phi[0] * phi[0])
+        dphi_dt = (phi_next[n - 1] - phi_prev[n - 1]) / two_dt
+        dphi_dx = (phi[n - 1] - phi[n - 2]) / dx
+        energy_acc += (
+            dphi_dt * dphi_dt + dphi_dx * dphi_dx * c_sq + v_potential[n - 1] * (phi[n - 1] * phi[n - 1])
+        )
+
+    for i in range(1, n - 1):
+        phi_i = phi[i]
+        rhs = (phi[i + 1] - phi_i * 2) + phi[i - 1]
+        rhs = rhs / dx_sq * c_sq - v_potential[i] * phi_i
+        if has_noise:
+            rhs += noise[i - 1]
+        inner = (phi_i * 2.0 - phi_prev[i] * prev_coeff) + rhs * dt_sq
+        phi_next[i] = inner / denom
+
+        phi_sq = phi_i * phi_i
+        if force_lo <= i < force_hi:
+            dv = grad_v[i] if has_grad else (v_potential[i + 1] - v_potential[i - 1]) / two_dx
+            force_acc += phi_sq * dv
+
+        if want_energy:
+            dphi_dt = (phi_next[i] - phi_prev[i]) / two_dt
+            dphi_dx = (phi[i + 1] - phi[i - 1]) / two_dx
+            energy_acc += dphi_dt * dphi_dt + dphi_dx * dphi_dx * c_sq + v_potential[i] * phi_sq
+
+    return -(force_acc * dx), 0.5 * (energy_acc * dx)
+
+
+def _absorb_layers(
+    phi: np.ndarray,
+    phi_prev: np.ndarray,
+    phi_next: np.ndarray,
+    cells: np.ndarray,
+    keep: np.ndarray,
+    prev: np.ndarray,
+    mass: np.ndarray,
+    aux: np.ndarray,
+    psi: np.ndarray,
+    decay: np.ndarray,
+    drive: np.ndarray,
+) -> None:
+    """`core.boundaries.BoundaryAbsorber.apply` as one compiled pass per phase."""
+    for j in range(cells.shape[0]):
+        i = cells[j]
+        phi_next[i] = (phi_next[i] * keep[j] + phi_prev[i] * prev[j]) - (
+            phi[i] * mass[j] + psi[j] * aux[j]
+        )
+    for j in range(cells.shape[0]):
+        i = cells[j]
+        gradient = (phi[i + 1] - phi[i - 1]) + (phi_next[i + 1] - phi_next[i - 1])
+        psi[j] = psi[j] * decay[j] + gradient * drive[j]
+
+
+if HAVE_NUMBA:
+    fused_step = numba.njit(cache=True, nogil=True)(_fused_step)
+    absorb_layers = numba.njit(cache=True, nogil=True)(_absorb_layers)
+else:  # pragma: no cover - optional dependency
+    fused_step = None
+    absorb_layers = None
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from core import kernels
+from core.boundaries import AbsorbingLayer
+from core.noise import SeedLike, make_noise_stream
+from core.stability import StabilityWatchdog
+from core.vacuum_chamber import (
+    ChamberTelemetry,
+    DiagnosticsPolicy,
+    PotentialSchedule,
+    VacuumChamber,
+)
+
+if TYPE_CHECKING:
+    from core.potentials import SeparablePotential
+
+
+class LangevinVacuumChamber(VacuumChamber):
+    """Damped wave equation with Fluctuation-Dissipation Theorem compliance.
+
+    Equation: d²φ/dt² + γ∂φ/∂t - c²∂²φ/∂x² = -V(x)φ + ξ(t)
+
+    where ξ(t) obeys FDT: σ_noise = sqrt(2γkT/dt) (k_B = 1 in simulation units).
+
+    The damped-Verlet coefficients are fixed by (γ, dt) and precomputed at
+    construction. Thermal kicks come from a block-generated `NoiseStream`
+    seeded by `noise_seed` (fresh OS entropy when None); at T=0 no noise
+    is drawn. `backend`, `dtype`, `absorber`, `integrator` and `watchdog`
+    are forwarded to `VacuumChamber`; the noise itself is always drawn in
+    float64, so a float32 chamber sees the same kicks as its float64 twin.
+
+    With `backend="spectral"` the damping is integrated exactly per sine
+    mode (`core.spectral`) instead of by the damped-Verlet coefficients,
+    and with `integrator="yoshida4"` it is split off exactly inside each
+    composed substep (`core.integrators`).
+    """
+
+    def __init__(
+        self,
+        nx: int,
+        dx: float,
+        dt: float,
+        gamma: float = 0.001,
+        temperature: float = 0.0,
+        diagnostics: DiagnosticsPolicy = DiagnosticsPolicy(),
+        noise_seed: SeedLike = None,
+        backend: str = "numpy",
+        dtype: DTypeLike = np.float64,
+        absorber: Optional[AbsorbingLayer] = None,
+        integrator: str = "leapfrog",
+        watchdog: Optional[StabilityWatchdog] = StabilityWatchdog(),
+    ):
+        super().__init__(nx, dx, diagnostics, backend, dtype, absorber, integrator, watchdog)
+        self.gamma = gamma
+        self.temp = temperature
+        self.dt = dt
+
+        if self.temp > 0 and self.gamma > 0:
+            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
+        else:
+            self.noise_scale = 0.0
+        # Kicks are only needed on interior cells; the walls are pinned to zero
+        self.noise = make_noise_stream(self.nx - 2, self.noise_scale, noise_seed)
+
+        # φ_next(1 + γdt/2) = 2φ - φ_prev(1 - γdt/2) + dt²·Forces
+        self._dt_sq = self.dt**2
+        self._prev_coeff = 1.0 - (self.gamma * self.dt / 2.0)
+        self._denom = 1.0 + (self.gamma * self.dt / 2.0)
+
+    def checkpoint_state(self) -> Dict[str, np.ndarray]:
+        state = super().checkpoint_state()
+        if self.noise is not None:
+            state["noise"] = np.array(json.dumps(self.noise.get_state()))
+        return state
+
+    def restore_state(self, state: Dict[str, np.ndarray]) -> None:
+        super().restore_state(state)
+        if self.noise is not None:
+            if "noise" not in state:
+                raise ValueError("checkpoint has no noise state for a T > 0 chamber")
+            self.noise.set_state(json.loads(str(state["noise"])))
+
+    def _thermal_kick(self) -> np.ndarray:
+        return self.noise.next() if self.noise is not None else kernels.NO_NOISE
+
+    def _update_field(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        v_window: Optional[slice] = None,
+    ) -> None:
+        """Write the damped-Verlet update into `phi_next` (dt is fixed at construction)."""
+        if self._spectral is not None:
+            self._update_field_spectral(
+                dt=dt,
+                c=c,
+                v_potential=v_potential,
+                v_window=v_window,
+                noise=self.noise.next() if self.noise is not None else None,
+                gamma=self.gamma,
+            )
+            return
+        if self._composer is not None:
+            self._update_field_composed(
+                dt=dt,
+                c=c,
+                noise=self.noise.next() if self.noise is not None else None,
+                gamma=self.gamma,
+            )
+            return
+
+        forces = self._wave_rhs_into(
+            c=c, v_potential=v_potential, out=self._scratch_a, v_window=v_window
+        )[1:-1]
+
+        # Thermal noise force (stochastic, FDT-linked)
+        if self.noise is not None:
+            np.add(forces, self.noise.next(), out=forces)
+
+        np.multiply(forces, self._dt_sq, out=forces)
+
+        inner = self.phi_next[1:-1]
+        damped_prev = self._scratch_b[1:-1]
+        np.multiply(self.phi[1:-1], 2.0, out=inner)
+        np.multiply(self.phi_prev[1:-1], self._prev_coeff, out=damped_prev)
+        np.subtract(inner, damped_prev, out=inner)
+        np.add(inner, forces, out=inner)
+        np.divide(inner, self._denom, out=inner)
+
+        # Boundary conditions
+        self.phi_next[0] = 0.0
+        self.phi_next[-1] = 0.0
+
+    def step_damped(
+        self,
+        *,
+        c: float,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> None:
+        """Advance field one timestep with damping and FDT-compliant noise."""
+        self._record(
+            *self._advance(
+                dt=self.dt, c=c, v_potential=v_potential, support=support, grad_v=grad_v
+            )
+        )
+
+    def step_damped_separable(
+        self, *, c: float, potential: "SeparablePotential", coefficients: Sequence[float]
+    ) -> None:
+        """`step_damped` for a separable potential `Σ_k coefficients[k]·p_k`."""
+        self._record(
+            *self._advance_separable(
+                dt=self.dt, c=c, potential=potential, coefficients=coefficients
+            )
+        )
+
+    def run(
+        self,
+        n_steps: int,
+        potential_schedule: PotentialSchedule,
+        *,
+        c: float,
+        dt: Optional[float] = None,
+    ) -> ChamberTelemetry:
+        """Batched `step_damped`; see `VacuumChamber.run`."""
+        if dt is not None and dt != self.dt:
+            raise ValueError(f"LangevinVacuumChamber integrates at dt={self.dt}, got dt={dt}")
+        return super().run(n_steps, potential_schedule, dt=self.dt, c=c)
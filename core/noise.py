@@ -0,0 +1,162 @@
+"""Block-generated, per-run seeded thermal noise streams.
+
+Langevin chambers draw one Gaussian kick per grid cell per step. Drawing
+them one step at a time from the global legacy RNG pays per-call overhead
+and makes parallel runs irreproducible. The streams here own a `Generator`
+derived from a `SeedSequence`, fill a block of many steps at once and hand
+out one row per step. Because Gaussian draws are consumed sequentially, the
+values a stream produces do not depend on its block size.
+
+A `NoiseStream` can report its position with `get_state` (JSON-serializable)
+and be put back there with `set_state`, so checkpointed runs resume with
+exactly the kicks they would have drawn.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_BLOCK_STEPS = 256
+MAX_BLOCK_BYTES = 64 * 1024 * 1024  # Cap per-stream block memory for large ensembles
+
+SeedLike = Union[int, np.random.SeedSequence, None]
+
+
+def spawn_seeds(seed: SeedLike, n: int) -> List[np.random.SeedSequence]:
+    """Independent child seed sequences for `n` streams (members, workers, sub-runs)."""
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return root.spawn(n)
+
+
+def _block_steps_for(requested: int, values_per_step: int) -> int:
+    budget = max(1, MAX_BLOCK_BYTES // (8 * max(1, values_per_step)))
+    return max(1, min(requested, budget))
+
+
+@dataclass
+class NoiseStream:
+    """Gaussian noise N(0, scale²) of length `size` per step, generated in blocks."""
+
+    size: int
+    scale: float
+    seed: SeedLike = None
+    block_steps: int = DEFAULT_BLOCK_STEPS
+
+    rng: np.random.Generator = field(init=False, repr=False)
+    _block: np.ndarray = field(init=False, repr=False)
+    _block_state: Dict[str, Any] = field(init=False, repr=False)
+    _cursor: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.block_steps = _block_steps_for(self.block_steps, self.size)
+        self.rng = np.random.default_rng(self.seed)
+        self._block = np.empty((self.block_steps, self.size))
+        self._block_state = self.rng.bit_generator.state
+        self._cursor = self.block_steps  # Forces a refill on first draw
+
+    def _refill(self) -> None:
+        # Generator state the block is drawn from, so `get_state` can replay it
+        self._block_state = self.rng.bit_generator.state
+        self.rng.standard_normal(out=self._block)
+        np.multiply(self._block, self.scale, out=self._block)
+        self._cursor = 0
+
+    def next(self) -> np.ndarray:
+        """Noise for the next step; a view valid until the block is refilled."""
+        if self._cursor == self.block_steps:
+            self._refill()
+        row = self._block[self._cursor]
+        self._cursor += 1
+        return row
+
+    def get_state(self) -> Dict[str, Any]:
+        """Position of the stream; `set_state` resumes drawing from exactly here."""
+        exhausted = self._cursor == self.block_steps
+        return {
+            "bit_generator": self.rng.bit_generator.state if exhausted else self._block_state,
+            "block_steps": self.block_steps,
+            "cursor": self._cursor,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        if state["block_steps"] != self.block_steps:
+            self.block_steps = int(state["block_steps"])
+            self._block = np.empty((self.block_steps, self.size))
+        self.rng.bit_generator.state = state["bit_generator"]
+        self._cursor = self.block_steps
+        if state["cursor"] < self.block_steps:
+            # Regenerate the current block and skip the rows already handed out
+            self._refill()
+            self._cursor = int(state["cursor"])
+
+
+@dataclass
+class EnsembleNoiseStream:
+    """One independent `NoiseStream`-equivalent per ensemble member.
+
+    Member `m` draws from its own `Generator` seeded by `seeds[m]`, so its
+    noise is reproducible regardless of which other members share the
+    ensemble. Members with zero scale are never drawn for.
+    """
+
+    size: int
+    scales: np.ndarray
+    seeds: Sequence[np.random.SeedSequence]
+    block_steps: int = DEFAULT_BLOCK_STEPS
+
+    rngs: List[np.random.Generator] = field(init=False, repr=False)
+    _block: np.ndarray = field(init=False, repr=False)
+    _active: np.ndarray = field(init=False, repr=False)
+    _cursor: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.scales = np.asarray(self.scales, dtype=float)
+        n_members = len(self.scales)
+        if len(self.seeds) != n_members:
+            raise ValueError(f"expected {n_members} seeds, got {len(self.seeds)}")
+
+        self.block_steps = _block_steps_for(self.block_steps, n_members * self.size)
+        self.rngs = [np.random.default_rng(s) for s in self.seeds]
+        self._block = np.zeros((n_members, self.block_steps, self.size))
+        self._active = np.flatnonzero(self.scales > 0)
+        self._cursor = self.block_steps
+
+    @classmethod
+    def from_seed(
+        cls,
+        size: int,
+        scales: np.ndarray,
+        seed: SeedLike,
+        block_steps: int = DEFAULT_BLOCK_STEPS,
+    ) -> "EnsembleNoiseStream":
+        return cls(size, scales, spawn_seeds(seed, len(scales)), block_steps)
+
+    def _refill(self) -> None:
+        for m in self._active:
+            member_block = self._block[m]
+            self.rngs[m].standard_normal(out=member_block)
+            np.multiply(member_block, self.scales[m], out=member_block)
+        self._cursor = 0
+
+    def next(self) -> np.ndarray:
+        """`(n_members, size)` noise for the next step (a strided view into the block)."""
+        if self._cursor == self.block_steps:
+            self._refill()
+        rows = self._block[:, self._cursor, :]
+        self._cursor += 1
+        return rows
+
+
+def make_noise_stream(
+    size: int,
+    scale: float,
+    seed: SeedLike,
+    block_steps: int = DEFAULT_BLOCK_STEPS,
+) -> Optional[NoiseStream]:
+    """A `NoiseStream`, or None when `scale` is zero and no noise is needed."""
+    if scale <= 0:
+        return None
+    return NoiseStream(size, scale, seed, block_steps)
@@ -0,0 +1,95 @@
+"""Process-pool execution of independent sweep points.
+
+The temperature sweeps run every point from its own seed, so the points
+can run in any order on any process and still give the same numbers.
+`sweep_map` fans them out to a `ProcessPoolExecutor` and yields the
+results in input order, so the caller's printing, analysis and plots
+run unchanged in the parent.
+
+Workers are spawned rather than forked: a fresh interpreter reads the
+BLAS / OpenMP / Numba thread settings when it first imports NumPy, so
+`pinned_threads` can hold each worker to one thread and N workers do not
+oversubscribe N cores. The point function and its arguments must be
+picklable, i.e. module-level functions (or `functools.partial`s of them)
+and plain data such as the frozen experiment configs.
+
+With one worker, or one point, the points run in the calling process
+with no pool at all.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from multiprocessing import get_context
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+PointT = TypeVar("PointT")
+ResultT = TypeVar("ResultT")
+
+THREAD_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "NUMBA_NUM_THREADS",
+)
+
+
+def sweep_workers(workers: Optional[int], n_points: int) -> int:
+    """Worker processes for `n_points` points: `workers`, or one per core when 0 / None.
+
+    This is how an experiment config's `workers` field (the processes its
+    sweep points are spread over) is read. It only decides where points
+    run, never their numbers. A caller that already runs experiments in a
+    pool sets `workers=1` in each config, so pools do not nest.
+    """
+    if workers is not None and workers < 0:
+        raise ValueError("workers must be a non-negative integer (0: one per core)")
+    if not workers:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_points))
+
+
+@contextmanager
+def pinned_threads(n_threads: int = 1) -> Iterator[None]:
+    """Set the thread-count variables that processes started inside the block inherit."""
+    saved = {name: os.environ.get(name) for name in THREAD_VARIABLES}
+    os.environ.update({name: str(n_threads) for name in THREAD_VARIABLES})
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def sweep_map(
+    fn: Callable[[PointT], ResultT],
+    points: Iterable[PointT],
+    *,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[ResultT]:
+    """`fn(point)` for every point, yielded in order as each becomes available.
+
+    `workers` is the number of processes (0 / None: one per core, capped
+    at the number of points). With `ordered=False` results are yielded as
+    soon as they finish, for live progress.
+    """
+    points = list(points)
+    n_workers = sweep_workers(workers, len(points))
+    if n_workers == 1:
+        for point in points:
+            yield fn(point)
+        return
+    with pinned_threads(1), ProcessPoolExecutor(n_workers, mp_context=get_context("spawn")) as pool:
+        if ordered:
+            yield from pool.map(fn, points)
+        else:
+            for future in as_completed([pool.submit(fn, point) for point in points]):
+                yield future.result()
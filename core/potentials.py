@@ -0,0 +1,256 @@
+"""Analytic potential providers for the chamber experiments.
+
+Each provider evaluates the potential and its analytic x-gradient from one
+shared exponential into reusable buffers, so a step needs no second exp
+and no `np.gradient` pass. Arrays returned by `evaluate` are only valid
+until the next call.
+
+Providers also report their support: the slice of grid cells outside of
+which the potential (and so its contribution to the back-reaction force)
+is negligible. For Gaussian features this is ±`n_sigma` widths, by default
+6σ where the profile has fallen to ~1e-8. Potentials are evaluated on
+their support only and are exactly zero elsewhere, so a step costs
+O(width) rather than O(nx).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_SUPPORT_SIGMA = 6.0
+
+
+def gaussian_support(
+    x: np.ndarray, center: float, width: float, n_sigma: float = DEFAULT_SUPPORT_SIGMA
+) -> slice:
+    """Cells of the sorted grid `x` within `center ± n_sigma·width`."""
+    half = n_sigma * width
+    lo, hi = np.searchsorted(x, (center - half, center + half))
+    return slice(int(lo), int(hi))
+
+
+def profile_support(*profiles: np.ndarray, n_sigma: float = DEFAULT_SUPPORT_SIGMA) -> slice:
+    """Smallest slice covering every cell where any profile exceeds its peak·exp(-n_sigma²/2).
+
+    The threshold is the height of a Gaussian at `n_sigma` widths, so a
+    Gaussian profile gets the same window as `gaussian_support`.
+    """
+    cutoff = np.exp(-(n_sigma**2) / 2.0)
+    mask = np.zeros(len(profiles[0]), dtype=bool)
+    for p in profiles:
+        magnitude = np.abs(p)
+        mask |= magnitude > cutoff * magnitude.max()
+    cells = np.flatnonzero(mask)
+    if len(cells) == 0:
+        return slice(0, 0)
+    return slice(int(cells[0]), int(cells[-1]) + 1)
+
+
+@dataclass
+class GaussianMirror:
+    """Gaussian barrier `height·exp(-(x - x_c)²/2w²)` centred anywhere on the grid.
+
+    dV/dx = -(x - x_c)/w² · V reuses the exponential.
+    """
+
+    x: np.ndarray
+    height: float
+    width: float
+    n_sigma: float = DEFAULT_SUPPORT_SIGMA
+
+    _v: np.ndarray = field(init=False, repr=False)
+    _grad: np.ndarray = field(init=False, repr=False)
+    _window: slice = field(init=False, repr=False)
+    _support_cache: Tuple[float, slice] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._v = np.zeros_like(self.x)
+        self._grad = np.zeros_like(self.x)
+        self._window = slice(0, 0)
+        self._support_cache = (np.nan, slice(0, 0))
+
+    def _evaluate(self, center: float, amplitude: float) -> Tuple[np.ndarray, np.ndarray]:
+        window = self.support(center)
+        if window != self._window:
+            # Clear the previous window; the new one is overwritten below
+            self._v[self._window] = 0.0
+            self._grad[self._window] = 0.0
+            self._window = window
+
+        offset = np.subtract(self.x[window], center, out=self._grad[window])
+
+        V = self._v[window]
+        np.square(offset, out=V)
+        np.negative(V, out=V)
+        np.divide(V, 2 * self.width**2, out=V)
+        np.exp(V, out=V)
+        np.multiply(V, amplitude, out=V)
+
+        grad = np.multiply(offset, V, out=offset)
+        np.divide(grad, -(self.width**2), out=grad)
+        return self._v, self._grad
+
+    def evaluate(self, center: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(V, dV/dx) for the mirror centred at `center`."""
+        return self._evaluate(center, self.height)
+
+    def support(self, center: float) -> slice:
+        cached_center, window = self._support_cache
+        if center != cached_center:
+            window = gaussian_support(self.x, center, self.width, self.n_sigma)
+            self._support_cache = (center, window)
+        return window
+
+
+class ModulatedMirror(GaussianMirror):
+    """Grip/slip Gaussian mirror whose height is scaled by a per-step coupling.
+
+    `height` is the full-grip barrier; coupling 1.0 grips and values below
+    1.0 let the mirror slip through the field (experiments 4/4B).
+    """
+
+    def evaluate(self, center: float, coupling: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """(V, dV/dx) for the mirror at `center` with height `height·coupling`."""
+        return self._evaluate(center, self.height * coupling)
+
+
+@dataclass
+class SeparablePotential:
+    """`V(x, t) = Σ_k g_k(t)·p_k(x)` over fixed profiles `p_k` with fixed gradients.
+
+    Only the coefficients `g_k` change from step to step, so a chamber can
+    evaluate the back-reaction force as `-dx·Σ_k g_k·Σφ²∂p_k` and the
+    switching work of a coefficient jump as `0.5·dx·Σ_k Δg_k·Σφ²p_k`
+    from two small matrix-vector products over the support window,
+    without materializing V or its gradient. `evaluate` still builds
+    (V, dV/dx) on the support for callers that need the arrays.
+    """
+
+    profiles: np.ndarray  # (n_profiles, nx)
+    grads: np.ndarray  # (n_profiles, nx)
+    n_sigma: float = DEFAULT_SUPPORT_SIGMA
+
+    _support: slice = field(init=False, repr=False)
+    _window_profiles: np.ndarray = field(init=False, repr=False)
+    _window_grads: np.ndarray = field(init=False, repr=False)
+    _window_stack: np.ndarray = field(init=False, repr=False)
+    _v: np.ndarray = field(init=False, repr=False)
+    _grad: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.profiles = np.atleast_2d(np.asarray(self.profiles, dtype=float))
+        self.grads = np.atleast_2d(np.asarray(self.grads, dtype=float))
+        if self.profiles.shape != self.grads.shape:
+            raise ValueError(
+                f"profiles {self.profiles.shape} and grads {self.grads.shape} must match"
+            )
+        self._support = profile_support(*self.profiles, n_sigma=self.n_sigma)
+        # Contiguous copies of the support window for the per-step products
+        self._window_profiles = np.ascontiguousarray(self.profiles[:, self._support])
+        self._window_grads = np.ascontiguousarray(self.grads[:, self._support])
+        self._window_stack = np.concatenate([self._window_profiles, self._window_grads])
+        self._v = np.zeros(self.profiles.shape[1])
+        self._grad = np.zeros(self.profiles.shape[1])
+
+    @property
+    def n_profiles(self) -> int:
+        return self.profiles.shape[0]
+
+    @property
+    def window_profiles(self) -> np.ndarray:
+        """`p_k` restricted to `support()`, shape `(n_profiles, window)`."""
+        return self._window_profiles
+
+    @property
+    def window_grads(self) -> np.ndarray:
+        """`∂p_k/∂x` restricted to `support()`, shape `(n_profiles, window)`."""
+        return self._window_grads
+
+    def support(self) -> slice:
+        return self._support
+
+    def coefficients(self, *coefficients: float) -> np.ndarray:
+        g = np.asarray(coefficients, dtype=float)
+        if g.shape != (self.n_profiles,):
+            raise ValueError(f"expected {self.n_profiles} coefficients, got {len(g)}")
+        return g
+
+    def overlaps(self, phi_sq: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(Σφ²p_k, Σφ²∂p_k) over the support, given φ² on the support window."""
+        moments = self._window_stack @ phi_sq
+        return moments[: self.n_profiles], moments[self.n_profiles :]
+
+    def potential(self, *coefficients: float) -> np.ndarray:
+        """V for the given coefficients (exactly zero outside the support)."""
+        np.dot(self.coefficients(*coefficients), self._window_profiles, out=self._v[self._support])
+        return self._v
+
+    def evaluate(self, *coefficients: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(V, dV/dx) for the given coefficients."""
+        g = self.coefficients(*coefficients)
+        np.dot(g, self._window_profiles, out=self._v[self._support])
+        np.dot(g, self._window_grads, out=self._grad[self._support])
+        return self._v, self._grad
+
+
+class TwoCouplerDrive(SeparablePotential):
+    """Two fixed coupler profiles driven as `g1·p1(x) + g2·p2(x)`.
+
+    The profile gradients are fixed too, so they are computed once:
+    analytically by `gaussian`, or by `np.gradient` in `from_profiles`.
+    """
+
+    @classmethod
+    def gaussian(
+        cls,
+        x: np.ndarray,
+        centers: Sequence[float],
+        width: float,
+        dx: Optional[float] = None,
+        n_sigma: float = DEFAULT_SUPPORT_SIGMA,
+    ) -> "TwoCouplerDrive":
+        """Gaussian couplers of width `width` at `centers`.
+
+        With `dx` each profile is normalized to unit area (Σp·dx = 1) to
+        conserve coupling strength; otherwise profiles have unit peak.
+        """
+        profiles, grads = [], []
+        for center in centers:
+            offset = x - center
+            p = np.exp(-(offset**2) / (2 * width**2))
+            if dx is not None:
+                p /= np.sum(p) * dx
+            profiles.append(p)
+            grads.append(-offset / width**2 * p)
+        return cls(np.array(profiles), np.array(grads), n_sigma)
+
+    @classmethod
+    def from_profiles(
+        cls,
+        profile1: np.ndarray,
+        profile2: np.ndarray,
+        dx: float,
+        n_sigma: float = DEFAULT_SUPPORT_SIGMA,
+    ) -> "TwoCouplerDrive":
+        """Arbitrary fixed profiles; gradients by `np.gradient` (once)."""
+        profiles = np.array([profile1, profile2])
+        return cls(profiles, np.gradient(profiles, dx, axis=-1), n_sigma)
+
+    @property
+    def profile1(self) -> np.ndarray:
+        return self.profiles[0]
+
+    @property
+    def profile2(self) -> np.ndarray:
+        return self.profiles[1]
+
+    @property
+    def grad1(self) -> np.ndarray:
+        return self.grads[0]
+
+    @property
+    def grad2(self) -> np.ndarray:
+        return self.grads[1]
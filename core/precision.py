@@ -0,0 +1,111 @@
+"""float32 vs float64 drift check for chamber runs.
+
+float32 fields halve memory traffic, which pays off on large grids and
+big ensembles, but rounding in the field update can bias a small net
+impulse. `compare_precision` runs the same seeded trajectory at both
+precisions (thermal noise is drawn in float64, so both runs see identical
+kicks) and reports how far the float32 net impulse moves. `reference_drift`
+does this for a short Floquet Langevin run resembling 4D/4E.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from core.langevin import LangevinVacuumChamber
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.vacuum_chamber import (
+    DiagnosticsPolicy,
+    PotentialSchedule,
+    VacuumChamber,
+)
+
+
+@dataclass(frozen=True)
+class PrecisionReport:
+    """Net impulse ∫F dt of one trajectory integrated at both precisions."""
+
+    impulse_float64: float
+    impulse_float32: float
+    force_scale: float  # max |F| of the float64 run
+
+    @property
+    def abs_drift(self) -> float:
+        return abs(self.impulse_float32 - self.impulse_float64)
+
+    @property
+    def rel_drift(self) -> float:
+        scale = abs(self.impulse_float64)
+        return self.abs_drift / scale if scale > 0 else float("inf")
+
+    def acceptable(self, rtol: float = 1e-3) -> bool:
+        """True when float32 moves the net impulse by less than `rtol` (relative)."""
+        return self.rel_drift < rtol
+
+
+def net_impulse(force: np.ndarray, dt: float) -> float:
+    integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
+    return float(integrate(force, dx=dt))
+
+
+def compare_precision(
+    make_chamber: Callable[[np.dtype], VacuumChamber],
+    schedule: PotentialSchedule,
+    n_steps: int,
+    *,
+    dt: float,
+    c: float,
+) -> PrecisionReport:
+    """Run `make_chamber(dtype)` at float64 and float32 and compare net impulse.
+
+    `make_chamber` must build and seed identical chambers apart from the
+    dtype (same initial field, same noise seed).
+    """
+    forces = {}
+    for dtype in (np.float64, np.float32):
+        sim = make_chamber(np.dtype(dtype))
+        forces[dtype] = sim.run(n_steps, schedule, dt=dt, c=c).mirror_force
+
+    return PrecisionReport(
+        impulse_float64=net_impulse(forces[np.float64], dt),
+        impulse_float32=net_impulse(forces[np.float32], dt),
+        force_scale=float(np.max(np.abs(forces[np.float64]))),
+    )
+
+
+def reference_drift(
+    *,
+    nx: int = 1000,
+    n_cycles: int = 20,
+    temperature: float = 0.01,
+    backend: str = "numpy",
+    seed: int = 42,
+) -> PrecisionReport:
+    """Drift check on a 4D/4E-style two-coupler Floquet Langevin run."""
+    dx, dt, omega = 0.1, 0.02, 1.0
+    x = np.arange(nx) * dx
+    x_center = (nx / 2.0) * dx
+    drive = TwoCouplerDrive.gaussian(x, (x_center - 10.0, x_center + 10.0), 1.0, dx=dx)
+    schedule = FloquetCouplerSchedule(drive, g0=5.0, g1=3.75, omega=omega, phi=np.pi / 2, dt=dt)
+
+    def make_chamber(dtype: np.dtype) -> VacuumChamber:
+        sim = LangevinVacuumChamber(
+            nx,
+            dx,
+            dt,
+            gamma=0.001,
+            temperature=temperature,
+            diagnostics=DiagnosticsPolicy.force_only(),
+            noise_seed=seed,
+            backend=backend,
+            dtype=dtype,
+        )
+        sim.seed_vacuum_noise(seed=seed, sigma=0.001)
+        return sim
+
+    n_steps = int(2 * np.pi / (omega * dt)) * n_cycles
+    return compare_precision(make_chamber, schedule, n_steps, dt=dt, c=1.0)
@@ -0,0 +1,168 @@
+"""Content-addressed cache of finished experiment runs.
+
+A run is identified by what determines its numbers and its report: the
+experiment name, `dataclasses.asdict(cfg)` without the execution-only
+`EXECUTION_FIELDS` (so `lab.py` and `lab.py sweep` runs of one point
+share an entry), the seed, a hash of the code involved (the experiment
+module, every `core/` and `flight_recorder/` source and
+`experiments/sweep.py`), the backend the config resolves to here ("auto"
+depends on Numba) and the NumPy and Numba versions. Its key is the
+SHA-256 of those inputs. The cache keeps a copy of the run's
+`FlightRecorder` folder under `<directory>/<key>/run/`: the report,
+`metrics.json`, plots, memmap telemetry and checkpoints. So a hit
+restores everything a fresh run would have written, without stepping a
+single chamber.
+
+Entries are evicted least-recently-used first once their total size
+exceeds `max_bytes`. A hit counts as a use. Entries are written to a
+temporary directory and renamed into place, so concurrent workers never
+see a half-written one.
+
+Runs that depend on anything outside these inputs (a warm-start field,
+a resumed checkpoint) must bypass the cache.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from core import kernels
+
+DEFAULT_CACHE_DIR = ".lab_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+ENTRY_FILENAME = "entry.json"
+
+# Config fields that only decide how a run executes, never what it writes
+EXECUTION_FIELDS = frozenset({"workers"})
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Sources every run depends on besides its experiment module
+_SHARED_SOURCES = ("core/*.py", "flight_recorder/*.py", "experiments/sweep.py")
+
+
+@lru_cache(maxsize=None)
+def code_version(module_name: str) -> str:
+    """SHA-256 over the sources of `module_name` and of `_SHARED_SOURCES`."""
+    paths = [os.path.abspath(sys.modules[module_name].__file__)]
+    for pattern in _SHARED_SOURCES:
+        paths.extend(sorted(glob.glob(os.path.join(_ROOT_DIR, pattern))))
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.relpath(path, _ROOT_DIR).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _resolved_backend(cfg: Any) -> Optional[str]:
+    if not hasattr(cfg, "backend"):
+        return None
+    try:
+        return kernels.resolve_backend(cfg.backend)
+    except (ImportError, ValueError):  # the run itself will fail, and is not stored
+        return cfg.backend
+
+
+def _folder_size(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names
+    )
+
+
+@dataclass(frozen=True)
+class ResultCache:
+    """Finished run folders, keyed by `key(...)` (see module docstring)."""
+
+    directory: str = DEFAULT_CACHE_DIR
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def key(self, experiment: str, run_fn: Any, cfg: Any, seed: int) -> str:
+        """The cache key of `run_fn(seed=seed, cfg=cfg)`, registered as `experiment`."""
+        inputs = {
+            "experiment": experiment,
+            "config": {k: v for k, v in dataclasses.asdict(cfg).items() if k not in EXECUTION_FIELDS},
+            "seed": seed,
+            "code": code_version(run_fn.__module__),
+            "backend": _resolved_backend(cfg),
+            "numpy": np.__version__,
+            "numba": kernels.numba.__version__ if kernels.HAVE_NUMBA else None,
+        }
+        text = json.dumps(inputs, sort_keys=True, default=repr)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def restore(self, key: str, base_dir: str) -> Optional[str]:
+        """Copy the cached run folder for `key` into `base_dir`; its path, or None on a miss.
+
+        A folder of the same name already in `base_dir` (the same run,
+        restored before) is reused as is.
+        """
+        entry = os.path.join(self.directory, key)
+        try:
+            with open(os.path.join(entry, ENTRY_FILENAME), encoding="utf-8") as f:
+                meta = json.load(f)
+            target = os.path.join(base_dir, meta["folder"])
+            if not os.path.isdir(target):
+                shutil.copytree(os.path.join(entry, "run"), target)
+            os.utime(os.path.join(entry, ENTRY_FILENAME))
+        except (OSError, ValueError, KeyError):  # missing, or evicted mid-copy: a miss
+            return None
+        return target
+
+    def store(self, key: str, folder: str) -> None:
+        """Cache a copy of the finished run `folder` under `key`, then evict down to size."""
+        entry = os.path.join(self.directory, key)
+        if os.path.isdir(entry):
+            return
+        staging = os.path.join(self.directory, f".tmp_{key}_{uuid.uuid4().hex[:8]}")
+        shutil.copytree(folder, os.path.join(staging, "run"))
+        meta = {
+            "folder": os.path.basename(os.path.normpath(folder)),
+            "bytes": _folder_size(staging),
+            "stored": time.time(),
+        }
+        with open(os.path.join(staging, ENTRY_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        try:
+            os.rename(staging, entry)
+        except OSError:  # another worker stored the same run first
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict()
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Metadata of every entry, with `used` (last-use time) added."""
+        found = {}
+        for path in glob.glob(os.path.join(self.directory, "*", ENTRY_FILENAME)):
+            key = os.path.basename(os.path.dirname(path))
+            if key.startswith("."):
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                meta["used"] = os.path.getmtime(path)
+            except (OSError, ValueError):
+                continue
+            found[key] = meta
+        return found
+
+    def evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits in `max_bytes`."""
+        entries = self.entries()
+        total = sum(meta["bytes"] for meta in entries.values())
+        for key, meta in sorted(entries.items(), key=lambda item: item[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+            total -= meta["bytes"]
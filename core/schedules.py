@@ -0,0 +1,139 @@
+"""Potential schedules for driving `VacuumChamber.run`.
+
+A schedule maps a step index to the parameters of a `core.potentials`
+provider and hands the chamber the potential, its analytic gradient and
+its support window for that step. Trajectories precomputed by
+`core.drives` can be passed as arrays indexed by step.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from core.drives import grip_slip_coupling, harmonic_phases, sawtooth_displacement
+from core.potentials import DEFAULT_SUPPORT_SIGMA, ModulatedMirror, TwoCouplerDrive
+
+
+@dataclass
+class GaussianMirrorSchedule:
+    """Gaussian barrier `height * exp(-(x - x_c)² / 2w²)` following a trajectory.
+
+    `position` gives the mirror centre for each step, either as a callable
+    `position(step)` or as a precomputed per-step array. An optional
+    per-step `coupling` array scales the height (grip/slip, see
+    `ModulatedMirror`). The potential is evaluated into a reusable buffer,
+    so the array returned by `potential` is only valid until the next call.
+    """
+
+    x: np.ndarray
+    height: float
+    width: float
+    position: Union[Callable[[int], float], np.ndarray]
+    n_sigma: float = DEFAULT_SUPPORT_SIGMA
+    coupling: Optional[np.ndarray] = None
+
+    _mirror: ModulatedMirror = field(init=False, repr=False)
+    _position: Callable[[int], float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._mirror = ModulatedMirror(self.x, self.height, self.width, self.n_sigma)
+        self._position = self.position if callable(self.position) else self.position.__getitem__
+
+    @classmethod
+    def sawtooth(
+        cls,
+        x: np.ndarray,
+        n_steps: int,
+        *,
+        height: float,
+        width: float,
+        centre: float,
+        amplitude: float,
+        start_time: int,
+        rise_time: int,
+        fall_time: int,
+        slip: float = 0.1,
+    ) -> "GaussianMirrorSchedule":
+        """Sawtooth trajectory about `centre` with grip/slip coupling modulation.
+
+        FAST OUT slips through the field (coupling `slip`), SLOW BACK grips it.
+        """
+        displacement = sawtooth_displacement(
+            n_steps,
+            amplitude=amplitude,
+            start_time=start_time,
+            rise_time=rise_time,
+            fall_time=fall_time,
+        )
+        coupling = grip_slip_coupling(n_steps, start_time=start_time, rise_time=rise_time, slip=slip)
+        return cls(x=x, height=height, width=width, position=centre + displacement, coupling=coupling)
+
+    def mirror_position(self, step: int) -> float:
+        return float(self._position(step))
+
+    def peak_potential(self, start: int, n_steps: int) -> float:
+        """Largest V over steps `start..start + n_steps` (see `core.stability`)."""
+        if self.coupling is None:
+            return max(self.height, 0.0)
+        return max(self.height * float(np.max(self.coupling[start : start + n_steps])), 0.0)
+
+    def support(self, step: int) -> slice:
+        return self._mirror.support(self.mirror_position(step))
+
+    def potential_and_gradient(self, step: int) -> Tuple[np.ndarray, np.ndarray]:
+        coupling = 1.0 if self.coupling is None else float(self.coupling[step])
+        return self._mirror.evaluate(self.mirror_position(step), coupling)
+
+    def potential(self, step: int) -> np.ndarray:
+        return self.potential_and_gradient(step)[0]
+
+
+@dataclass
+class FloquetCouplerSchedule:
+    """Two-coupler Floquet drive `g1(t)·p1(x) + g2(t)·p2(x)`.
+
+    g1(t) = g0 + g1·cos(Ωt), g2(t) = g0 + g1·cos(Ωt + φ), with t = step·dt.
+    Like `GaussianMirrorSchedule`, the returned arrays are reused buffers.
+    """
+
+    drive: TwoCouplerDrive
+    g0: float
+    g1: float
+    omega: float
+    phi: float
+    dt: float
+
+    def couplings(self, step: int) -> tuple[float, float]:
+        t = step * self.dt
+        g1_t = self.g0 + self.g1 * np.cos(self.omega * t)
+        g2_t = self.g0 + self.g1 * np.cos(self.omega * t + self.phi)
+        return g1_t, g2_t
+
+    @property
+    def separable_potential(self) -> TwoCouplerDrive:
+        return self.drive
+
+    def coefficients(self, step: int) -> tuple[float, float]:
+        return self.couplings(step)
+
+    def coefficient_table(self, start: int, n_steps: int) -> np.ndarray:
+        """(g1(t), g2(t)) for steps `start..start + n_steps`, shape `(n_steps, 2)`."""
+        cos = harmonic_phases(start, n_steps, dt=self.dt, omega=self.omega, phases=(0.0, self.phi))
+        return self.g0 + self.g1 * cos
+
+    def peak_potential(self, start: int, n_steps: int) -> float:
+        """Bound on V over any steps: both couplings at g0 + |g1| (see `core.stability`)."""
+        peak = self.g0 + abs(self.g1)
+        return max(peak, 0.0) * float(np.max(self.drive.window_profiles.sum(axis=0)))
+
+    def support(self, step: int) -> slice:
+        return self.drive.support()
+
+    def potential_and_gradient(self, step: int) -> Tuple[np.ndarray, np.ndarray]:
+        return self.drive.evaluate(*self.couplings(step))
+
+    def potential(self, step: int) -> np.ndarray:
+        return self.potential_and_gradient(step)[0]
@@ -0,0 +1,162 @@
+"""Timestep limits and a blow-up watchdog for the chamber.
+
+The explicit schemes are only stable while dt·ω_max stays inside the
+integrator's stability interval, where ω_max is the grid's highest
+angular frequency. For c²∇² - V on a grid of spacing dx, Gershgorin's
+theorem bounds it by
+
+    ω_max² ≤ 4c²/dx² + max(V, 0),
+
+so the step limits below are slightly conservative but never unsafe:
+
+    "leapfrog"  dt ≤ 2 / ω_max (damping only widens the interval)
+    "yoshida4"  dt ≤ 1.5734 / ω_max (|tr S4(ω·dt)|/2 ≤ 1 for φ̈ = -ω²φ)
+
+The spectral backend propagates the wave exactly, so only the explicit
+-Vφ kick limits it: dt ≤ 2 / sqrt(V_max). A PML layer adds c·dt/dx < 1
+on every backend (see `core.boundaries`).
+
+`StabilityWatchdog` sets how a running chamber is watched (its
+`BlowupMonitor` holds the state). Every `check_every` steps it takes
+Σφ², a cheap proxy for the field energy, and raises
+`NumericalInstabilityError` when the field is no longer finite or Σφ²
+has grown by more than `growth` per check for `patience` checks in a
+row. A numerical instability grows by a large factor every step, far
+faster than any physical (parametric) gain of the drives, so the
+default thresholds do not fire on driven or thermalizing runs.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+# Largest stable ω·dt of each integrator on the undamped oscillator
+STABILITY_LIMITS = {"leapfrog": 2.0, "yoshida4": 1.5734}
+
+
+class NumericalInstabilityError(RuntimeError):
+    """The field blew up (or would, at this dt); `step` is where it was caught.
+
+    `report_status` / `report_outcome` are what a `FlightRecorder` reports
+    for a run this aborts.
+    """
+
+    report_status = "NUMERICAL INSTABILITY"
+
+    def __init__(self, message: str, *, step: int):
+        super().__init__(message)
+        self.step = step
+
+    @property
+    def report_outcome(self) -> str:
+        return f"ABORTED AT STEP {self.step}"
+
+
+def max_frequency(*, dx: float, c: float, v_max: float = 0.0) -> float:
+    """Upper bound on the highest angular frequency of c²∇² - V on the grid."""
+    return math.sqrt(4.0 * c**2 / dx**2 + max(v_max, 0.0))
+
+
+def max_stable_dt(
+    *,
+    dx: float,
+    c: float,
+    v_max: float = 0.0,
+    integrator: str = "leapfrog",
+    backend: str = "numpy",
+    absorber: Optional[str] = None,
+) -> float:
+    """Largest stable dt for a chamber whose potential never exceeds `v_max`.
+
+    `absorber` is the kind of absorbing layer ("pml", "sponge"), if any.
+    """
+    if integrator not in STABILITY_LIMITS:
+        raise ValueError(f"unknown integrator {integrator!r}; expected one of {tuple(STABILITY_LIMITS)}")
+    limit = STABILITY_LIMITS[integrator]
+    if backend == "spectral":
+        dt = limit / math.sqrt(v_max) if v_max > 0.0 else math.inf
+    else:
+        dt = limit / max_frequency(dx=dx, c=c, v_max=v_max)
+    if absorber == "pml":
+        dt = min(dt, dx / c)
+    return dt
+
+
+def choose_dt(max_dt: float, *, safety: float = 0.9) -> float:
+    """`safety`·`max_dt`, rounded down to two significant figures."""
+    if not 0.0 < safety <= 1.0:
+        raise ValueError("safety factor must lie in (0, 1]")
+    if not math.isfinite(max_dt):
+        raise ValueError("no finite step limit to choose dt from")
+    dt = safety * max_dt
+    scale = 10.0 ** (math.floor(math.log10(dt)) - 1)
+    return math.floor(dt / scale) * scale
+
+
+def peak_potential(potential_schedule, start: int, n_steps: int) -> Optional[float]:
+    """The schedule's bound on V over steps `start..start + n_steps`, if it has one."""
+    peak = getattr(potential_schedule, "peak_potential", None)
+    return None if peak is None else float(peak(start, n_steps))
+
+
+@dataclass(frozen=True)
+class StabilityWatchdog:
+    """When to declare a running chamber unstable (see module docstring)."""
+
+    check_every: int = 64
+    growth: float = 10.0
+    patience: int = 3
+
+    def __post_init__(self) -> None:
+        if self.check_every < 1:
+            raise ValueError("check_every must be a positive integer")
+        if self.growth <= 1.0:
+            raise ValueError("growth threshold must exceed 1")
+        if self.patience < 1:
+            raise ValueError("patience must be a positive integer")
+
+    def check_dt(self, dt: float, max_dt: float, *, step: int) -> None:
+        """Refuse to start a run at a dt beyond the stability limit."""
+        if dt > max_dt:
+            raise NumericalInstabilityError(
+                f"dt={dt:g} exceeds the stable limit {max_dt:.4g} at step {step}", step=step
+            )
+
+
+@dataclass
+class BlowupMonitor:
+    """Runtime state of a `StabilityWatchdog`: the last Σφ² and the growth streak."""
+
+    watchdog: StabilityWatchdog
+
+    _last: Optional[float] = field(default=None, init=False, repr=False)
+    _streak: int = field(default=0, init=False, repr=False)
+
+    def reset(self) -> None:
+        """Forget the growth history (a new field was loaded)."""
+        self._last = None
+        self._streak = 0
+
+    def observe(self, step: int, phi: np.ndarray) -> None:
+        """Check the field at `step` (a no-op off the `check_every` grid)."""
+        watchdog = self.watchdog
+        if step % watchdog.check_every:
+            return
+        norm = float(np.dot(phi, phi))
+        if not math.isfinite(norm):
+            raise NumericalInstabilityError(f"field is no longer finite at step {step}", step=step)
+        last, self._last = self._last, norm
+        if last is None or last <= 0.0 or norm <= watchdog.growth * last:
+            self._streak = 0
+            return
+        self._streak += 1
+        if self._streak >= watchdog.patience:
+            raise NumericalInstabilityError(
+                f"Σφ² grew {norm / last:.3g}x over the last {watchdog.check_every} steps "
+                f"({self._streak} checks in a row) at step {step}",
+                step=step,
+            )
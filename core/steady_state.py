@@ -0,0 +1,283 @@
+"""Time-periodic steady state of a periodically driven chamber by shooting.
+
+A chamber driven with period `period` steps has a one-period map
+P: (φ, φ_prev) ↦ (φ, φ_prev) after `period` steps. A periodic steady
+state is a fixed point x = P(x). `solve_periodic_state` finds it by
+Newton–Krylov shooting: each Newton step solves
+
+    (J - I)·δ = -(P(x) - x)
+
+with restarted GMRES, the Jacobian-vector products J·v taken as finite
+differences of P, so every Krylov iteration costs one period of stepping.
+The cycle-averaged force then comes from a single period started on the
+fixed point.
+
+The eigenvalues of J are the Floquet multipliers of the drive.
+`floquet_multipliers` estimates the largest ones by Arnoldi on J. They
+decide whether the fixed point is reached at all: for |λ| < 1 a
+transient decays as |λ|^n over n cycles, and for |λ| ≥ 1 (parametric
+resonance) there is no steady state.
+
+At T = 0 the chamber equation is linear and homogeneous, so φ = 0 (zero
+force) is always a periodic state, and from the default zero guess the
+solver returns it after one period. It is the steady state only if
+every |λ| < 1: a nonzero force in a long T = 0 run is then the decaying
+transient of the seeded field, and `PeriodicSteadyState.decay_cycles`
+says how long it lasts. If |λ| > 1 the force of a long run is that of
+the growing Floquet mode, not of any steady state.
+
+The shooting map restarts the chamber from (φ, φ_prev), so it needs the
+leapfrog (or spectral) stepping at T = 0 and no PML layer, whose ψ would
+be extra state. The schedule must repeat after `period` steps; for a
+`FloquetCouplerSchedule` that means dt = 2π / (Ω·period).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from core.vacuum_chamber import ChamberTelemetry, PotentialSchedule, VacuumChamber
+
+LinearOperator = Callable[[np.ndarray], np.ndarray]
+
+
+def gmres(
+    apply: LinearOperator,
+    b: np.ndarray,
+    *,
+    tol: float = 1e-10,
+    restart: int = 40,
+    max_iter: int = 400,
+) -> Tuple[np.ndarray, float, int]:
+    """Solve `apply(x) = b` by restarted GMRES from x = 0.
+
+    Returns (x, relative residual, number of `apply` calls).
+    """
+    x = np.zeros_like(b)
+    b_norm = float(np.linalg.norm(b))
+    if b_norm == 0.0:
+        return x, 0.0, 0
+    residual = b
+    res_norm = b_norm
+    matvecs = 0
+    while matvecs < max_iter:
+        basis = [residual / res_norm]
+        hessenberg = np.zeros((restart + 1, restart))
+        rhs = np.zeros(restart + 1)
+        rhs[0] = res_norm
+        for j in range(restart):
+            w = apply(basis[j])
+            matvecs += 1
+            # Modified Gram-Schmidt
+            for i in range(j + 1):
+                hessenberg[i, j] = basis[i] @ w
+                w = w - hessenberg[i, j] * basis[i]
+            hessenberg[j + 1, j] = np.linalg.norm(w)
+            h = hessenberg[: j + 2, : j + 1]
+            y = np.linalg.lstsq(h, rhs[: j + 2], rcond=None)[0]
+            res_norm = float(np.linalg.norm(h @ y - rhs[: j + 2]))
+            if res_norm <= tol * b_norm or hessenberg[j + 1, j] == 0.0 or matvecs >= max_iter:
+                break
+            basis.append(w / hessenberg[j + 1, j])
+        x = x + np.stack(basis[: j + 1], axis=1) @ y
+        if res_norm <= tol * b_norm:
+            break
+        residual = b - apply(x)
+        matvecs += 1
+        res_norm = float(np.linalg.norm(residual))
+        if res_norm <= tol * b_norm:
+            break
+    return x, res_norm / b_norm, matvecs
+
+
+@dataclass
+class PeriodMap:
+    """The one-period map of a chamber driven by `schedule`, on float64 states.
+
+    A state is `concatenate((φ, φ_prev))`. Each call loads the state at
+    step `start` and advances `period` steps. The chamber's own field and
+    step index are overwritten.
+    """
+
+    chamber: VacuumChamber
+    schedule: PotentialSchedule
+    period: int
+    dt: float
+    c: float
+    start: int = 0
+
+    evaluations: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        chamber = self.chamber
+        if chamber.integrator != "leapfrog":
+            raise ValueError(f"shooting needs the leapfrog state (φ, φ_prev), not {chamber.integrator}")
+        if chamber.absorber is not None and chamber.absorber.kind == "pml":
+            raise ValueError("shooting does not carry the PML auxiliary field; use a sponge layer")
+        if getattr(chamber, "noise", None) is not None:
+            raise ValueError("shooting needs a deterministic (T = 0) chamber")
+
+    def state(self) -> np.ndarray:
+        """The chamber's current (φ, φ_prev) as a state vector."""
+        return np.concatenate((self.chamber.phi, self.chamber.phi_prev)).astype(np.float64)
+
+    def advance(self, state: np.ndarray) -> ChamberTelemetry:
+        """Run one period from `state`; the chamber is left on the result."""
+        nx = self.chamber.nx
+        self.chamber.load_field(state[:nx], state[nx:])
+        self.chamber.step_index = self.start
+        self.evaluations += 1
+        return self.chamber.run(self.period, self.schedule, dt=self.dt, c=self.c)
+
+    def __call__(self, state: np.ndarray) -> np.ndarray:
+        self.advance(state)
+        return self.state()
+
+    def jacobian(self, state: np.ndarray, image: np.ndarray) -> LinearOperator:
+        """v ↦ J·v at `state` (whose image is `image`), by forward differences."""
+        scale = np.sqrt(np.finfo(np.float64).eps) * (1.0 + np.linalg.norm(state))
+
+        def apply(v: np.ndarray) -> np.ndarray:
+            v_norm = np.linalg.norm(v)
+            if v_norm == 0.0:
+                return np.zeros_like(v)
+            eps = scale / v_norm
+            return (self(state + eps * v) - image) / eps
+
+        return apply
+
+
+@dataclass(frozen=True)
+class PeriodicSteadyState:
+    """Fixed point of a `PeriodMap` and the force over one period on it.
+
+    `multipliers` are the largest Floquet multipliers by modulus, when
+    they were estimated.
+    """
+
+    phi: np.ndarray
+    phi_prev: np.ndarray
+    residual: float
+    newton_iterations: int
+    periods: int  # one-period maps evaluated, i.e. cost in units of `period` steps
+    mirror_force: np.ndarray
+    multipliers: Optional[np.ndarray] = None
+
+    @property
+    def mean_force(self) -> float:
+        """Cycle-averaged back-reaction force."""
+        return float(np.mean(self.mirror_force))
+
+    @property
+    def stable(self) -> Optional[bool]:
+        """Whether transients decay onto this state (None if not estimated)."""
+        radius = self.spectral_radius
+        return None if radius is None else radius < 1.0
+
+    @property
+    def spectral_radius(self) -> Optional[float]:
+        return None if self.multipliers is None else float(np.abs(self.multipliers[0]))
+
+    def decay_cycles(self, tolerance: float = 1e-3) -> Optional[float]:
+        """Cycles for a transient to decay by `tolerance` (inf at or past resonance)."""
+        radius = self.spectral_radius
+        if radius is None:
+            return None
+        if radius >= 1.0:
+            return np.inf
+        return float(np.log(tolerance) / np.log(radius))
+
+
+def floquet_multipliers(
+    period_map: PeriodMap,
+    state: np.ndarray,
+    *,
+    n_krylov: int = 30,
+    seed: int = 0,
+) -> np.ndarray:
+    """Ritz estimates of the largest Floquet multipliers about `state`, by |λ| descending.
+
+    Costs `n_krylov + 1` periods. For a weakly damped grid the multipliers
+    crowd the unit circle and J is far from normal, so the largest Ritz
+    value is a rough estimate of the spectral radius (it can overshoot by
+    ~1% at 80 vectors); it reliably separates decay from growth only when
+    the two are not marginal.
+    """
+    image = period_map(state)
+    jacobian = period_map.jacobian(state, image)
+    v = np.random.default_rng(seed).standard_normal(len(state))
+    basis = [v / np.linalg.norm(v)]
+    hessenberg = np.zeros((n_krylov + 1, n_krylov))
+    for j in range(n_krylov):
+        w = jacobian(basis[j])
+        for i in range(j + 1):
+            hessenberg[i, j] = basis[i] @ w
+            w = w - hessenberg[i, j] * basis[i]
+        hessenberg[j + 1, j] = np.linalg.norm(w)
+        if hessenberg[j + 1, j] == 0.0:
+            n_krylov = j + 1
+            break
+        basis.append(w / hessenberg[j + 1, j])
+    ritz = np.linalg.eigvals(hessenberg[:n_krylov, :n_krylov])
+    return ritz[np.argsort(-np.abs(ritz))]
+
+
+def solve_periodic_state(
+    chamber: VacuumChamber,
+    schedule: PotentialSchedule,
+    *,
+    period: int,
+    dt: float,
+    c: float,
+    start: int = 0,
+    guess: Optional[np.ndarray] = None,
+    tol: float = 1e-10,
+    max_newton: int = 8,
+    krylov: int = 40,
+    max_krylov: int = 400,
+    n_multipliers: int = 0,
+) -> PeriodicSteadyState:
+    """Newton–Krylov shooting for the periodic state of `chamber` under `schedule`.
+
+    `guess` is a starting state (default: zero field, which is already the
+    answer at T = 0). Each Newton step runs GMRES with `krylov` vectors per
+    restart and at most `max_krylov` periods. `n_multipliers > 0` also
+    estimates the Floquet multipliers about the solution with that many
+    Arnoldi vectors. The chamber is left at the end of the force period.
+    """
+    period_map = PeriodMap(chamber, schedule, period, dt, c, start)
+    x = np.zeros(2 * chamber.nx) if guess is None else np.asarray(guess, dtype=np.float64)
+    # Residuals are relative to the size of the first guess and its image
+    scale = None
+    residual = np.inf
+    newton = 0
+    for newton in range(max_newton + 1):
+        image = period_map(x)
+        step = image - x
+        if scale is None:
+            scale = max(float(np.linalg.norm(x)), float(np.linalg.norm(image)), np.finfo(np.float64).tiny)
+        residual = float(np.linalg.norm(step)) / scale
+        if residual <= tol or newton == max_newton:
+            break
+        jacobian = period_map.jacobian(x, image)
+        delta, _, _ = gmres(
+            lambda v: jacobian(v) - v, -step, tol=0.1 * tol, restart=krylov, max_iter=max_krylov
+        )
+        x = x + delta
+
+    multipliers = None
+    if n_multipliers > 0:
+        multipliers = floquet_multipliers(period_map, x, n_krylov=n_multipliers)
+    force = period_map.advance(x).mirror_force
+    return PeriodicSteadyState(
+        phi=x[: chamber.nx].copy(),
+        phi_prev=x[chamber.nx :].copy(),
+        residual=residual,
+        newton_iterations=newton,
+        periods=period_map.evaluations,
+        mirror_force=force,
+        multipliers=multipliers,
+    )
@@ -0,0 +1,158 @@
+"""Streaming telemetry sinks for per-step chamber and experiment series.
+
+A sink is an append-only float series stored in one contiguous buffer
+that grows by doubling, so appends are amortized O(1) and nothing is boxed
+per step. `ArraySink` keeps the buffer in memory. `MemmapSink` backs it
+with an `np.memmap` file (e.g. in the run's `FlightRecorder` folder), so
+resident memory stays flat however long the integration runs and the
+series survives on disk.
+
+Analysis code reads a sink zero-copy: `sink.view()`, `np.asarray(sink)`
+and slices all return views of the buffer. Views stay valid (and keep
+their values) after later appends, but do not see them.
+"""
+
+from __future__ import annotations
+
+import abc
+import os
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+DEFAULT_CAPACITY = 4096
+SINK_KINDS = ("memory", "memmap")
+
+
+@dataclass
+class TelemetrySink(abc.ABC):
+    """Base sink; subclasses own the buffer and how it grows."""
+
+    dtype: DTypeLike = np.float64
+    capacity: int = DEFAULT_CAPACITY
+
+    _data: np.ndarray = field(init=False, repr=False)
+    _n: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.dtype = np.dtype(self.dtype)
+        self.capacity = max(1, int(self.capacity))
+        self._data = self._allocate(self.capacity)
+
+    @abc.abstractmethod
+    def _allocate(self, capacity: int) -> np.ndarray:
+        """An empty buffer of `capacity`."""
+
+    @abc.abstractmethod
+    def _grow(self, capacity: int) -> np.ndarray:
+        """A buffer of `capacity` holding the current contents."""
+
+    def _reserve(self, n_more: int) -> None:
+        needed = self._n + n_more
+        if needed > len(self._data):
+            self._data = self._grow(max(needed, 2 * len(self._data)))
+
+    def append(self, value: float) -> None:
+        if self._n == len(self._data):
+            self._reserve(1)
+        self._data[self._n] = value
+        self._n += 1
+
+    def extend(self, values: Any) -> None:
+        values = np.asarray(values, dtype=self.dtype).ravel()
+        self._reserve(len(values))
+        self._data[self._n : self._n + len(values)] = values
+        self._n += len(values)
+
+    def clear(self) -> None:
+        self._n = 0
+
+    def close(self) -> None:
+        """Finish recording; the series stays readable."""
+
+    def view(self) -> np.ndarray:
+        """The recorded series, without copying."""
+        return self._data[: self._n]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.view()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.view())
+
+    def __array__(self, dtype: Optional[DTypeLike] = None, copy: Optional[bool] = None) -> np.ndarray:
+        data = self.view()
+        if dtype is not None and np.dtype(dtype) != data.dtype:
+            return data.astype(dtype)
+        return data.copy() if copy else data
+
+
+@dataclass
+class ArraySink(TelemetrySink):
+    """In-memory growable array."""
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        return np.empty(capacity, dtype=self.dtype)
+
+    def _grow(self, capacity: int) -> np.ndarray:
+        data = self._allocate(capacity)
+        data[: self._n] = self._data[: self._n]
+        return data
+
+
+@dataclass
+class MemmapSink(TelemetrySink):
+    """Growable array backed by a raw binary file at `path` (created or truncated).
+
+    The file holds the series as a flat array of `dtype`; `close` trims it
+    to the recorded length so `np.fromfile(path, dtype)` reads it back.
+    """
+
+    path: str = ""
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if not self.path:
+            raise ValueError("MemmapSink needs a file path")
+        return np.memmap(self.path, dtype=self.dtype, mode="w+", shape=(capacity,))
+
+    def _grow(self, capacity: int) -> np.ndarray:
+        self.flush()
+        with open(self.path, "r+b") as f:
+            f.truncate(capacity * self.dtype.itemsize)
+        return np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(capacity,))
+
+    def flush(self) -> None:
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+
+    def close(self) -> None:
+        """Flush and trim the file to the recorded length."""
+        self.flush()
+        with open(self.path, "r+b") as f:
+            f.truncate(self._n * self.dtype.itemsize)
+        if self._n:
+            self._data = np.memmap(self.path, dtype=self.dtype, mode="r+", shape=(self._n,))
+        else:
+            self._data = np.empty(0, dtype=self.dtype)
+
+
+def make_sink(
+    kind: str = "memory",
+    *,
+    directory: Optional[str] = None,
+    name: str = "series",
+    dtype: DTypeLike = np.float64,
+) -> TelemetrySink:
+    """An `ArraySink` ("memory") or a `MemmapSink` at `directory/name.bin` ("memmap")."""
+    if kind == "memory":
+        return ArraySink(dtype)
+    if kind == "memmap":
+        if directory is None:
+            raise ValueError("memmap telemetry needs a directory")
+        return MemmapSink(dtype, path=os.path.join(directory, f"{name}.bin"))
+    raise ValueError(f"Unknown telemetry sink {kind!r}; expected one of {SINK_KINDS}")
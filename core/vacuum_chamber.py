@@ -1,64 +1,776 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Protocol, Sequence, Tuple
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+from core import kernels
+from core.boundaries import AbsorbingLayer, BoundaryAbsorber
+from core.integrators import Yoshida4, resolve_integrator
+from core.spectral import SineSpectralPropagator
+from core.stability import BlowupMonitor, StabilityWatchdog, max_stable_dt, peak_potential
+from core.telemetry import ArraySink, TelemetrySink, make_sink
+
+if TYPE_CHECKING:
+    from core.potentials import SeparablePotential
+
+
+class PotentialSchedule(Protocol):
+    """Supplies the potential for each step of a batched `VacuumChamber.run`.
+
+    Schedules that also define `mirror_position(step) -> float` get their
+    trajectory recorded into `ChamberTelemetry.mirror_pos`; those that
+    define `support(step) -> slice` have the back-reaction force evaluated
+    only over that window of cells; and those that define
+    `potential_and_gradient(step) -> (V, dV/dx)` supply an analytic
+    gradient in place of the chamber's finite difference. Schedules with a
+    `separable_potential` (a `core.potentials.SeparablePotential`) and
+    `coefficients(step)` take the separable fast path instead, and
+    `coefficient_table(start, n_steps)` lets `run` precompute all the
+    coefficients of a batch at once. `peak_potential(start, n_steps)`
+    bounds V over a batch, so `run` can refuse an unstable dt up front.
+    """
+
+    def potential(self, step: int) -> np.ndarray:
+        ...
+
+
+FIELD_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def field_dtype(dtype: DTypeLike) -> np.dtype:
+    """Validate a chamber field precision (float64 or float32).
+
+    Force and energy reductions accumulate in float64 whatever the field
+    precision.
+    """
+    resolved = np.dtype(dtype)
+    if resolved not in FIELD_DTYPES:
+        raise ValueError(f"field dtype must be float64 or float32, got {resolved}")
+    return resolved
+
+
+@dataclass(frozen=True)
+class DiagnosticsPolicy:
+    """Which telemetry a chamber computes each step.
+
+    The back-reaction force is recorded every step. The field-energy
+    integral (two extra gradient/reduction passes) is sampled on steps
+    divisible by `energy_every`, or skipped entirely when it is None.
+    """
+
+    energy_every: Optional[int] = 1
+
+    def __post_init__(self) -> None:
+        if self.energy_every is not None and self.energy_every < 1:
+            raise ValueError("energy_every must be a positive integer or None")
+
+    @classmethod
+    def force_only(cls) -> "DiagnosticsPolicy":
+        return cls(energy_every=None)
+
+    @property
+    def fills(self) -> Tuple[str, ...]:
+        """Names of the telemetry series this policy populates."""
+        if self.energy_every is None:
+            return ("mirror_force",)
+        return ("mirror_force", "total_energy_field")
+
+    def samples_energy(self, step: int) -> bool:
+        return self.energy_every is not None and step % self.energy_every == 0
+
+    def energy_steps(self, start: int, n_steps: int) -> np.ndarray:
+        """Step indices in `[start, start + n_steps)` at which energy is sampled."""
+        if self.energy_every is None:
+            return np.empty(0, dtype=np.int64)
+        first = -(-start // self.energy_every) * self.energy_every
+        return np.arange(first, start + n_steps, self.energy_every, dtype=np.int64)
+
+
+@dataclass
+class ChamberTelemetry:
+    """Array-backed telemetry returned by `VacuumChamber.run`.
+
+    `total_energy_field[i]` was sampled at step `energy_step[i]`.
+    """
+
+    dt: float
+    mirror_force: np.ndarray
+    total_energy_field: np.ndarray
+    energy_step: np.ndarray
+    mirror_pos: Optional[np.ndarray] = None
+
+    @property
+    def n_steps(self) -> int:
+        return len(self.mirror_force)
+
+    @property
+    def time(self) -> np.ndarray:
+        return np.arange(self.n_steps) * self.dt
 
 
 @dataclass
 class VacuumChamber:
-    """1D scalar-field FDTD chamber with a moving potential barrier."""
+    """1D scalar-field FDTD chamber with a moving potential barrier.
+
+    `backend`, `dtype`, `absorber`, `integrator` and `watchdog` select the
+    stepping kernel (`core.kernels`), field precision (`core.precision`),
+    absorbing walls (`core.boundaries`), time integrator
+    (`core.integrators`) and blow-up checks (`core.stability`).
+    """
 
     nx: int
     dx: float
+    diagnostics: DiagnosticsPolicy = field(default_factory=DiagnosticsPolicy)
+    backend: str = "numpy"
+    dtype: DTypeLike = np.float64
+    absorber: Optional[AbsorbingLayer] = None
+    integrator: str = "leapfrog"
+    watchdog: Optional[StabilityWatchdog] = field(default_factory=StabilityWatchdog)
 
     x: np.ndarray = field(init=False)
     phi: np.ndarray = field(init=False)
     phi_prev: np.ndarray = field(init=False)
     phi_next: np.ndarray = field(init=False)
 
-    total_energy_field: List[float] = field(default_factory=list, init=False)
-    mirror_force: List[float] = field(default_factory=list, init=False)
-    mirror_pos_history: List[float] = field(default_factory=list, init=False)
+    total_energy_field: TelemetrySink = field(default_factory=ArraySink, init=False)
+    mirror_force: TelemetrySink = field(default_factory=ArraySink, init=False)
+    mirror_pos_history: TelemetrySink = field(default_factory=ArraySink, init=False)
+    step_index: int = field(default=0, init=False)
+    # Σφ²p_k of the field at the start of the last separable step
+    profile_overlap: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    _scratch_a: np.ndarray = field(init=False, repr=False)
+    _scratch_b: np.ndarray = field(init=False, repr=False)
+    _phi_sq: np.ndarray = field(init=False, repr=False)
+    _spectral: Optional[SineSpectralPropagator] = field(default=None, init=False, repr=False)
+    _boundary: Optional[BoundaryAbsorber] = field(default=None, init=False, repr=False)
+    # The spectral backend replaces φ_prev = φ by the exact at-rest φ(-dt) on its first step,
+    # and the composed integrator starts from zero velocity
+    _prev_at_rest: bool = field(default=False, init=False, repr=False)
+    _composer: Optional[Yoshida4] = field(default=None, init=False, repr=False)
+    _monitor: Optional[BlowupMonitor] = field(default=None, init=False, repr=False)
+    # The schedule's potential at a fractional step, while `run` drives a composed integrator
+    _potential_at: Optional[Callable[[float], Tuple[np.ndarray, Optional[slice]]]] = field(
+        default=None, init=False, repr=False
+    )
+
+    # Damped-leapfrog coefficients seen by the fused kernel; 1.0 is undamped
+    _prev_coeff = 1.0
+    _denom = 1.0
+
+    # Per-step telemetry sinks (see `stream_telemetry`)
+    _TELEMETRY = ("mirror_force", "total_energy_field", "mirror_pos_history")
 
     def __post_init__(self) -> None:
+        self.backend = kernels.resolve_backend(self.backend)
+        self.dtype = field_dtype(self.dtype)
         self.x = np.linspace(0, self.nx * self.dx, self.nx)
-        self.phi = np.zeros(self.nx)
-        self.phi_prev = np.zeros(self.nx)
-        self.phi_next = np.zeros(self.nx)
+        self.phi = np.zeros(self.nx, dtype=self.dtype)
+        self.phi_prev = np.zeros(self.nx, dtype=self.dtype)
+        self.phi_next = np.zeros(self.nx, dtype=self.dtype)
+
+        self._scratch_a = np.empty(self.nx, dtype=self.dtype)
+        self._scratch_b = np.empty(self.nx, dtype=self.dtype)
+        self._phi_sq = np.empty(self.nx, dtype=self.dtype)
+        if self.backend == "spectral":
+            self._spectral = SineSpectralPropagator(self.nx - 2, self.dx)
+        if self.absorber is not None:
+            self._boundary = BoundaryAbsorber(self.absorber, self.nx, self.dx)
+        self.integrator = resolve_integrator(self.integrator)
+        if self.integrator != "leapfrog":
+            if self._spectral is not None or self._boundary is not None:
+                raise ValueError(
+                    f"the {self.integrator} integrator needs a finite-difference backend without absorbers"
+                )
+            self._composer = Yoshida4(self.nx, self.dtype)
+        if self.watchdog is not None:
+            self._monitor = BlowupMonitor(self.watchdog)
 
     def seed_vacuum_noise(self, *, seed: int = 42, sigma: float = 0.001) -> None:
         rng = np.random.default_rng(seed)
-        self.phi = rng.normal(0.0, sigma, self.nx)
-        self.phi_prev = np.copy(self.phi)
-
-    def step(self, *, dt: float, c: float, v_potential: np.ndarray) -> None:
-        """Advance the field one timestep and record force/energy telemetry."""
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-        interaction = v_potential * self.phi
-
-        self.phi_next = 2 * self.phi - self.phi_prev + (dt**2) * (
-            (c**2) * laplacian - interaction
+        self.load_field(rng.normal(0.0, sigma, self.nx))
+
+    def load_field(self, phi: np.ndarray, phi_prev: Optional[np.ndarray] = None) -> None:
+        """Set the current field (and previous, default: at rest) in the chamber dtype."""
+        self.phi = np.array(phi, dtype=self.dtype)
+        self.phi_prev = np.array(phi if phi_prev is None else phi_prev, dtype=self.dtype)
+        self._prev_at_rest = phi_prev is None
+        if self._boundary is not None:
+            self._boundary.reset()
+        if self._composer is not None:
+            self._composer.reset()
+        if self._monitor is not None:
+            self._monitor.reset()
+
+    def max_stable_dt(self, *, c: float, v_max: float = 0.0) -> float:
+        """Largest stable dt of this chamber for potentials up to `v_max`."""
+        return max_stable_dt(
+            dx=self.dx,
+            c=c,
+            v_max=v_max,
+            integrator=self.integrator,
+            backend=self.backend,
+            absorber=None if self.absorber is None else self.absorber.kind,
         )
 
+    def stream_telemetry(self, directory: str) -> None:
+        """Record per-step telemetry into memory-mapped files under `directory`."""
+        for name in self._TELEMETRY:
+            sink = make_sink("memmap", directory=directory, name=name)
+            sink.extend(getattr(self, name))
+            setattr(self, name, sink)
+
+    def close_telemetry(self) -> None:
+        for name in self._TELEMETRY:
+            getattr(self, name).close()
+
+    def checkpoint_state(self) -> Dict[str, np.ndarray]:
+        """Arrays needed to continue this chamber bit-exactly (see `core.checkpoint`).
+
+        Telemetry entries are views of the sinks, valid until the next step.
+        """
+        state = {
+            "phi": self.phi.copy(),
+            "phi_prev": self.phi_prev.copy(),
+            "step_index": np.array(self.step_index),
+        }
+        state.update({name: getattr(self, name).view() for name in self._TELEMETRY})
+        if self._boundary is not None:
+            state["absorber_psi"] = self._boundary.psi.copy()
+        if self._composer is not None and self._composer.started:
+            state["velocity"] = self._composer.velocity.copy()
+        return state
+
+    def restore_state(self, state: Dict[str, np.ndarray]) -> None:
+        """Inverse of `checkpoint_state`."""
+        if state["phi"].shape != (self.nx,):
+            raise ValueError(f"checkpoint field has shape {state['phi'].shape}, chamber has nx={self.nx}")
+        self.load_field(state["phi"], state["phi_prev"])
+        self.step_index = int(state["step_index"])
+        for name in self._TELEMETRY:
+            sink = getattr(self, name)
+            sink.clear()
+            sink.extend(state[name])
+        if self._boundary is not None:
+            self._boundary.psi[:] = state["absorber_psi"]
+        if self._composer is not None and "velocity" in state:
+            self._composer.set_velocity(state["velocity"])
+
+    def _gradient_into(
+        self, f: np.ndarray, out: np.ndarray, lo: int = 0, hi: Optional[int] = None
+    ) -> np.ndarray:
+        """Write `np.gradient(f, dx)[lo:hi]` into `out[lo:hi]` (same operation order, no temporaries)."""
+        n = len(f)
+        hi = n if hi is None else hi
+        a, b = max(lo, 1), min(hi, n - 1)
+        if a < b:
+            np.subtract(f[a + 1 : b + 1], f[a - 1 : b - 1], out=out[a:b])
+            np.divide(out[a:b], 2.0 * self.dx, out=out[a:b])
+        if lo == 0:
+            out[0] = (f[1] - f[0]) / self.dx
+        if hi == n:
+            out[-1] = (f[-1] - f[-2]) / self.dx
+        return out
+
+    def _wave_rhs_into(
+        self,
+        *,
+        c: float,
+        v_potential: np.ndarray,
+        out: np.ndarray,
+        v_window: Optional[slice] = None,
+        phi: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Write `c²∇²φ - Vφ` for the interior cells into `out[1:-1]`.
+
+        Matches `(roll(φ,-1) - 2φ + roll(φ,1)) / dx²` bit-for-bit on the
+        interior; the wrapped edge cells are never used because the hard
+        walls overwrite them. `v_window` declares V exactly zero outside
+        that slice, so the interaction is only applied there. `phi`
+        defaults to the current field.
+        """
+        phi = self.phi if phi is None else phi
+        rhs = out[1:-1]
+
+        np.multiply(phi[1:-1], 2, out=rhs)
+        np.subtract(phi[2:], rhs, out=rhs)
+        np.add(rhs, phi[:-2], out=rhs)
+        np.divide(rhs, self.dx**2, out=rhs)
+        np.multiply(rhs, c**2, out=rhs)
+
+        lo, hi = self._interaction_bounds(v_window)
+        if lo < hi:
+            tmp = np.multiply(v_potential[lo:hi], phi[lo:hi], out=self._scratch_b[lo:hi])
+            np.subtract(out[lo:hi], tmp, out=out[lo:hi])
+        return out
+
+    def _interaction_into(
+        self,
+        *,
+        v_potential: np.ndarray,
+        phi: np.ndarray,
+        out: np.ndarray,
+        v_window: Optional[slice] = None,
+    ) -> np.ndarray:
+        """Write the potential kick `-V·phi` for the interior cells into `out[1:-1]`."""
+        lo, hi = self._interaction_bounds(v_window)
+        if v_window is not None:
+            out[1:-1] = 0.0
+        if lo < hi:
+            np.multiply(v_potential[lo:hi], phi[lo:hi], out=out[lo:hi])
+            np.negative(out[lo:hi], out=out[lo:hi])
+        return out
+
+    def _interaction_bounds(self, v_window: Optional[slice]) -> Tuple[int, int]:
+        """Interior cells where V may be non-zero."""
+        lo, hi = 1, self.nx - 1
+        if v_window is not None:
+            window_lo, window_hi = self._support_bounds(v_window)
+            lo, hi = max(lo, window_lo), min(hi, window_hi)
+        return lo, hi
+
+    def _support_bounds(self, support: Optional[slice]) -> Tuple[int, int]:
+        if support is None:
+            return 0, self.nx
+        lo, hi, _ = support.indices(self.nx)
+        return lo, max(lo, hi)
+
+    def _mirror_force(
+        self,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> float:
+        """Back-reaction force -∫ φ² ∂V/∂x dx for the current field.
+
+        With a `support` window only those cells are summed, turning the
+        O(nx) reduction into O(window); `_phi_sq` is then only valid there.
+        `grad_v`, if given, is used instead of differentiating `v_potential`.
+        """
+        lo, hi = self._support_bounds(support)
+        if grad_v is None:
+            grad_v = self._gradient_into(v_potential, self._scratch_b, lo, hi)
+        phi = self.phi[lo:hi]
+        phi_sq = np.multiply(phi, phi, out=self._phi_sq[lo:hi])
+        weighted = np.multiply(phi_sq, grad_v[lo:hi], out=self._scratch_b[lo:hi])
+        return -float(np.sum(weighted, dtype=np.float64) * self.dx)
+
+    def _separable_force(self, potential: "SeparablePotential", coefficients: np.ndarray) -> float:
+        """Back-reaction force `-dx·Σ_k g_k·Σφ²∂p_k` for a separable potential.
+
+        Also stores `profile_overlap` (Σφ²p_k) for switching-work accounting.
+        """
+        lo, hi = self._support_bounds(potential.support())
+        phi = self.phi[lo:hi]
+        phi_sq = np.multiply(phi, phi, out=self._phi_sq[lo:hi])
+        self.profile_overlap, gradient_overlap = potential.overlaps(phi_sq)
+        return -float(coefficients @ gradient_overlap) * self.dx
+
+    def _field_energy(self, *, dt: float, c: float, v_potential: np.ndarray) -> float:
+        """Total field energy; expects `_phi_sq` to hold φ² for the current field."""
+        dphi_dt = self._scratch_a
+        np.subtract(self.phi_next, self.phi_prev, out=dphi_dt)
+        np.divide(dphi_dt, 2 * dt, out=dphi_dt)
+        np.multiply(dphi_dt, dphi_dt, out=dphi_dt)
+
+        dphi_dx = self._gradient_into(self.phi, self._scratch_b)
+        np.multiply(dphi_dx, dphi_dx, out=dphi_dx)
+        np.multiply(dphi_dx, c**2, out=dphi_dx)
+        np.add(dphi_dt, dphi_dx, out=dphi_dt)
+
+        np.multiply(v_potential, self._phi_sq, out=dphi_dx)
+        np.add(dphi_dt, dphi_dx, out=dphi_dt)
+        return 0.5 * float(np.sum(dphi_dt, dtype=np.float64) * self.dx)
+
+    def _diagnose(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> Tuple[float, Optional[float]]:
+        """Evaluate telemetry for the step just computed into `phi_next`.
+
+        Returns (force, energy); energy is None on steps the diagnostics
+        policy does not sample. Advances `step_index`.
+        """
+        force = self._mirror_force(v_potential, support, grad_v)
+        energy = None
+        if self.diagnostics.samples_energy(self.step_index):
+            if support is not None:
+                np.multiply(self.phi, self.phi, out=self._phi_sq)
+            energy = self._field_energy(dt=dt, c=c, v_potential=v_potential)
+        self.step_index += 1
+        return force, energy
+
+    def _record(self, force: float, energy: Optional[float]) -> None:
+        self.mirror_force.append(force)
+        if energy is not None:
+            self.total_energy_field.append(energy)
+
+    def _rotate_buffers(self) -> None:
+        """Swap the three field buffers by reference; steps allocate no grid-sized arrays."""
+        self.phi_prev, self.phi, self.phi_next = self.phi, self.phi_next, self.phi_prev
+
+    def _watch(self) -> None:
+        if self._monitor is not None:
+            self._monitor.observe(self.step_index, self.phi)
+
+    def _update_field(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        v_window: Optional[slice] = None,
+    ) -> None:
+        """Write the leapfrog update of the current field into `phi_next`."""
+        if self._spectral is not None:
+            self._update_field_spectral(dt=dt, c=c, v_potential=v_potential, v_window=v_window)
+            return
+        if self._composer is not None:
+            self._update_field_composed(dt=dt, c=c)
+            return
+
+        rhs = self._wave_rhs_into(
+            c=c, v_potential=v_potential, out=self._scratch_a, v_window=v_window
+        )[1:-1]
+        np.multiply(rhs, dt**2, out=rhs)
+
+        inner = self.phi_next[1:-1]
+        np.multiply(self.phi[1:-1], 2, out=inner)
+        np.subtract(inner, self.phi_prev[1:-1], out=inner)
+        np.add(inner, rhs, out=inner)
+
         # Hard-wall boundaries
         self.phi_next[0] = 0.0
         self.phi_next[-1] = 0.0
 
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
+    def _update_field_spectral(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        v_window: Optional[slice] = None,
+        noise: Optional[np.ndarray] = None,
+        gamma: float = 0.0,
+    ) -> None:
+        """Write the pseudo-spectral update into `phi_next`, kicking by -Vφ̃ (+ `noise`)."""
+        spectral = self._spectral
+        if self._prev_at_rest:
+            spectral.at_rest_previous(self.phi[1:-1], self.phi_prev[1:-1], dt=dt, c=c, gamma=gamma)
+            self._prev_at_rest = False
+
+        filtered = self._scratch_b
+        filtered[1:-1] = spectral.filtered_field(self.phi[1:-1], dt=dt, c=c, gamma=gamma)
+        forcing = self._interaction_into(
+            v_potential=v_potential, phi=filtered, out=self._scratch_a, v_window=v_window
+        )[1:-1]
+        if noise is not None:
+            np.add(forcing, noise, out=forcing)
+        spectral.advance(forcing, self.phi_prev[1:-1], self.phi_next[1:-1])
+        self.phi_next[0] = 0.0
+        self.phi_next[-1] = 0.0
+
+    def _update_field_composed(
+        self,
+        *,
+        dt: float,
+        c: float,
+        noise: Optional[np.ndarray] = None,
+        gamma: float = 0.0,
+    ) -> None:
+        """Write the composed-integrator step into `phi_next`, taking the
+        potential from the schedule `run` is driving."""
+        potential_at = self._potential_at
+        if potential_at is None:
+            raise ValueError(
+                f"the {self.integrator} integrator evaluates the potential between steps; "
+                "drive it through run()"
+            )
+
+        def rhs(step: float, phi: np.ndarray, out: np.ndarray) -> np.ndarray:
+            v_potential, v_window = potential_at(step)
+            return self._wave_rhs_into(
+                c=c, v_potential=v_potential, out=out, v_window=v_window, phi=phi
+            )
+
+        composer = self._composer
+        step = self.step_index
+        if not composer.started:
+            phi_prev = None if self._prev_at_rest else self.phi_prev
+            composer.start(self.phi, phi_prev, rhs, step=step, dt=dt, gamma=gamma)
+            self._prev_at_rest = False
+        composer.advance(self.phi, self.phi_next, rhs, step=step, dt=dt, gamma=gamma, noise=noise)
+        # Schedules evaluate into reused buffers: put back this step's potential for the diagnostics
+        potential_at(step)
+
+    def _absorb(self, *, dt: float, c: float) -> None:
+        """Apply the absorbing layers to the update just written into `phi_next`."""
+        boundary = self._boundary
+        # The spectral update has no leapfrog denominator; its damping is exact
+        denom = 1.0 if self._spectral is not None else self._denom
+        if self.backend == "numba":
+            keep, prev, mass, aux, decay, drive = boundary.coefficients(dt=dt, c=c, denom=denom)
+            kernels.absorb_layers(
+                self.phi,
+                self.phi_prev,
+                self.phi_next,
+                boundary.cells,
+                keep,
+                prev,
+                mass,
+                aux,
+                boundary.psi,
+                decay,
+                drive,
+            )
+        else:
+            boundary.apply(self.phi, self.phi_prev, self.phi_next, dt=dt, c=c, denom=denom)
 
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
+    def _thermal_kick(self) -> np.ndarray:
+        """Interior noise force for this step, or `kernels.NO_NOISE`."""
+        return kernels.NO_NOISE
+
+    def _advance_fused(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> Tuple[float, Optional[float]]:
+        """`_advance` through the single-pass compiled kernel.
+
+        With absorbing layers the energy is evaluated after the layer
+        correction rather than inside the kernel.
+        """
+        want_energy = self.diagnostics.samples_energy(self.step_index)
+        kernel_energy = want_energy and self._boundary is None
+        force_lo, force_hi = self._support_bounds(support)
+        force, energy = kernels.fused_step(
+            self.phi,
+            self.phi_prev,
+            self.phi_next,
+            v_potential,
+            kernels.NO_GRADIENT if grad_v is None else grad_v,
+            self._thermal_kick(),
+            self.dx,
+            dt,
+            c,
+            self._prev_coeff,
+            self._denom,
+            force_lo,
+            force_hi,
+            kernel_energy,
+        )
+        if self._boundary is not None:
+            self._absorb(dt=dt, c=c)
+            if want_energy:
+                np.multiply(self.phi, self.phi, out=self._phi_sq)
+                energy = self._field_energy(dt=dt, c=c, v_potential=v_potential)
+        self.step_index += 1
+
+        self._rotate_buffers()
+        self._watch()
+        return force, (energy if want_energy else None)
+
+    def _advance(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> Tuple[float, Optional[float]]:
+        """Advance the field one timestep and return (force, energy)."""
+        if self.backend == "numba" and self._composer is None:
+            return self._advance_fused(
+                dt=dt, c=c, v_potential=v_potential, support=support, grad_v=grad_v
+            )
+
+        self._update_field(dt=dt, c=c, v_potential=v_potential)
+        if self._boundary is not None:
+            self._absorb(dt=dt, c=c)
+        diagnostics = self._diagnose(
+            dt=dt, c=c, v_potential=v_potential, support=support, grad_v=grad_v
         )
-        self.total_energy_field.append(energy)
 
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
+        self._rotate_buffers()
+        self._watch()
+        return diagnostics
+
+    def _advance_separable(
+        self,
+        *,
+        dt: float,
+        c: float,
+        potential: "SeparablePotential",
+        coefficients: Sequence[float],
+    ) -> Tuple[float, Optional[float]]:
+        """`_advance` for `V = Σ_k g_k·p_k`: the force comes from two small
+        products over the support and the interaction touches only the
+        support window."""
+        g = potential.coefficients(*coefficients)
+        v_potential = potential.potential(*g)
+        force = self._separable_force(potential, g)
+
+        if self.backend == "numba" and self._composer is None:
+            _, energy = self._advance_fused(
+                dt=dt, c=c, v_potential=v_potential, support=slice(0, 0)
+            )
+            return force, energy
+
+        self._update_field(dt=dt, c=c, v_potential=v_potential, v_window=potential.support())
+        if self._boundary is not None:
+            self._absorb(dt=dt, c=c)
+        energy = None
+        if self.diagnostics.samples_energy(self.step_index):
+            np.multiply(self.phi, self.phi, out=self._phi_sq)
+            energy = self._field_energy(dt=dt, c=c, v_potential=v_potential)
+        self.step_index += 1
+
+        self._rotate_buffers()
+        self._watch()
+        return force, energy
+
+    def step_separable(
+        self,
+        *,
+        dt: float,
+        c: float,
+        potential: "SeparablePotential",
+        coefficients: Sequence[float],
+    ) -> None:
+        """`step` for a separable potential `Σ_k coefficients[k]·p_k`."""
+        self._record(
+            *self._advance_separable(dt=dt, c=c, potential=potential, coefficients=coefficients)
+        )
+
+    def step(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        support: Optional[slice] = None,
+        grad_v: Optional[np.ndarray] = None,
+    ) -> None:
+        """Advance the field one timestep and record force/energy telemetry.
+
+        `support`, if given, restricts the force reduction to the cells
+        where `v_potential` is non-negligible, and `grad_v` supplies dV/dx
+        analytically (see `core.potentials`).
+        """
+        self._record(
+            *self._advance(dt=dt, c=c, v_potential=v_potential, support=support, grad_v=grad_v)
+        )
+
+    def run(
+        self,
+        n_steps: int,
+        potential_schedule: PotentialSchedule,
+        *,
+        dt: float,
+        c: float,
+    ) -> ChamberTelemetry:
+        """Advance `n_steps` timesteps driven by `potential_schedule`.
+
+        The schedule is queried with absolute step indices, continuing from
+        `step_index`, so consecutive calls chain into one trajectory.
+        Telemetry is written into preallocated arrays and returned; the
+        per-step history lists on the chamber are left untouched. Only the
+        series named by `self.diagnostics.fills` are populated.
+
+        The "yoshida4" integrator evaluates the potential between steps, so
+        it only runs through here. With a watchdog, dt is first checked
+        against `max_stable_dt` when the schedule bounds its potential.
+        """
+        if self.watchdog is not None:
+            v_max = peak_potential(potential_schedule, self.step_index, n_steps)
+            if v_max is not None:
+                self.watchdog.check_dt(dt, self.max_stable_dt(c=c, v_max=v_max), step=self.step_index)
+        if self._composer is None:
+            return self._run(n_steps, potential_schedule, dt=dt, c=c)
+        self._potential_at = self._schedule_potential(potential_schedule)
+        try:
+            return self._run(n_steps, potential_schedule, dt=dt, c=c)
+        finally:
+            self._potential_at = None
+
+    @staticmethod
+    def _schedule_potential(
+        potential_schedule: PotentialSchedule,
+    ) -> Callable[[float], Tuple[np.ndarray, Optional[slice]]]:
+        """The schedule's potential at a (fractional) step, with its interaction window."""
+        separable = getattr(potential_schedule, "separable_potential", None)
+        if separable is not None:
+            window = separable.support()
+            return lambda step: (separable.potential(*potential_schedule.coefficients(step)), window)
+        return lambda step: (potential_schedule.potential(step), None)
+
+    def _run(
+        self,
+        n_steps: int,
+        potential_schedule: PotentialSchedule,
+        *,
+        dt: float,
+        c: float,
+    ) -> ChamberTelemetry:
+        start = self.step_index
+        force = np.empty(n_steps)
+        energy_step = self.diagnostics.energy_steps(start, n_steps)
+        energy = np.empty(len(energy_step))
+        n_energy = 0
+        mirror_position = getattr(potential_schedule, "mirror_position", None)
+        positions = np.empty(n_steps) if mirror_position is not None else None
+        support = getattr(potential_schedule, "support", None)
+        with_gradient = getattr(potential_schedule, "potential_and_gradient", None)
+        separable = getattr(potential_schedule, "separable_potential", None)
+        coefficient_table = getattr(potential_schedule, "coefficient_table", None)
+        if separable is not None and coefficient_table is not None:
+            coefficients = coefficient_table(start, n_steps)
+        elif separable is not None:
+            coefficients = [potential_schedule.coefficients(start + k) for k in range(n_steps)]
+
+        for k in range(n_steps):
+            if positions is not None:
+                positions[k] = mirror_position(start + k)
+            if separable is not None:
+                force[k], e = self._advance_separable(
+                    dt=dt, c=c, potential=separable, coefficients=coefficients[k]
+                )
+                if e is not None:
+                    energy[n_energy] = e
+                    n_energy += 1
+                continue
+            if with_gradient is not None:
+                v_potential, grad_v = with_gradient(start + k)
+            else:
+                v_potential, grad_v = potential_schedule.potential(start + k), None
+            force[k], e = self._advance(
+                dt=dt,
+                c=c,
+                v_potential=v_potential,
+                support=support(start + k) if support is not None else None,
+                grad_v=grad_v,
+            )
+            if e is not None:
+                energy[n_energy] = e
+                n_energy += 1
+
+        return ChamberTelemetry(
+            dt=dt,
+            mirror_force=force,
+            total_energy_field=energy,
+            energy_step=energy_step,
+            mirror_pos=positions,
+        )
@@ -6,7 +6,8 @@ from typing import Optional
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.schedules import GaussianMirrorSchedule
+from core.vacuum_chamber import DiagnosticsPolicy, VacuumChamber
 from flight_recorder.mission_logger import FlightRecorder
 
 
@@ -45,22 +46,20 @@ def run(*, seed: int = 42, cfg: Optional[Experiment1Config] = None) -> str:
         flight.log_metric("DX", cfg.dx)
         flight.log_metric("DT", cfg.dt)
 
-        chamber = VacuumChamber(cfg.grid_size, cfg.dx)
+        chamber = VacuumChamber(cfg.grid_size, cfg.dx, DiagnosticsPolicy.force_only())
         chamber.seed_vacuum_noise(seed=seed, sigma=0.001)
 
-        v_potentials_last = None
-        for t in range(cfg.time_steps):
-            x_center = mirror_position(t_step=t, total_steps=cfg.time_steps, cfg=cfg)
-            chamber.mirror_pos_history.append(x_center)
-
-            V = cfg.mirror_height * np.exp(
-                -((chamber.x - x_center) ** 2) / (2 * cfg.mirror_width**2)
-            )
-            v_potentials_last = V
-            chamber.step(dt=cfg.dt, c=cfg.c, v_potential=V)
+        schedule = GaussianMirrorSchedule(
+            x=chamber.x,
+            height=cfg.mirror_height,
+            width=cfg.mirror_width,
+            position=lambda t: mirror_position(t_step=t, total_steps=cfg.time_steps, cfg=cfg),
+        )
+        telemetry = chamber.run(cfg.time_steps, schedule, dt=cfg.dt, c=cfg.c)
+        v_potentials_last = np.copy(schedule.potential(cfg.time_steps - 1))
 
         times = np.linspace(0, cfg.time_steps * cfg.dt, cfg.time_steps)
-        force_arr = np.asarray(chamber.mirror_force)
+        force_arr = telemetry.mirror_force
         # NumPy 2.x removed np.trapz; use trapezoid and keep a fallback.
         integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
         net_impulse = float(integrate(force_arr, dx=cfg.dt))
@@ -74,14 +73,13 @@ def run(*, seed: int = 42, cfg: Optional[Experiment1Config] = None) -> str:
 
         ax1.set_title("The Quantum Wake: Field Excitations emitted by Jerk")
         ax1.plot(chamber.x, chamber.phi, label="Vacuum Field (Phi)")
-        if v_potentials_last is not None:
-            ax1.plot(chamber.x, v_potentials_last / 10.0, linestyle="--", label="Mirror Position (scaled)")
+        ax1.plot(chamber.x, v_potentials_last / 10.0, linestyle="--", label="Mirror Position (scaled)")
         ax1.legend()
         ax1.set_ylim(-0.05, 0.05)
 
         ax2.set_title("Thrust vs. Time")
-        ax2.plot(times, chamber.mirror_force, label="Back-Reaction Force")
-        ax2.plot(times, np.gradient(chamber.mirror_pos_history), alpha=0.5, label="Mirror Velocity")
+        ax2.plot(times, force_arr, label="Back-Reaction Force")
+        ax2.plot(times, np.gradient(telemetry.mirror_pos), alpha=0.5, label="Mirror Velocity")
         ax2.axhline(0, linewidth=0.5)
         ax2.legend()
 
@@ -6,7 +6,9 @@ from typing import Optional
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.drives import sawtooth_displacement
+from core.schedules import GaussianMirrorSchedule
+from core.vacuum_chamber import DiagnosticsPolicy, VacuumChamber
 from flight_recorder.mission_logger import FlightRecorder
 
 
@@ -27,25 +29,15 @@ class Experiment2Config:
     fall_time: int = 1000
 
 
-def _smoothstep(progress: float) -> float:
-    # 3x^2 - 2x^3
-    return (3.0 * progress**2) - (2.0 * progress**3)
-
-
-def mirror_displacement(*, t: int, cfg: Experiment2Config) -> float:
-    """Sawtooth: fast-out then slow-back with smooth corners."""
-    if t < cfg.start_time:
-        return 0.0
-
-    if t < cfg.start_time + cfg.rise_time:
-        progress = (t - cfg.start_time) / cfg.rise_time
-        return float(cfg.amplitude * _smoothstep(progress))
-
-    if t < cfg.start_time + cfg.rise_time + cfg.fall_time:
-        progress = (t - (cfg.start_time + cfg.rise_time)) / cfg.fall_time
-        return float(cfg.amplitude * (1.0 - _smoothstep(progress)))
-
-    return 0.0
+def mirror_displacement(cfg: Experiment2Config) -> np.ndarray:
+    """Sawtooth: fast-out then slow-back with smooth corners, one entry per step."""
+    return sawtooth_displacement(
+        cfg.time_steps,
+        amplitude=cfg.amplitude,
+        start_time=cfg.start_time,
+        rise_time=cfg.rise_time,
+        fall_time=cfg.fall_time,
+    )
 
 
 def run(*, seed: int = 42, cfg: Optional[Experiment2Config] = None) -> str:
@@ -59,23 +51,19 @@ def run(*, seed: int = 42, cfg: Optional[Experiment2Config] = None) -> str:
         flight.log_metric("DT", cfg.dt)
         flight.log_metric("Amplitude", cfg.amplitude)
 
-        sim = VacuumChamber(cfg.grid_size, cfg.dx)
+        sim = VacuumChamber(cfg.grid_size, cfg.dx, DiagnosticsPolicy.force_only())
         sim.seed_vacuum_noise(seed=seed, sigma=0.001)
 
-        v_potentials_last = None
-        for t in range(cfg.time_steps):
-            displacement = mirror_displacement(t=t, cfg=cfg)
-            x_center = (cfg.grid_size / 2.0) * cfg.dx + displacement
-            sim.mirror_pos_history.append(float(x_center))
-
-            V = cfg.mirror_height * np.exp(
-                -((sim.x - x_center) ** 2) / (2 * cfg.mirror_width**2)
-            )
-            v_potentials_last = V
-
-            sim.step(dt=cfg.dt, c=cfg.c, v_potential=V)
+        schedule = GaussianMirrorSchedule(
+            x=sim.x,
+            height=cfg.mirror_height,
+            width=cfg.mirror_width,
+            position=(cfg.grid_size / 2.0) * cfg.dx + mirror_displacement(cfg),
+        )
+        telemetry = sim.run(cfg.time_steps, schedule, dt=cfg.dt, c=cfg.c)
+        v_potentials_last = np.copy(schedule.potential(cfg.time_steps - 1))
 
-        force_arr = np.asarray(sim.mirror_force)
+        force_arr = telemetry.mirror_force
         integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
         net_impulse = float(integrate(force_arr, dx=cfg.dt))
 
@@ -89,14 +77,13 @@ def run(*, seed: int = 42, cfg: Optional[Experiment2Config] = None) -> str:
 
         ax1.set_title("Vacuum Wake State (Final)")
         ax1.plot(sim.x, sim.phi, linewidth=1)
-        if v_potentials_last is not None:
-            ax1.plot(sim.x, v_potentials_last / 10.0, linestyle="--")
+        ax1.plot(sim.x, v_potentials_last / 10.0, linestyle="--")
 
         ax2.set_title("Mirror Trajectory (Sawtooth)")
-        ax2.plot(sim.mirror_pos_history)
+        ax2.plot(telemetry.mirror_pos)
 
         ax3.set_title(f"Force Budget (Net Impulse: {net_impulse:.2e})")
-        ax3.plot(sim.mirror_force, label="Vacuum Force")
+        ax3.plot(force_arr, label="Vacuum Force")
         ax3.axhline(0, linewidth=0.5, linestyle="--")
         ax3.legend()
 
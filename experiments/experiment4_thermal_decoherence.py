@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy.typing import DTypeLike
 
-from core.vacuum_chamber import VacuumChamber
+from core import kernels
+from core.noise import SeedLike, make_noise_stream, spawn_seeds
+from core.parallel import sweep_map
+from core.schedules import GaussianMirrorSchedule
+from core.vacuum_chamber import DiagnosticsPolicy, VacuumChamber
 from flight_recorder.mission_logger import FlightRecorder
 
 
@@ -18,49 +24,38 @@ class NoisyVacuumChamber(VacuumChamber):
     where ξ(t) is Gaussian white noise representing thermal phonon coupling.
     """
     
-    def __init__(self, nx: int, dx: float, noise_amplitude: float = 0.0):
-        super().__init__(nx, dx)
+    def __init__(
+        self,
+        nx: int,
+        dx: float,
+        noise_amplitude: float = 0.0,
+        diagnostics: DiagnosticsPolicy = DiagnosticsPolicy(),
+        noise_seed: SeedLike = None,
+        dtype: DTypeLike = np.float64,
+    ):
+        super().__init__(nx, dx, diagnostics, dtype=dtype)
         self.noise_amp = noise_amplitude
-
-    def step(self, *, dt: float, c: float, v_potential: np.ndarray) -> None:
-        """Advance field one timestep with thermal noise injection."""
-        # 1. Deterministic wave equation update
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-        interaction = v_potential * self.phi
-
-        self.phi_next = 2 * self.phi - self.phi_prev + (dt**2) * (
-            (c**2) * laplacian - interaction
-        )
-
-        # 2. INJECT THERMAL NOISE (stochastic Langevin kick)
+        self.noise = make_noise_stream(nx - 2, noise_amplitude, noise_seed)
+
+    def _thermal_kick(self) -> np.ndarray:
+        return self.noise.next() if self.noise is not None else kernels.NO_NOISE
+
+    def _update_field(
+        self,
+        *,
+        dt: float,
+        c: float,
+        v_potential: np.ndarray,
+        v_window: Optional[slice] = None,
+    ) -> None:
+        """Deterministic wave equation update plus the thermal noise kick."""
+        super()._update_field(dt=dt, c=c, v_potential=v_potential, v_window=v_window)
+
+        # INJECT THERMAL NOISE (stochastic Langevin kick)
         # Simulates coupling to thermal phonon bath at temperature T
-        if self.noise_amp > 0:
-            thermal_kick = np.random.normal(0, self.noise_amp, self.nx) * (dt**2)
-            self.phi_next += thermal_kick
-
-        # 3. Boundary conditions
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-
-        # 4. Calculate force (back-reaction)
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
-
-        # 5. Calculate field energy
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
-        )
-        self.total_energy_field.append(energy)
-
-        # Cycle buffers
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
+        if self.noise is not None:
+            thermal_kick = np.multiply(self._thermal_kick(), dt**2, out=self._scratch_a[1:-1])
+            np.add(self.phi_next[1:-1], thermal_kick, out=self.phi_next[1:-1])
 
 
 @dataclass(frozen=True)
@@ -85,9 +80,49 @@ class Experiment4Config:
     temp_max: float = 0.05
     temp_steps: int = 10
 
-
-def _smoothstep(progress: float) -> float:
-    return (3.0 * progress**2) - (2.0 * progress**3)
+    # Field precision ("float32" halves memory traffic; check with core.precision)
+    field_dtype: str = "float64"
+
+    workers: int = 0  # see core.parallel.sweep_workers
+
+
+def _temperature_point(
+    point: Tuple[int, float], *, cfg: Experiment4Config, seed: int
+) -> Tuple[float, np.ndarray]:
+    """(net impulse, final field) of sweep point `(i, temp)`, seeded from `seed + i`."""
+    i, temp = point
+    # Initialize noisy chamber with current temperature
+    sim = NoisyVacuumChamber(
+        cfg.grid_size,
+        cfg.dx,
+        noise_amplitude=float(temp),
+        diagnostics=DiagnosticsPolicy.force_only(),
+        noise_seed=spawn_seeds(seed + i, 1)[0],
+        dtype=cfg.field_dtype,
+    )
+
+    # Seed vacuum with ZPF baseline + slight variation per run
+    rng = np.random.default_rng(seed + i)
+    sim.load_field(rng.normal(0, 0.001, cfg.grid_size))
+
+    # Run simulation with thermal noise along the precomputed sawtooth
+    schedule = GaussianMirrorSchedule.sawtooth(
+        sim.x,
+        cfg.time_steps,
+        height=cfg.mirror_height_solid,
+        width=cfg.mirror_width,
+        centre=(cfg.grid_size / 2.0) * cfg.dx,
+        amplitude=cfg.amplitude,
+        start_time=cfg.start_time,
+        rise_time=cfg.rise_time,
+        fall_time=cfg.fall_time,
+    )
+    telemetry = sim.run(cfg.time_steps, schedule, dt=cfg.dt, c=cfg.c)
+
+    # Measure net impulse (rectified thrust)
+    force_arr = telemetry.mirror_force
+    integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
+    return float(integrate(force_arr, dx=cfg.dt)), sim.phi
 
 
 def run(*, seed: int = 42, cfg: Optional[Experiment4Config] = None) -> str:
@@ -110,54 +145,10 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4Config] = None) -> str:
         
         print(f"Starting Thermal Stress Test on {len(temp_levels)} setpoints...")
 
-        for i, temp in enumerate(temp_levels):
-            # Initialize noisy chamber with current temperature
-            sim = NoisyVacuumChamber(cfg.grid_size, cfg.dx, noise_amplitude=float(temp))
-
-            # Seed vacuum with ZPF baseline + slight variation per run
-            rng = np.random.default_rng(seed + i)
-            sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-            sim.phi_prev = np.copy(sim.phi)
-
-            # Run simulation loop with thermal noise
-            for t in range(cfg.time_steps):
-                # Sawtooth trajectory with coupling modulation
-                coupling = 1.0
-                displacement = 0.0
-
-                if t < cfg.start_time:
-                    displacement = 0.0
-                    coupling = 1.0
-                elif t < cfg.start_time + cfg.rise_time:
-                    # FAST OUT (Slip - low coupling)
-                    progress = (t - cfg.start_time) / cfg.rise_time
-                    displacement = cfg.amplitude * _smoothstep(progress)
-                    coupling = 0.1
-                elif t < cfg.start_time + cfg.rise_time + cfg.fall_time:
-                    # SLOW BACK (Grip - high coupling)
-                    progress = (t - (cfg.start_time + cfg.rise_time)) / cfg.fall_time
-                    displacement = cfg.amplitude * (1.0 - _smoothstep(progress))
-                    coupling = 1.0
-                else:
-                    displacement = 0.0
-                    coupling = 1.0
-
-                x_center = (cfg.grid_size / 2.0) * cfg.dx + displacement
-                sim.mirror_pos_history.append(float(x_center))
-
-                # Modulate potential (grip/slip)
-                V_amp = cfg.mirror_height_solid * coupling
-                V = V_amp * np.exp(
-                    -((sim.x - x_center) ** 2) / (2 * cfg.mirror_width**2)
-                )
-
-                # Step physics (now with thermal noise)
-                sim.step(dt=cfg.dt, c=cfg.c, v_potential=V)
-
-            # Measure net impulse (rectified thrust)
-            force_arr = np.asarray(sim.mirror_force)
-            integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
-            net_impulse = float(integrate(force_arr, dx=cfg.dt))
+        points = sweep_map(
+            partial(_temperature_point, cfg=cfg, seed=seed), enumerate(temp_levels), workers=cfg.workers
+        )
+        for temp, (net_impulse, field_state) in zip(temp_levels, points):
             thrust_results.append(net_impulse)
 
             status = "STABLE" if abs(net_impulse) > 1e-4 else "COLLAPSED"
@@ -205,7 +196,8 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4Config] = None) -> str:
         ax1.grid(True, alpha=0.3)
 
         # Plot 2: Vacuum State at Max Temperature
-        ax2.plot(sim.x, sim.phi, linewidth=0.8, label=f"Field State at T={cfg.temp_max:.4f}")
+        x = np.linspace(0, cfg.grid_size * cfg.dx, cfg.grid_size)
+        ax2.plot(x, field_state, linewidth=0.8, label=f"Field State at T={cfg.temp_max:.4f}")
         ax2.set_title("Vacuum Field State at Maximum Temperature")
         ax2.set_xlabel("Position x")
         ax2.set_ylabel("Field φ(x)")
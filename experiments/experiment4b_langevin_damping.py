@@ -1,96 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.langevin import LangevinVacuumChamber
+from core.noise import spawn_seeds
+from core.parallel import sweep_map
+from core.schedules import GaussianMirrorSchedule
+from core.vacuum_chamber import DiagnosticsPolicy
 from flight_recorder.mission_logger import FlightRecorder
 
 
-class LangevinVacuumChamber(VacuumChamber):
-    """Damped wave equation with Fluctuation-Dissipation Theorem compliance.
-    
-    Equation: d²φ/dt² + γ∂φ/∂t - c²∂²φ/∂x² = -V(x)φ + ξ(t)
-    
-    where ξ(t) obeys FDT: σ_noise = sqrt(2γkT/dt)
-    """
-    
-    def __init__(
-        self,
-        nx: int,
-        dx: float,
-        dt: float,
-        gamma: float = 0.01,
-        temperature: float = 0.0,
-    ):
-        super().__init__(nx, dx)
-        self.gamma = gamma
-        self.temp = temperature
-        self.dt = dt
-
-        # Calculate noise scale according to FDT
-        # σ = sqrt(2 * γ * k_B * T / dt)
-        # Assume k_B = 1.0 in simulation units
-        if self.temp > 0 and self.gamma > 0:
-            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
-        else:
-            self.noise_scale = 0.0
-
-    def step_damped(self, *, c: float, v_potential: np.ndarray) -> None:
-        """Advance field one timestep with damping and FDT-compliant noise."""
-        # 1. Laplacian
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-
-        # 2. Interaction
-        interaction = v_potential * self.phi
-
-        # 3. Thermal noise force (stochastic, FDT-linked)
-        noise = np.zeros(self.nx)
-        if self.noise_scale > 0:
-            noise = np.random.normal(0, self.noise_scale, self.nx)
-
-        # 4. Damped Verlet integration
-        # Solve: (φ_next - 2φ + φ_prev)/dt² + γ(φ_next - φ_prev)/(2dt) = Forces
-        # Rearranging for φ_next:
-        # φ_next(1 + γdt/2) = 2φ - φ_prev(1 - γdt/2) + dt²·Forces
-
-        forces = (c**2) * laplacian - interaction + noise
-
-        denom = 1.0 + (self.gamma * self.dt / 2.0)
-        term1 = 2.0 * self.phi
-        term2 = self.phi_prev * (1.0 - (self.gamma * self.dt / 2.0))
-        term3 = (self.dt**2) * forces
-
-        self.phi_next = (term1 - term2 + term3) / denom
-
-        # Boundary conditions
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-
-        # 5. Calculate force on mirror (back-reaction)
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
-
-        # 6. Calculate field energy
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * self.dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
-        )
-        self.total_energy_field.append(energy)
-
-        # Cycle buffers
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
-
-
 @dataclass(frozen=True)
 class Experiment4BConfig:
     grid_size: int = 1000
@@ -117,9 +41,48 @@ class Experiment4BConfig:
     # Statistical averaging
     sub_runs: int = 3
 
-
-def _smoothstep(progress: float) -> float:
-    return (3.0 * progress**2) - (2.0 * progress**3)
+    # Field precision ("float32" halves memory traffic; check with core.precision)
+    field_dtype: str = "float64"
+
+    workers: int = 0  # see core.parallel.sweep_workers
+
+
+def _sub_run(point: Tuple[int, int, float], *, cfg: Experiment4BConfig, seed: int) -> float:
+    """Net impulse of sub-run `sub` at temperature `temp`, seeded from `seed + i*100 + sub`."""
+    i, sub, temp = point
+    sim = LangevinVacuumChamber(
+        cfg.grid_size,
+        cfg.dx,
+        cfg.dt,
+        gamma=cfg.gamma,
+        temperature=temp,
+        diagnostics=DiagnosticsPolicy.force_only(),
+        noise_seed=spawn_seeds(seed + i * 100 + sub, 1)[0],
+        dtype=cfg.field_dtype,
+    )
+
+    # Seed vacuum with ZPF baseline + variation
+    rng = np.random.default_rng(seed + i * 100 + sub)
+    sim.load_field(rng.normal(0, 0.001, cfg.grid_size))
+
+    # Time evolution with damping along the precomputed sawtooth
+    schedule = GaussianMirrorSchedule.sawtooth(
+        sim.x,
+        cfg.time_steps,
+        height=cfg.mirror_height_solid,
+        width=cfg.mirror_width,
+        centre=(cfg.grid_size / 2.0) * cfg.dx,
+        amplitude=cfg.amplitude,
+        start_time=cfg.start_time,
+        rise_time=cfg.rise_time,
+        fall_time=cfg.fall_time,
+    )
+    telemetry = sim.run(cfg.time_steps, schedule, c=cfg.c)
+
+    # Measure net impulse
+    force_arr = telemetry.mirror_force
+    integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
+    return float(integrate(force_arr, dx=cfg.dt))
 
 
 def run(*, seed: int = 42, cfg: Optional[Experiment4BConfig] = None) -> str:
@@ -145,67 +108,13 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4BConfig] = None) -> str:
 
         print(f"Igniting Damped Thermal Test with Gamma={cfg.gamma}...")
 
-        for i, temp in enumerate(temp_levels):
-            # Run multiple sub-runs per temperature to compute statistics
-            # (thermal noise causes jitter in the impulse measurement)
-            batch_impulses = []
-
-            for sub in range(cfg.sub_runs):
-                sim = LangevinVacuumChamber(
-                    cfg.grid_size,
-                    cfg.dx,
-                    cfg.dt,
-                    gamma=cfg.gamma,
-                    temperature=float(temp),
-                )
-
-                # Seed vacuum with ZPF baseline + variation
-                rng = np.random.default_rng(seed + i * 100 + sub)
-                sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-                sim.phi_prev = np.copy(sim.phi)
-
-                # Time evolution loop
-                for t in range(cfg.time_steps):
-                    # Sawtooth trajectory with coupling modulation
-                    coupling = 1.0
-                    displacement = 0.0
-
-                    if t < cfg.start_time:
-                        displacement = 0.0
-                        coupling = 1.0
-                    elif t < cfg.start_time + cfg.rise_time:
-                        # FAST OUT (Slip - low coupling)
-                        progress = (t - cfg.start_time) / cfg.rise_time
-                        displacement = cfg.amplitude * _smoothstep(progress)
-                        coupling = 0.1
-                    elif t < cfg.start_time + cfg.rise_time + cfg.fall_time:
-                        # SLOW BACK (Grip - high coupling)
-                        progress = (
-                            t - (cfg.start_time + cfg.rise_time)
-                        ) / cfg.fall_time
-                        displacement = cfg.amplitude * (1.0 - _smoothstep(progress))
-                        coupling = 1.0
-                    else:
-                        displacement = 0.0
-                        coupling = 1.0
-
-                    x_center = (cfg.grid_size / 2.0) * cfg.dx + displacement
-                    sim.mirror_pos_history.append(float(x_center))
-
-                    # Modulate potential (grip/slip)
-                    V_amp = cfg.mirror_height_solid * coupling
-                    V = V_amp * np.exp(
-                        -((sim.x - x_center) ** 2) / (2 * cfg.mirror_width**2)
-                    )
-
-                    # Step physics with damping
-                    sim.step_damped(c=cfg.c, v_potential=V)
-
-                # Measure net impulse
-                force_arr = np.asarray(sim.mirror_force)
-                integrate = getattr(np, "trapezoid", None) or getattr(np, "trapz")
-                net_impulse = float(integrate(force_arr, dx=cfg.dt))
-                batch_impulses.append(net_impulse)
+        # Every (temperature, sub-run) pair is an independent point; thermal
+        # noise causes jitter in the impulse measurement, hence the sub-runs
+        points = [(i, sub, float(temp)) for i, temp in enumerate(temp_levels) for sub in range(cfg.sub_runs)]
+        impulses = sweep_map(partial(_sub_run, cfg=cfg, seed=seed), points, workers=cfg.workers)
+
+        for temp in temp_levels:
+            batch_impulses = [next(impulses) for _ in range(cfg.sub_runs)]
 
             # Compute statistics over sub-runs
             avg_impulse = float(np.mean(batch_impulses))
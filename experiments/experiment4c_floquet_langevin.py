@@ -1,103 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+from core.drives import harmonic_phases
+from core.ensemble_chamber import EnsembleLangevinChamber
+from core.potentials import TwoCouplerDrive
+from core.statistics import student_t_quantile
 from flight_recorder.mission_logger import FlightRecorder
 
 
-class FloquetLangevinChamber:
-    """Floquet pump with FDT-compliant Langevin dynamics.
-    
-    Two delta scatterers at fixed positions with sinusoidal coupling:
-        g₀(t) = g₀[1 + cos(Ωt)]
-        g₁(t) = g₁[1 + cos(Ωt + φ)]
-    
-    Field equation: d²φ/dt² + γ∂φ/∂t - c²∂²φ/∂x² = -V(x,t)φ + ξ(t)
-    with FDT: σ_noise = sqrt(2γkT/dt)
-    """
-    
-    def __init__(
-        self,
-        nx: int,
-        dx: float,
-        dt: float,
-        gamma: float,
-        temperature: float,
-        coupler_positions: tuple[float, float],
-        coupler_widths: tuple[float, float],
-    ):
-        self.nx = nx
-        self.dx = dx
-        self.dt = dt
-        self.gamma = gamma
-        self.temp = temperature
-        
-        self.x = np.arange(nx) * dx
-        self.phi = np.zeros(nx)
-        self.phi_prev = np.zeros(nx)
-        self.phi_next = np.zeros(nx)
-        
-        # Coupler spatial profiles (Gaussian delta approximations)
-        x0, x1 = coupler_positions
-        w0, w1 = coupler_widths
-        self.coupler0_profile = np.exp(-((self.x - x0) ** 2) / (2 * w0**2))
-        self.coupler1_profile = np.exp(-((self.x - x1) ** 2) / (2 * w1**2))
-        
-        # FDT noise scale
-        if self.temp > 0 and self.gamma > 0:
-            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
-        else:
-            self.noise_scale = 0.0
-        
-        # Telemetry
-        self.force_history = []
-        self.time_history = []
-    
-    def step(self, *, t: float, c: float, g0: float, g1: float) -> None:
-        """Advance field one timestep with time-dependent Floquet coupling."""
-        # 1. Laplacian
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-        
-        # 2. Time-dependent coupling potential
-        V = g0 * self.coupler0_profile + g1 * self.coupler1_profile
-        interaction = V * self.phi
-        
-        # 3. Thermal noise (FDT-compliant)
-        noise = np.zeros(self.nx)
-        if self.noise_scale > 0:
-            noise = np.random.normal(0, self.noise_scale, self.nx)
-        
-        # 4. Damped Verlet integration
-        forces = (c**2) * laplacian - interaction + noise
-        
-        denom = 1.0 + (self.gamma * self.dt / 2.0)
-        term1 = 2.0 * self.phi
-        term2 = self.phi_prev * (1.0 - (self.gamma * self.dt / 2.0))
-        term3 = (self.dt**2) * forces
-        
-        self.phi_next = (term1 - term2 + term3) / denom
-        
-        # Boundary conditions
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-        
-        # 5. Calculate force (back-reaction from both couplers)
-        grad_V = np.gradient(V, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_V) * self.dx)
-        self.force_history.append(force)
-        self.time_history.append(t)
-        
-        # Cycle buffers
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
-
-
 @dataclass(frozen=True)
 class Experiment4CConfig:
     # Grid parameters
@@ -130,8 +45,23 @@ class Experiment4CConfig:
     # Phase sweep (for φ-reversal test)
     phi_test_values: tuple[float, ...] = (0.0, np.pi/2, -np.pi/2)
     
-    # Ensemble statistics
+    # Ensemble statistics (the per-cell seed budget when adaptive)
     ensemble_size: int = 20
+
+    # Adaptive ensemble: start every (T, φ) cell with `min_ensemble` seeds
+    # and add `ensemble_batch` more to the cells whose verdict is still open
+    # (see _cell_verdict), up to `ensemble_size`
+    adaptive: bool = False
+    min_ensemble: int = 5
+    ensemble_batch: int = 5
+    confidence: float = 0.95  # per cell, over all its rounds (Bonferroni)
+    null_snr: float = 1.0  # "no pump" once |mean| < null_snr·σ is established
+    
+    @property
+    def max_rounds(self) -> int:
+        """Looks an adaptive cell gets before it exhausts `ensemble_size`."""
+        extra = max(0, self.ensemble_size - self.min_ensemble)
+        return 1 + -(-extra // self.ensemble_batch)
     
     @property
     def total_time(self) -> float:
@@ -183,6 +113,151 @@ def _compute_lock_in_amplitude(
     return I_sin, I_cos
 
 
+def _cell_verdict(values: Sequence[float], *, alpha: float, null_snr: float) -> Optional[str]:
+    """Verdict on a (T, φ) cell's mean lock-in amplitude, or None while undecided.
+
+    With n seeds of sample standard deviation σ (ddof=1; the report's
+    ± column keeps the population std) the two-sided 1 - `alpha`
+    interval on the mean is mean ± t·σ/√n, t the Student-t quantile for
+    n - 1 degrees of freedom. "SIGNAL": it excludes zero, so the pump
+    direction is settled. "NULL": it lies inside ±null_snr·σ, so the
+    cell's SNR is below `null_snr`. The adaptive driver looks after every
+    round, so it passes the overall error rate split over `max_rounds`
+    looks (Bonferroni), which keeps the verdicts valid under optional
+    stopping.
+    """
+    n = len(values)
+    if n < 2:
+        return None
+    mean = float(np.mean(values))
+    std = float(np.std(values, ddof=1))
+    half_width = student_t_quantile(1.0 - alpha / 2.0, n - 1) * std / np.sqrt(n)
+    if abs(mean) > half_width:
+        return "SIGNAL"
+    if abs(mean) + half_width < null_snr * std:
+        return "NULL"
+    return None
+
+
+def _member_seed(seed: int, i_temp: int, phi: float, i_seed: int) -> int:
+    # Seed vacuum state (ensure non-negative seed)
+    return seed + i_temp * 1000 + abs(int(phi * 1000)) % 10000 + i_seed
+
+
+def _simulate_members(
+    cfg: Experiment4CConfig,
+    couplers: TwoCouplerDrive,
+    members: Sequence[Tuple[int, float, int]],
+    temp_levels: np.ndarray,
+    *,
+    seed: int,
+    noise_seed,
+) -> np.ndarray:
+    """Lock-in amplitude I_sin of every (T index, φ, seed index) member.
+
+    All members are stepped together in one vectorized chamber;
+    `noise_seed` is the chamber's `seed` (one int, or a `SeedSequence` per
+    member).
+    """
+    member_temps = np.array([temp_levels[i_temp] for i_temp, _, _ in members])
+    # Column of each member's φ in the precomputed phase table below
+    member_columns = 1 + np.array([cfg.phi_test_values.index(phi) for _, phi, _ in members])
+
+    sim = EnsembleLangevinChamber(
+        n_members=len(members),
+        nx=cfg.grid_size,
+        dx=cfg.dx,
+        dt=cfg.dt,
+        gamma=cfg.gamma,
+        temperatures=member_temps,
+        seed=noise_seed,
+    )
+    sim.seed_members([_member_seed(seed, *member) for member in members])
+    print(f"Stepping {len(members)} ensemble members in one vectorized chamber")
+
+    # Sinusoidal coupling modulation (per-member phase on coupler 1),
+    # precomputed for the whole run
+    phase_cos = harmonic_phases(
+        0, cfg.n_steps, dt=cfg.dt, omega=cfg.omega, phases=(0.0, *cfg.phi_test_values)
+    )
+    g0_table = cfg.g0_amp * (1.0 + phase_cos[:, 0])
+    g1_table = cfg.g1_amp * (1.0 + phase_cos[:, member_columns])
+
+    # Time evolution with Floquet drive: V_m = g0·p1 + g1_m·p2, applied
+    # on the couplers' support window only
+    force_arr = np.empty((cfg.n_steps, len(members)))
+    coefficients = np.empty((len(members), 2))
+    for step in range(cfg.n_steps):
+        coefficients[:, 0] = g0_table[step]
+        coefficients[:, 1] = g1_table[step]
+        force_arr[step] = sim.step_separable(c=cfg.c, potential=couplers, coefficients=coefficients)
+
+    time_arr = np.arange(cfg.n_steps) * cfg.dt
+
+    # Lock-in detection (extract coherent component at Ω); the signed
+    # I_sin is the proxy for pump direction
+    lock_in = np.empty(len(members))
+    for m in range(len(members)):
+        I_sin, _ = _compute_lock_in_amplitude(
+            force_arr[:, m],
+            time_arr,
+            cfg.omega,
+            cfg.lock_in_start_time,
+            phase_offset=0.0,
+        )
+        lock_in[m] = I_sin
+    return lock_in
+
+
+def _adaptive_ensembles(
+    cfg: Experiment4CConfig,
+    couplers: TwoCouplerDrive,
+    temp_levels: np.ndarray,
+    *,
+    seed: int,
+) -> Tuple[Dict[Tuple[int, float], List[float]], Dict[Tuple[int, float], Optional[str]]]:
+    """Grow every (T, φ) cell's ensemble in rounds until its verdict is in.
+
+    Each round steps only the members added to the still-open cells. A
+    member's noise is seeded by (cell, seed index), so a cell's samples do
+    not depend on which other cells were still running.
+    """
+    if cfg.min_ensemble < 2 or cfg.ensemble_batch < 1:
+        raise ValueError("adaptive ensembles need min_ensemble >= 2 and ensemble_batch >= 1")
+    if not 0.0 < cfg.confidence < 1.0:
+        raise ValueError("confidence must lie in (0, 1)")
+    alpha = (1.0 - cfg.confidence) / cfg.max_rounds
+    cells = [(i_temp, phi) for i_temp in range(len(temp_levels)) for phi in cfg.phi_test_values]
+    samples: Dict[Tuple[int, float], List[float]] = {cell: [] for cell in cells}
+    verdicts: Dict[Tuple[int, float], Optional[str]] = {cell: None for cell in cells}
+
+    n_round = 0
+    while True:
+        open_cells = [
+            (c, cell)
+            for c, cell in enumerate(cells)
+            if verdicts[cell] is None and len(samples[cell]) < cfg.ensemble_size
+        ]
+        if not open_cells:
+            break
+        n_round += 1
+        members = []
+        noise_seeds = []
+        for c, (i_temp, phi) in open_cells:
+            n = len(samples[i_temp, phi])
+            batch = cfg.min_ensemble if n == 0 else cfg.ensemble_batch
+            for i_seed in range(n, min(n + batch, cfg.ensemble_size)):
+                members.append((i_temp, phi, i_seed))
+                noise_seeds.append(np.random.SeedSequence(seed, spawn_key=(c, i_seed)))
+        print(f"Round {n_round}: {len(open_cells)} open cell(s)")
+        lock_in = _simulate_members(cfg, couplers, members, temp_levels, seed=seed, noise_seed=noise_seeds)
+        for (i_temp, phi, _), value in zip(members, lock_in):
+            samples[i_temp, phi].append(float(value))
+        for _, cell in open_cells:
+            verdicts[cell] = _cell_verdict(samples[cell], alpha=alpha, null_snr=cfg.null_snr)
+    return samples, verdicts
+
+
 def run(*, seed: int = 42, cfg: Optional[Experiment4CConfig] = None) -> str:
     """Floquet pump under Langevin dynamics with lock-in detection.
     
@@ -197,86 +272,74 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4CConfig] = None) -> str:
         flight.log_metric("Damping (γ)", cfg.gamma)
         flight.log_metric("Cycles", cfg.n_cycles)
         flight.log_metric("Transient Skip", cfg.transient_cycles)
-        flight.log_metric("Ensemble Size", cfg.ensemble_size)
+        if cfg.adaptive:
+            ensemble = f"{cfg.min_ensemble}-{cfg.ensemble_size} (adaptive)"
+        else:
+            ensemble = cfg.ensemble_size
+        flight.log_metric("Ensemble Size", ensemble)
         flight.log_metric("Temp Range", f"{cfg.temp_min} - {cfg.temp_max}")
         
-        print(f"Floquet Lock-in Test: {cfg.n_cycles} cycles, {cfg.ensemble_size} seeds per (T,φ)")
+        print(f"Floquet Lock-in Test: {cfg.n_cycles} cycles, {ensemble} seeds per (T,φ)")
         
         temp_levels = np.linspace(cfg.temp_min, cfg.temp_max, cfg.temp_steps)
         
-        # Results structure: results[temp_idx][phi_idx] = (mean, std, ensemble_data)
-        results = {}
-        
         # Coupler positions (centered, separated)
         x_center = (cfg.grid_size / 2.0) * cfg.dx
         coupler_positions = (
             x_center - cfg.coupler_separation / 2,
             x_center + cfg.coupler_separation / 2,
         )
-        coupler_widths = (cfg.coupler_width, cfg.coupler_width)
         
+        # Coupler spatial profiles (Gaussian delta approximations) and their gradients
+        x_grid = np.arange(cfg.grid_size) * cfg.dx
+        couplers = TwoCouplerDrive.gaussian(x_grid, coupler_positions, cfg.coupler_width)
+
+        if cfg.adaptive:
+            samples, verdicts = _adaptive_ensembles(cfg, couplers, temp_levels, seed=seed)
+        else:
+            # Every (T, φ, seed) cell is one ensemble member, stepped together
+            members = [
+                (i_temp, phi, i_seed)
+                for i_temp in range(len(temp_levels))
+                for phi in cfg.phi_test_values
+                for i_seed in range(cfg.ensemble_size)
+            ]
+            lock_in = _simulate_members(cfg, couplers, members, temp_levels, seed=seed, noise_seed=seed)
+            samples = {}
+            for (i_temp, phi, _), value in zip(members, lock_in):
+                samples.setdefault((i_temp, phi), []).append(float(value))
+            verdicts = {}
+
+        # Results structure: results[temp][phi] = (mean, std, ensemble_data)
+        results = {}
         for i_temp, temp in enumerate(temp_levels):
             print(f"\n=== Temperature {temp:.4f} ===")
             results[temp] = {}
-            
+
             for phi in cfg.phi_test_values:
-                ensemble_lock_in = []
-                
-                for i_seed in range(cfg.ensemble_size):
-                    # Initialize chamber
-                    sim = FloquetLangevinChamber(
-                        nx=cfg.grid_size,
-                        dx=cfg.dx,
-                        dt=cfg.dt,
-                        gamma=cfg.gamma,
-                        temperature=float(temp),
-                        coupler_positions=coupler_positions,
-                        coupler_widths=coupler_widths,
-                    )
-                    
-                    # Seed vacuum state (ensure non-negative seed)
-                    phi_hash = abs(int(phi * 1000)) % 10000
-                    rng = np.random.default_rng(seed + i_temp * 1000 + phi_hash + i_seed)
-                    sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-                    sim.phi_prev = np.copy(sim.phi)
-                    
-                    # Time evolution with Floquet drive
-                    for step in range(cfg.n_steps):
-                        t = step * cfg.dt
-                        
-                        # Sinusoidal coupling modulation
-                        g0_t = cfg.g0_amp * (1.0 + np.cos(cfg.omega * t))
-                        g1_t = cfg.g1_amp * (1.0 + np.cos(cfg.omega * t + phi))
-                        
-                        sim.step(t=t, c=cfg.c, g0=g0_t, g1=g1_t)
-                    
-                    # Lock-in detection (extract coherent component at Ω)
-                    force_arr = np.asarray(sim.force_history)
-                    time_arr = np.asarray(sim.time_history)
-                    
-                    I_sin, I_cos = _compute_lock_in_amplitude(
-                        force_arr,
-                        time_arr,
-                        cfg.omega,
-                        cfg.lock_in_start_time,
-                        phase_offset=0.0,
-                    )
-                    
-                    # Magnitude of lock-in signal
-                    lock_in_amp = np.sqrt(I_sin**2 + I_cos**2)
-                    # Use signed amplitude (I_sin as proxy for pump direction)
-                    signed_amp = I_sin
-                    
-                    ensemble_lock_in.append(signed_amp)
-                
+                ensemble_lock_in = samples[i_temp, phi]
+
                 # Statistics
                 mean_lock_in = float(np.mean(ensemble_lock_in))
                 std_lock_in = float(np.std(ensemble_lock_in))
                 results[temp][phi] = (mean_lock_in, std_lock_in, ensemble_lock_in)
-                
+
                 snr = abs(mean_lock_in / std_lock_in) if std_lock_in > 0 else np.inf
-                print(f"  φ={phi:+.3f}: I_lock = {mean_lock_in:+.3e} ± {std_lock_in:.2e} [SNR={snr:.1f}]")
-        
+                line = f"  φ={phi:+.3f}: I_lock = {mean_lock_in:+.3e} ± {std_lock_in:.2e} [SNR={snr:.1f}]"
+                if cfg.adaptive:
+                    verdict = verdicts[i_temp, phi] or "UNDECIDED"
+                    line += f" n={len(ensemble_lock_in)} {verdict}"
+                print(line)
+
+        if cfg.adaptive:
+            used = sum(len(values) for values in samples.values())
+            budget = len(samples) * cfg.ensemble_size
+            counts = [len(values) for values in samples.values()]
+            undecided = sum(verdict is None for verdict in verdicts.values())
+            flight.log_metric("Seeds Used", f"{used} of {budget} ({used / budget:.0%})")
+            flight.log_metric("Seeds per Cell", f"{min(counts)}-{max(counts)} (mean {np.mean(counts):.1f})")
+            flight.log_metric("Undecided Cells", f"{undecided} of {len(samples)}")
+
         # === ANALYSIS: φ-Reversal Test ===
         print("\n=== φ-REVERSAL TEST ===")
         phi_plus = np.pi / 2
@@ -1,83 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.boundaries import make_absorber
+from core.checkpoint import RunCheckpointer, config_from_meta, load_checkpoint, load_warm_start
+from core.langevin import LangevinVacuumChamber
+from core.noise import spawn_seeds
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.stability import choose_dt, max_stable_dt
+from core.telemetry import make_sink
+from core.vacuum_chamber import DiagnosticsPolicy
 from flight_recorder.mission_logger import FlightRecorder
 
 
-class LangevinVacuumChamber(VacuumChamber):
-    """Damped wave equation with FDT compliance (reusable from 4B/4C)."""
-    
-    def __init__(
-        self,
-        nx: int,
-        dx: float,
-        dt: float,
-        gamma: float = 0.001,
-        temperature: float = 0.0,
-    ):
-        super().__init__(nx, dx)
-        self.gamma = gamma
-        self.temp = temperature
-        self.dt = dt
-
-        # FDT noise scale
-        if self.temp > 0 and self.gamma > 0:
-            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
-        else:
-            self.noise_scale = 0.0
-
-    def step_damped(self, *, c: float, v_potential: np.ndarray) -> None:
-        """Advance field one timestep with damping and FDT noise."""
-        # 1. Laplacian
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-
-        # 2. Forces
-        interaction = v_potential * self.phi
-        noise = np.zeros(self.nx)
-        if self.noise_scale > 0:
-            noise = np.random.normal(0, self.noise_scale, self.nx)
-
-        forces = (c**2) * laplacian - interaction + noise
-
-        # 3. Damped Verlet integration
-        denom = 1.0 + (self.gamma * self.dt / 2.0)
-        term1 = 2.0 * self.phi
-        term2 = self.phi_prev * (1.0 - (self.gamma * self.dt / 2.0))
-        term3 = (self.dt**2) * forces
-
-        self.phi_next = (term1 - term2 + term3) / denom
-
-        # Boundaries
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-
-        # 4. Force calculation
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
-
-        # 5. Energy
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * self.dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
-        )
-        self.total_energy_field.append(energy)
-
-        # Cycle
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
-
-
 @dataclass(frozen=True)
 class Experiment4DConfig:
     # Grid parameters
@@ -86,6 +26,10 @@ class Experiment4DConfig:
     dt: float = 0.02  # Finer timestep
     c: float = 1.0
 
+    # Replace dt by 90% of the largest stable step for this grid, drive,
+    # integrator and backend (see core.stability)
+    auto_dt: bool = False
+
     # High-Q damping (10x lower than 4B/4C)
     gamma: float = 0.001
 
@@ -102,6 +46,23 @@ class Experiment4DConfig:
     coupler_separation: float = 20.0
     coupler_width: float = 1.0  # Narrow delta approximation
 
+    backend: str = "numpy"  # see core.kernels.resolve_backend
+
+    # Time integrator: "leapfrog" (second order) or "yoshida4" (fourth order,
+    # three force evaluations per step, for a larger dt at the same accuracy)
+    integrator: str = "leapfrog"
+
+    # Wall treatment: "none" (hard walls), "pml" or "sponge" layers of
+    # `absorber_width` cells, which let a smaller grid_size stand in for open space
+    absorber: str = "none"
+    absorber_width: int = 40
+
+    # Drive cycles per batch; a checkpoint is saved after each (0: no checkpoints)
+    checkpoint_cycles: int = 20
+
+    # Force telemetry: "memory", or "memmap" to stream it into the run folder
+    telemetry: str = "memory"
+
     @property
     def period(self) -> int:
         """Steps per drive cycle."""
@@ -118,15 +79,59 @@ class Experiment4DConfig:
         return 0.2
 
 
-def run(*, seed: int = 42, cfg: Optional[Experiment4DConfig] = None) -> str:
+def run(
+    *,
+    seed: int = 42,
+    cfg: Optional[Experiment4DConfig] = None,
+    resume: Optional[str] = None,
+    warm_start: Optional[str] = None,
+) -> str:
     """High-power Floquet optimization to achieve SNR > 10 at T=0.
     
     Goal: Establish strong baseline signal before thermal stress testing.
     Strategy: Lower damping, stronger drive, longer integration.
+
+    `resume` continues the run in that folder from its checkpoint;
+    `warm_start` seeds the field from a checkpoint instead of vacuum noise.
     """
+    checkpoint = load_checkpoint(resume) if resume is not None else None
+    if checkpoint is not None:
+        seed = checkpoint.meta["seed"]
+        cfg = config_from_meta(Experiment4DConfig, checkpoint.meta)
     cfg = cfg or Experiment4DConfig()
 
-    with FlightRecorder("experiment4d_high_power") as flight:
+    with FlightRecorder("experiment4d_high_power", folder=resume) as flight:
+        # === FLOQUET TWO-COUPLER GEOMETRY ===
+        x_center = (cfg.grid_size / 2.0) * cfg.dx
+        x1 = x_center - cfg.coupler_separation / 2
+        x2 = x_center + cfg.coupler_separation / 2
+
+        # Gaussian delta approximations, normalized to conserve coupling strength
+        x_grid = np.arange(cfg.grid_size) * cfg.dx
+        drive = TwoCouplerDrive.gaussian(x_grid, (x1, x2), cfg.coupler_width, dx=cfg.dx)
+
+        # Floquet drive: g(t) = g₀ + g₁·cos(Ωt + φ)
+        schedule = FloquetCouplerSchedule(
+            drive=drive,
+            g0=cfg.g0,
+            g1=cfg.g1,
+            omega=cfg.omega,
+            phi=cfg.phi,
+            dt=cfg.dt,
+        )
+
+        if cfg.auto_dt:
+            limit = max_stable_dt(
+                dx=cfg.dx,
+                c=cfg.c,
+                v_max=schedule.peak_potential(0, cfg.total_steps),
+                integrator=cfg.integrator,
+                backend=cfg.backend,
+                absorber=None if cfg.absorber == "none" else cfg.absorber,
+            )
+            cfg = replace(cfg, dt=choose_dt(limit))
+            schedule = replace(schedule, dt=cfg.dt)
+
         flight.log_metric("Protocol", "High-Power SNR Optimization")
         flight.log_metric("Drive Strength", f"g₀={cfg.g0}, g₁={cfg.g1}")
         flight.log_metric("Damping (γ)", cfg.gamma)
@@ -144,55 +149,43 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4DConfig] = None) -> str:
             cfg.dt,
             gamma=cfg.gamma,
             temperature=0.0,  # T=0 baseline
+            diagnostics=DiagnosticsPolicy.force_only(),
+            noise_seed=spawn_seeds(seed, 1)[0],
+            backend=cfg.backend,
+            absorber=make_absorber(cfg.absorber, cfg.absorber_width),
+            integrator=cfg.integrator,
         )
 
-        # Seed vacuum state
-        rng = np.random.default_rng(seed)
-        sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-        sim.phi_prev = np.copy(sim.phi)
-
-        # === FLOQUET TWO-COUPLER GEOMETRY ===
-        x_center = (cfg.grid_size / 2.0) * cfg.dx
-        x1 = x_center - cfg.coupler_separation / 2
-        x2 = x_center + cfg.coupler_separation / 2
-
-        # Gaussian delta approximations
-        x_grid = np.arange(cfg.grid_size) * cfg.dx
-        coupler1_profile = np.exp(-((x_grid - x1) ** 2) / (2 * cfg.coupler_width**2))
-        coupler2_profile = np.exp(-((x_grid - x2) ** 2) / (2 * cfg.coupler_width**2))
-
-        # Normalize to conserve coupling strength
-        coupler1_profile /= np.sum(coupler1_profile) * cfg.dx
-        coupler2_profile /= np.sum(coupler2_profile) * cfg.dx
-
-        force_history = []
-        time_history = []
+        forces = make_sink(cfg.telemetry, directory=flight.folder_name, name="mirror_force")
+        if checkpoint is not None:
+            sim.restore_state(checkpoint.chamber)
+            forces.extend(checkpoint.arrays["force"])
+            print(f"Resumed from checkpoint at step {sim.step_index}/{cfg.total_steps}")
+        else:
+            # Seed vacuum state
+            rng = np.random.default_rng(seed)
+            sim.load_field(rng.normal(0, 0.001, cfg.grid_size))
+            if warm_start is not None:
+                sim.load_field(*load_warm_start(warm_start))
+        checkpointer = RunCheckpointer(flight.folder_name, flight.experiment_name, seed, cfg)
 
         # === TIME EVOLUTION ===
-        for step in range(cfg.total_steps):
-            t = step * cfg.dt
-
-            # Floquet drive: g(t) = g₀ + g₁·cos(Ωt + φ)
-            g1_t = cfg.g0 + cfg.g1 * np.cos(cfg.omega * t)
-            g2_t = cfg.g0 + cfg.g1 * np.cos(cfg.omega * t + cfg.phi)
-
-            # Construct time-dependent potential
-            V = g1_t * coupler1_profile + g2_t * coupler2_profile
-
-            # Step physics
-            sim.step_damped(c=cfg.c, v_potential=V)
-
-            force_history.append(sim.mirror_force[-1])
-            time_history.append(t)
-
-            # Progress indicator
-            if step % (cfg.period * 20) == 0 and step > 0:
-                progress_pct = 100 * step / cfg.total_steps
-                print(f"  Progress: {progress_pct:.1f}% ({step}/{cfg.total_steps} steps)")
+        # Batched in blocks of drive cycles so progress can be reported
+        chunk = cfg.period * (cfg.checkpoint_cycles or 20)
+        for start in range(sim.step_index, cfg.total_steps, chunk):
+            n = min(chunk, cfg.total_steps - start)
+            forces.extend(sim.run(n, schedule, c=cfg.c).mirror_force)
+            if cfg.checkpoint_cycles:
+                checkpointer.save(sim, {"force": forces.view()})
+
+            done = start + n
+            if done < cfg.total_steps:
+                progress_pct = 100 * done / cfg.total_steps
+                print(f"  Progress: {progress_pct:.1f}% ({done}/{cfg.total_steps} steps)")
 
         # === ANALYSIS: STEADY-STATE THRUST ===
-        force_arr = np.asarray(force_history)
-        time_arr = np.asarray(time_history)
+        force_arr = forces.view()
+        time_arr = np.arange(cfg.total_steps) * cfg.dt
 
         # Discard transient (first 20%)
         transient_idx = int(len(force_arr) * cfg.transient_fraction)
@@ -308,4 +301,5 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4DConfig] = None) -> str:
         flight.save_plot(fig, filename="visual_telemetry.png")
         plt.close(fig)
 
+        forces.close()
         return "COUNCIL_REPORT.md"
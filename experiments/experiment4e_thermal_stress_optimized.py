@@ -1,83 +1,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.checkpoint import (
+    Checkpoint,
+    RunCheckpointer,
+    config_from_meta,
+    load_checkpoint,
+    load_warm_start,
+)
+from core.langevin import LangevinVacuumChamber
+from core.noise import spawn_seeds
+from core.parallel import sweep_map, sweep_workers
+from core.potentials import TwoCouplerDrive
+from core.schedules import FloquetCouplerSchedule
+from core.telemetry import make_sink
+from core.vacuum_chamber import DiagnosticsPolicy
 from flight_recorder.mission_logger import FlightRecorder
 
 
-class LangevinVacuumChamber(VacuumChamber):
-    """High-fidelity Langevin chamber with FDT compliance."""
-    
-    def __init__(
-        self,
-        nx: int,
-        dx: float,
-        dt: float,
-        gamma: float = 0.001,
-        temperature: float = 0.0,
-    ):
-        super().__init__(nx, dx)
-        self.gamma = gamma
-        self.temp = temperature
-        self.dt = dt
-
-        # FDT noise scale
-        if self.temp > 0 and self.gamma > 0:
-            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
-        else:
-            self.noise_scale = 0.0
-
-    def step_damped(self, *, c: float, v_potential: np.ndarray) -> None:
-        """Advance field one timestep with damping and FDT noise."""
-        # 1. Laplacian
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-
-        # 2. Forces
-        interaction = v_potential * self.phi
-        noise = np.zeros(self.nx)
-        if self.noise_scale > 0:
-            noise = np.random.normal(0, self.noise_scale, self.nx)
-
-        forces = (c**2) * laplacian - interaction + noise
-
-        # 3. Damped Verlet
-        denom = 1.0 + (self.gamma * self.dt / 2.0)
-        term1 = 2.0 * self.phi
-        term2 = self.phi_prev * (1.0 - (self.gamma * self.dt / 2.0))
-        term3 = (self.dt**2) * forces
-
-        self.phi_next = (term1 - term2 + term3) / denom
-
-        # Boundaries
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-
-        # 4. Force calculation
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
-
-        # 5. Energy
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * self.dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
-        )
-        self.total_energy_field.append(energy)
-
-        # Cycle
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
-
-
 @dataclass(frozen=True)
 class Experiment4EConfig:
     # Grid parameters (from 4D)
@@ -107,6 +53,20 @@ class Experiment4EConfig:
     temp_max: float = 0.025
     temp_steps: int = 6
 
+    backend: str = "numpy"  # see core.kernels.resolve_backend
+
+    # Field precision ("float32" halves memory traffic; check with core.precision)
+    field_dtype: str = "float64"
+
+    # Drive cycles between checkpoints (0: no checkpoints). A parallel sweep
+    # checkpoints after each finished temperature instead
+    checkpoint_cycles: int = 20
+
+    workers: int = 0  # see core.parallel.sweep_workers
+
+    # Force telemetry: "memory", or "memmap" to stream it into the run folder
+    telemetry: str = "memory"
+
     @property
     def period(self) -> int:
         return int(2 * np.pi / (self.omega * self.dt))
@@ -120,15 +80,110 @@ class Experiment4EConfig:
         return 0.2
 
 
-def run(*, seed: int = 42, cfg: Optional[Experiment4EConfig] = None) -> str:
+def _temperature_point(
+    point: Tuple[int, Optional[Checkpoint]],
+    *,
+    cfg: Experiment4EConfig,
+    seed: int,
+    folder: str,
+    warm_start: Optional[str] = None,
+    save: Optional[Callable[[LangevinVacuumChamber, np.ndarray, int], None]] = None,
+) -> Tuple[float, float, float]:
+    """(thrust, standard error, SNR) of temperature `i_temp`, seeded from `seed + i_temp*500`.
+
+    A `checkpoint` taken inside this point is continued from; `save` is
+    called with the chamber and force series every `checkpoint_cycles`.
+    """
+    i_temp, checkpoint = point
+    temp = np.linspace(cfg.temp_min, cfg.temp_max, cfg.temp_steps)[i_temp]
+
+    # Floquet coupler setup
+    x_center = (cfg.grid_size / 2.0) * cfg.dx
+    x1 = x_center - cfg.coupler_separation / 2
+    x2 = x_center + cfg.coupler_separation / 2
+
+    # Gaussian delta approximations, normalized to conserve coupling strength
+    x_grid = np.arange(cfg.grid_size) * cfg.dx
+    drive = TwoCouplerDrive.gaussian(x_grid, (x1, x2), cfg.coupler_width, dx=cfg.dx)
+
+    # Floquet drive
+    schedule = FloquetCouplerSchedule(
+        drive=drive,
+        g0=cfg.g0,
+        g1=cfg.g1,
+        omega=cfg.omega,
+        phi=cfg.phi,
+        dt=cfg.dt,
+    )
+
+    # Initialize chamber
+    sim = LangevinVacuumChamber(
+        cfg.grid_size,
+        cfg.dx,
+        cfg.dt,
+        gamma=cfg.gamma,
+        temperature=float(temp),
+        diagnostics=DiagnosticsPolicy.force_only(),
+        noise_seed=spawn_seeds(seed + i_temp * 500, 1)[0],
+        dtype=cfg.field_dtype,
+        backend=cfg.backend,
+    )
+
+    forces = make_sink(cfg.telemetry, directory=folder, name=f"mirror_force_T{i_temp}")
+    if checkpoint is not None:
+        sim.restore_state(checkpoint.chamber)
+        forces.extend(checkpoint.arrays["force"])
+    else:
+        # Seed
+        rng = np.random.default_rng(seed + i_temp * 500)
+        sim.load_field(rng.normal(0, 0.001, cfg.grid_size))
+        if warm_start is not None:
+            sim.load_field(*load_warm_start(warm_start))
+
+    # Time evolution, checkpointed every `checkpoint_cycles` drive cycles
+    chunk = cfg.period * cfg.checkpoint_cycles or cfg.total_steps
+    for start in range(sim.step_index, cfg.total_steps, chunk):
+        n = min(chunk, cfg.total_steps - start)
+        forces.extend(sim.run(n, schedule, c=cfg.c).mirror_force)
+        if save is not None:
+            save(sim, forces.view(), i_temp)
+    force_arr = forces.view()
+
+    # Lock-in analysis (steady state)
+    transient_idx = int(cfg.total_steps * cfg.transient_fraction)
+    steady_force = force_arr[transient_idx:]
+
+    net_thrust = float(np.mean(steady_force))
+    std_dev = float(np.std(steady_force))
+    std_err = std_dev / np.sqrt(len(steady_force))
+    snr = abs(net_thrust / std_err) if std_err > 0 else 0.0
+    forces.close()
+    return net_thrust, std_err, snr
+
+
+def run(
+    *,
+    seed: int = 42,
+    cfg: Optional[Experiment4EConfig] = None,
+    resume: Optional[str] = None,
+    warm_start: Optional[str] = None,
+) -> str:
     """High-fidelity thermal stress test with optimized parameters.
     
     Tests thermal robustness of the high-power Floquet pump (SNR=21 at T=0).
     Critical question: Does strong drive preserve coherence at higher T?
+
+    `resume` continues the run in that folder from its checkpoint;
+    `warm_start` seeds every temperature's field from a checkpoint instead
+    of vacuum noise.
     """
+    checkpoint = load_checkpoint(resume) if resume is not None else None
+    if checkpoint is not None:
+        seed = checkpoint.meta["seed"]
+        cfg = config_from_meta(Experiment4EConfig, checkpoint.meta)
     cfg = cfg or Experiment4EConfig()
 
-    with FlightRecorder("experiment4e_thermal_stress_optimized") as flight:
+    with FlightRecorder("experiment4e_thermal_stress_optimized", folder=resume) as flight:
         flight.log_metric("Protocol", "High-Fidelity Thermal Sweep")
         flight.log_metric("Drive", f"g₀={cfg.g0}, g₁={cfg.g1}")
         flight.log_metric("Damping (γ)", cfg.gamma)
@@ -145,63 +200,53 @@ def run(*, seed: int = 42, cfg: Optional[Experiment4EConfig] = None) -> str:
         results_err = []
         results_snr = []
 
-        # Floquet coupler setup
-        x_center = (cfg.grid_size / 2.0) * cfg.dx
-        x1 = x_center - cfg.coupler_separation / 2
-        x2 = x_center + cfg.coupler_separation / 2
-
-        x_grid = np.arange(cfg.grid_size) * cfg.dx
-        coupler1_profile = np.exp(-((x_grid - x1) ** 2) / (2 * cfg.coupler_width**2))
-        coupler2_profile = np.exp(-((x_grid - x2) ** 2) / (2 * cfg.coupler_width**2))
-
-        coupler1_profile /= np.sum(coupler1_profile) * cfg.dx
-        coupler2_profile /= np.sum(coupler2_profile) * cfg.dx
-
-        for i_temp, temp in enumerate(temp_levels):
-            # Initialize chamber
-            sim = LangevinVacuumChamber(
-                cfg.grid_size,
-                cfg.dx,
-                cfg.dt,
-                gamma=cfg.gamma,
-                temperature=float(temp),
-            )
-
-            # Seed
-            rng = np.random.default_rng(seed + i_temp * 500)
-            sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-            sim.phi_prev = np.copy(sim.phi)
-
-            force_history = []
-
-            # Time evolution
-            for step in range(cfg.total_steps):
-                t = step * cfg.dt
-
-                # Floquet drive
-                g1_t = cfg.g0 + cfg.g1 * np.cos(cfg.omega * t)
-                g2_t = cfg.g0 + cfg.g1 * np.cos(cfg.omega * t + cfg.phi)
-
-                # Construct potential
-                V = g1_t * coupler1_profile + g2_t * coupler2_profile
-
-                sim.step_damped(c=cfg.c, v_potential=V)
-                force_history.append(sim.mirror_force[-1])
-
-            # Lock-in analysis (steady state)
-            transient_idx = int(cfg.total_steps * cfg.transient_fraction)
-            steady_force = np.asarray(force_history[transient_idx:])
-
-            net_thrust = float(np.mean(steady_force))
-            std_dev = float(np.std(steady_force))
-            std_err = std_dev / np.sqrt(len(steady_force))
-
+        checkpointer = RunCheckpointer(flight.folder_name, flight.experiment_name, seed, cfg)
+        start_temp = 0
+        if checkpoint is not None:
+            start_temp = checkpoint.meta["temperature_index"]
+            results_mean = checkpoint.arrays["results_mean"].tolist()
+            results_err = checkpoint.arrays["results_err"].tolist()
+            results_snr = checkpoint.arrays["results_snr"].tolist()
+            if start_temp < cfg.temp_steps:
+                print(f"Resumed at T={temp_levels[start_temp]:.4f} from checkpoint")
+            for temp, net_thrust, snr in zip(temp_levels, results_mean, results_snr):
+                status = "✓ LOCKED" if snr > 2.0 else "✗ DECOHERED"
+                print(f"  T={temp:.4f}: Thrust={net_thrust:+.2e}, SNR={snr:5.1f} [{status}]")
+
+        def progress() -> Dict[str, np.ndarray]:
+            return {
+                "results_mean": np.array(results_mean),
+                "results_err": np.array(results_err),
+                "results_snr": np.array(results_snr),
+            }
+
+        def save_chunk(sim: LangevinVacuumChamber, forces: np.ndarray, i_temp: int) -> None:
+            checkpointer.save(sim, {"force": forces, **progress()}, temperature_index=i_temp)
+
+        # The first point continues from a checkpoint taken inside it, if any
+        inside = checkpoint if checkpoint is not None and checkpoint.chamber else None
+        points = [
+            (i_temp, inside if i_temp == start_temp else None)
+            for i_temp in range(start_temp, cfg.temp_steps)
+        ]
+        point = partial(
+            _temperature_point, cfg=cfg, seed=seed, folder=flight.folder_name, warm_start=warm_start
+        )
+        # A sequential sweep checkpoints inside each point; worker processes
+        # cannot, so a parallel one checkpoints between points
+        sequential = sweep_workers(cfg.workers, len(points)) == 1
+        if sequential and cfg.checkpoint_cycles:
+            point = partial(point, save=save_chunk)
+
+        results = sweep_map(point, points, workers=cfg.workers)
+        for (i_temp, _), (net_thrust, std_err, snr) in zip(points, results):
             results_mean.append(net_thrust)
             results_err.append(std_err)
-
-            snr = abs(net_thrust / std_err) if std_err > 0 else 0.0
             results_snr.append(snr)
+            if cfg.checkpoint_cycles and not sequential:
+                checkpointer.save(None, progress(), temperature_index=i_temp + 1)
 
+            temp = temp_levels[i_temp]
             status = "✓ LOCKED" if snr > 2.0 else "✗ DECOHERED"
             print(f"  T={temp:.4f}: Thrust={net_thrust:+.2e}, SNR={snr:5.1f} [{status}]")
 
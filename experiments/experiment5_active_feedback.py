@@ -6,68 +6,16 @@ from typing import Optional
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.checkpoint import RunCheckpointer, config_from_meta, load_checkpoint, load_warm_start
+from core.drives import harmonic_phases
+from core.langevin import LangevinVacuumChamber
+from core.noise import spawn_seeds
+from core.potentials import TwoCouplerDrive
+from core.telemetry import make_sink
+from core.vacuum_chamber import DiagnosticsPolicy
 from flight_recorder.mission_logger import FlightRecorder
 
 
-class LangevinVacuumChamber(VacuumChamber):
-    """High-fidelity Langevin chamber (from 4E)."""
-    
-    def __init__(
-        self,
-        nx: int,
-        dx: float,
-        dt: float,
-        gamma: float = 0.001,
-        temperature: float = 0.0,
-    ):
-        super().__init__(nx, dx)
-        self.gamma = gamma
-        self.temp = temperature
-        self.dt = dt
-
-        if self.temp > 0 and self.gamma > 0:
-            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
-        else:
-            self.noise_scale = 0.0
-
-    def step_damped(self, *, c: float, v_potential: np.ndarray) -> None:
-        """Advance field with damping and FDT noise."""
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-        interaction = v_potential * self.phi
-        noise = np.zeros(self.nx)
-        if self.noise_scale > 0:
-            noise = np.random.normal(0, self.noise_scale, self.nx)
-
-        forces = (c**2) * laplacian - interaction + noise
-
-        denom = 1.0 + (self.gamma * self.dt / 2.0)
-        term1 = 2.0 * self.phi
-        term2 = self.phi_prev * (1.0 - (self.gamma * self.dt / 2.0))
-        term3 = (self.dt**2) * forces
-
-        self.phi_next = (term1 - term2 + term3) / denom
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
-
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * self.dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
-        )
-        self.total_energy_field.append(energy)
-
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
-
-
 @dataclass(frozen=True)
 class Experiment5Config:
     # Grid parameters (from 4D/4E)
@@ -102,6 +50,14 @@ class Experiment5Config:
     feedback_gain_boost: float = 1.0  # Multiplier when thrusting
     feedback_gain_suppress: float = 0.1  # Multiplier when dragging
 
+    backend: str = "numpy"  # see core.kernels.resolve_backend
+
+    # Drive cycles between checkpoints (0: no checkpoints)
+    checkpoint_cycles: int = 20
+
+    # Per-step telemetry: "memory", or "memmap" to stream it into the run folder
+    telemetry: str = "memory"
+
     @property
     def period(self) -> int:
         return int(2 * np.pi / (self.omega * self.dt))
@@ -115,7 +71,13 @@ class Experiment5Config:
         return 0.2
 
 
-def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
+def run(
+    *,
+    seed: int = 42,
+    cfg: Optional[Experiment5Config] = None,
+    resume: Optional[str] = None,
+    warm_start: Optional[str] = None,
+) -> str:
     """Active feedback (Maxwell's Demon) test at high temperature.
     
     Tests whether information-driven coupling modulation can rectify
@@ -123,10 +85,17 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
     
     Strategy: Monitor instantaneous force. If dragging, reduce coupling.
     If thrusting, increase coupling. Trade CPU cycles for impulse.
+
+    `resume` continues the run in that folder from its checkpoint;
+    `warm_start` seeds the field from a checkpoint instead of vacuum noise.
     """
+    checkpoint = load_checkpoint(resume) if resume is not None else None
+    if checkpoint is not None:
+        seed = checkpoint.meta["seed"]
+        cfg = config_from_meta(Experiment5Config, checkpoint.meta)
     cfg = cfg or Experiment5Config()
 
-    with FlightRecorder("experiment5_active_feedback") as flight:
+    with FlightRecorder("experiment5_active_feedback", folder=resume) as flight:
         flight.log_metric("Protocol", "Active Feedback (Maxwell's Demon)")
         flight.log_metric("Temperature", cfg.temperature)
         flight.log_metric("Passive Limit (Tc)", "0.020 (from Exp 4E)")
@@ -145,11 +114,15 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
             cfg.dt,
             gamma=cfg.gamma,
             temperature=cfg.temperature,
+            diagnostics=DiagnosticsPolicy.force_only(),
+            noise_seed=spawn_seeds(seed, 1)[0],
+            backend=cfg.backend,
         )
 
         rng = np.random.default_rng(seed)
-        sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-        sim.phi_prev = np.copy(sim.phi)
+        sim.load_field(rng.normal(0, 0.001, cfg.grid_size))
+        if warm_start is not None and checkpoint is None:
+            sim.load_field(*load_warm_start(warm_start))
 
         # Coupler geometry
         x_center = (cfg.grid_size / 2.0) * cfg.dx
@@ -157,20 +130,29 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
         x2 = x_center + cfg.coupler_separation / 2
 
         x_grid = np.arange(cfg.grid_size) * cfg.dx
-        coupler1_profile = np.exp(-((x_grid - x1) ** 2) / (2 * cfg.coupler_width**2))
-        coupler2_profile = np.exp(-((x_grid - x2) ** 2) / (2 * cfg.coupler_width**2))
-
-        coupler1_profile /= np.sum(coupler1_profile) * cfg.dx
-        coupler2_profile /= np.sum(coupler2_profile) * cfg.dx
-
-        force_history = []
-        coupling_state_history = []
-        gain_history = []
+        drive = TwoCouplerDrive.gaussian(x_grid, (x1, x2), cfg.coupler_width, dx=cfg.dx)
+
+        telemetry_dir = flight.folder_name
+        if cfg.telemetry == "memmap":
+            sim.stream_telemetry(telemetry_dir)
+        coupling_state_history = make_sink(cfg.telemetry, directory=telemetry_dir, name="coupling_state")
+        gain_history = make_sink(cfg.telemetry, directory=telemetry_dir, name="gain")
+        if checkpoint is not None:
+            sim.restore_state(checkpoint.chamber)
+            coupling_state_history.extend(checkpoint.arrays["coupling_state"])
+            gain_history.extend(checkpoint.arrays["gain"])
+            print(f"Resumed from checkpoint at step {sim.step_index}/{cfg.total_steps}")
+        checkpointer = RunCheckpointer(flight.folder_name, flight.experiment_name, seed, cfg)
+        checkpoint_steps = cfg.period * cfg.checkpoint_cycles
 
         # === TIME EVOLUTION WITH FEEDBACK ===
-        for step in range(cfg.total_steps):
-            t = step * cfg.dt
+        # Carrier phases cos(Ωt), cos(Ωt + φ) for the whole run; the feedback
+        # only decides the gain applied to them
+        phase_cos = harmonic_phases(
+            0, cfg.total_steps, dt=cfg.dt, omega=cfg.omega, phases=(0.0, cfg.phi)
+        )
 
+        for step in range(sim.step_index, cfg.total_steps):
             # === FEEDBACK LOGIC ===
             # Use previous timestep force as predictor (Markov approximation)
             # If system was dragging, reduce coupling to "decloak"
@@ -204,15 +186,20 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
             g1_modulated = base_g1 * gain
 
             # Time-dependent coupling
-            g1_t = g0_modulated + g1_modulated * np.cos(cfg.omega * t)
-            g2_t = g0_modulated + g1_modulated * np.cos(cfg.omega * t + cfg.phi)
+            g1_t = g0_modulated + g1_modulated * phase_cos[step, 0]
+            g2_t = g0_modulated + g1_modulated * phase_cos[step, 1]
 
-            # Construct potential
-            V = g1_t * coupler1_profile + g2_t * coupler2_profile
+            # Step physics (separable drive: only the couplings change)
+            sim.step_damped_separable(c=cfg.c, potential=drive, coefficients=(g1_t, g2_t))
 
-            # Step physics
-            sim.step_damped(c=cfg.c, v_potential=V)
-            force_history.append(sim.mirror_force[-1])
+            if checkpoint_steps and (step + 1) % checkpoint_steps == 0:
+                checkpointer.save(
+                    sim,
+                    {
+                        "coupling_state": coupling_state_history.view(),
+                        "gain": gain_history.view(),
+                    },
+                )
 
             # Progress
             if step % (cfg.period * 20) == 0 and step > 0:
@@ -222,7 +209,7 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
 
         # === ANALYSIS ===
         transient_idx = int(cfg.total_steps * cfg.transient_fraction)
-        force_arr = np.asarray(force_history)
+        force_arr = sim.mirror_force.view()
         steady_force = force_arr[transient_idx:]
 
         net_thrust = float(np.mean(steady_force))
@@ -231,7 +218,7 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
         snr = abs(net_thrust / std_err) if std_err > 0 else 0.0
 
         # Duty cycle (fraction of time in "grip" mode)
-        states = np.asarray(coupling_state_history)
+        states = coupling_state_history.view()
         duty_cycle = float(np.mean(states))
 
         flight.log_metric("Net Thrust", net_thrust)
@@ -340,4 +327,7 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5Config] = None) -> str:
         flight.save_plot(fig, filename="visual_telemetry.png")
         plt.close(fig)
 
+        sim.close_telemetry()
+        coupling_state_history.close()
+        gain_history.close()
         return "COUNCIL_REPORT.md"
@@ -1,92 +1,45 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import Literal, Optional, Sequence
 
 import matplotlib.pyplot as plt
 import numpy as np
 
-from core.vacuum_chamber import VacuumChamber
+from core.drives import harmonic_phases
+from core.langevin import LangevinVacuumChamber
+from core.noise import spawn_seeds
+from core.potentials import TwoCouplerDrive
+from core.telemetry import ArraySink
+from core.vacuum_chamber import DiagnosticsPolicy
 from flight_recorder.mission_logger import FlightRecorder
 
 
-class LangevinVacuumChamber(VacuumChamber):
-    """High-fidelity Langevin chamber with energy accounting."""
-    
-    def __init__(
-        self,
-        nx: int,
-        dx: float,
-        dt: float,
-        gamma: float = 0.001,
-        temperature: float = 0.0,
-    ):
-        super().__init__(nx, dx)
-        self.gamma = gamma
-        self.temp = temperature
-        self.dt = dt
-
-        if self.temp > 0 and self.gamma > 0:
-            self.noise_scale = float(np.sqrt(2 * self.gamma * self.temp / self.dt))
-        else:
-            self.noise_scale = 0.0
+class SwitchingWorkChamber(LangevinVacuumChamber):
+    """Core Langevin chamber with switching-work accounting."""
 
-    def step_damped(
+    def step_damped_separable(
         self,
         *,
         c: float,
-        v_potential: np.ndarray,
-        v_potential_prev: Optional[np.ndarray] = None,
+        potential: TwoCouplerDrive,
+        coefficients: Sequence[float],
+        coefficients_prev: Optional[Sequence[float]] = None,
     ) -> float:
         """Advance field and return switching work done.
-        
-        Returns:
-            Switching work if v_potential changed, else 0.0
-        """
-        # Calculate switching work if potential changed
-        switching_work = 0.0
-        if v_potential_prev is not None:
-            # Work done by changing potential while field is present
-            # W = integral of phi^2 * (V_new - V_old) * dx
-            delta_V = v_potential - v_potential_prev
-            switching_work = float(0.5 * np.sum((self.phi**2) * delta_V) * self.dx)
-
-        # Physics step
-        laplacian = (
-            np.roll(self.phi, -1) - 2 * self.phi + np.roll(self.phi, 1)
-        ) / (self.dx**2)
-        interaction = v_potential * self.phi
-        noise = np.zeros(self.nx)
-        if self.noise_scale > 0:
-            noise = np.random.normal(0, self.noise_scale, self.nx)
-
-        forces = (c**2) * laplacian - interaction + noise
-
-        denom = 1.0 + (self.gamma * self.dt / 2.0)
-        term1 = 2.0 * self.phi
-        term2 = self.phi_prev * (1.0 - (self.gamma * self.dt / 2.0))
-        term3 = (self.dt**2) * forces
-
-        self.phi_next = (term1 - term2 + term3) / denom
-        self.phi_next[0] = 0.0
-        self.phi_next[-1] = 0.0
-
-        grad_v = np.gradient(v_potential, self.dx)
-        force = -float(np.sum((self.phi**2) * grad_v) * self.dx)
-        self.mirror_force.append(force)
-
-        dphi_dt = (self.phi_next - self.phi_prev) / (2 * self.dt)
-        dphi_dx = np.gradient(self.phi, self.dx)
-        energy = 0.5 * float(
-            np.sum(dphi_dt**2 + (c**2) * dphi_dx**2 + v_potential * self.phi**2)
-            * self.dx
-        )
-        self.total_energy_field.append(energy)
 
-        self.phi_prev = np.copy(self.phi)
-        self.phi = np.copy(self.phi_next)
+        Work done by changing the potential while the field is present,
+        W = 0.5·∫φ²(V_new - V_old)dx, reduces to 0.5·dx·Σ_k Δg_k·Σφ²p_k
+        with the profile overlaps the step already computes.
 
-        return switching_work
+        Returns:
+            Switching work if the couplings changed, else 0.0
+        """
+        super().step_damped_separable(c=c, potential=potential, coefficients=coefficients)
+        if coefficients_prev is None:
+            return 0.0
+        delta_g = np.subtract(coefficients, coefficients_prev)
+        return float(0.5 * (delta_g @ self.profile_overlap) * self.dx)
 
 
 @dataclass(frozen=True)
@@ -123,6 +76,8 @@ class Experiment5BConfig:
         "blind",         # Fixed work injection (no conditioning)
     )
 
+    backend: str = "numpy"  # see core.kernels.resolve_backend
+
     @property
     def period(self) -> int:
         return int(2 * np.pi / (self.omega * self.dt))
@@ -140,33 +95,32 @@ def _run_control_mode(
     mode: str,
     cfg: Experiment5BConfig,
     seed: int,
-    coupler1_profile: np.ndarray,
-    coupler2_profile: np.ndarray,
+    drive: TwoCouplerDrive,
     reference_duty_cycle: Optional[float] = None,
-) -> tuple[float, float, float, float, list[int]]:
+) -> tuple[float, float, float, float, np.ndarray]:
     """Run single control mode and return metrics.
     
     Returns:
         (net_impulse, switching_work_total, snr, duty_cycle, state_history)
     """
-    sim = LangevinVacuumChamber(
+    sim = SwitchingWorkChamber(
         cfg.grid_size,
         cfg.dx,
         cfg.dt,
         gamma=cfg.gamma,
         temperature=cfg.temperature if mode != "zero_bath" else 0.0,
+        diagnostics=DiagnosticsPolicy.force_only(),
+        noise_seed=spawn_seeds(seed, 1)[0],
+        backend=cfg.backend,
     )
 
     rng = np.random.default_rng(seed)
-    sim.phi = rng.normal(0, 0.001, cfg.grid_size)
-    sim.phi_prev = np.copy(sim.phi)
+    sim.load_field(rng.normal(0, 0.001, cfg.grid_size))
 
-    force_history = []
-    state_history = []
+    state_history = ArraySink(np.int8)
     switching_work_total = 0.0
 
-    # For delayed demon, store force history
-    force_buffer = []
+    # Delayed demon reads the force from delay_steps ago off the chamber telemetry
     delay_steps = cfg.period // 2 if mode == "delayed" else 0
 
     # For random demon, pre-generate states matching reference duty
@@ -175,11 +129,15 @@ def _run_control_mode(
     else:
         random_states = None
 
-    v_potential_prev = None
+    couplings_prev = None
 
-    for step in range(cfg.total_steps):
-        t = step * cfg.dt
+    # Carrier phases cos(Ωt), cos(Ωt + φ) for the whole run; the feedback
+    # only decides the gain applied to them
+    phase_cos = harmonic_phases(
+        0, cfg.total_steps, dt=cfg.dt, omega=cfg.omega, phases=(0.0, cfg.phi)
+    )
 
+    for step in range(cfg.total_steps):
         # === CONTROL LOGIC (MODE-DEPENDENT) ===
         if mode == "informed":
             # Original demon: force-conditioned switching
@@ -192,11 +150,8 @@ def _run_control_mode(
 
         elif mode == "delayed":
             # Delayed demon: use force from delay_steps ago
-            force_buffer.append(
-                sim.mirror_force[-1] if len(sim.mirror_force) > 0 else 0.0
-            )
-            if len(force_buffer) > delay_steps:
-                delayed_force = force_buffer[-delay_steps]
+            if step >= delay_steps:
+                delayed_force = sim.mirror_force[step - delay_steps]
                 state = 1 if delayed_force >= 0 else 0
             else:
                 state = 1  # Default until buffer fills
@@ -221,35 +176,35 @@ def _run_control_mode(
         g0_modulated = cfg.g_solid * gain
         g1_modulated = cfg.g_solid * 0.75 * gain
 
-        g1_t = g0_modulated + g1_modulated * np.cos(cfg.omega * t)
-        g2_t = g0_modulated + g1_modulated * np.cos(cfg.omega * t + cfg.phi)
+        g1_t = g0_modulated + g1_modulated * phase_cos[step, 0]
+        g2_t = g0_modulated + g1_modulated * phase_cos[step, 1]
 
-        v_potential = g1_t * coupler1_profile + g2_t * coupler2_profile
+        couplings = (g1_t, g2_t)
 
         # === STEP WITH SWITCHING WORK ACCOUNTING ===
-        work_this_step = sim.step_damped(
+        work_this_step = sim.step_damped_separable(
             c=cfg.c,
-            v_potential=v_potential,
-            v_potential_prev=v_potential_prev,
+            potential=drive,
+            coefficients=couplings,
+            coefficients_prev=couplings_prev,
         )
         switching_work_total += work_this_step
 
-        force_history.append(sim.mirror_force[-1])
-        v_potential_prev = np.copy(v_potential)
+        couplings_prev = couplings
 
     # === ANALYSIS ===
     transient_idx = int(cfg.total_steps * cfg.transient_fraction)
-    force_arr = np.asarray(force_history)
+    force_arr = sim.mirror_force.view()
     steady_force = force_arr[transient_idx:]
 
     net_impulse = float(np.mean(steady_force) * cfg.dt * len(steady_force))
     std_err = float(np.std(steady_force) / np.sqrt(len(steady_force)))
     snr = abs(net_impulse / (std_err * cfg.dt * len(steady_force))) if std_err > 0 else 0.0
 
-    states = np.asarray(state_history)
+    states = state_history.view()
     duty_cycle = float(np.mean(states))
 
-    return net_impulse, switching_work_total, snr, duty_cycle, state_history
+    return net_impulse, switching_work_total, snr, duty_cycle, states
 
 
 def run(*, seed: int = 42, cfg: Optional[Experiment5BConfig] = None) -> str:
@@ -283,11 +238,7 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5BConfig] = None) -> str:
         x2 = x_center + cfg.coupler_separation / 2
 
         x_grid = np.arange(cfg.grid_size) * cfg.dx
-        coupler1_profile = np.exp(-((x_grid - x1) ** 2) / (2 * cfg.coupler_width**2))
-        coupler2_profile = np.exp(-((x_grid - x2) ** 2) / (2 * cfg.coupler_width**2))
-
-        coupler1_profile /= np.sum(coupler1_profile) * cfg.dx
-        coupler2_profile /= np.sum(coupler2_profile) * cfg.dx
+        drive = TwoCouplerDrive.gaussian(x_grid, (x1, x2), cfg.coupler_width, dx=cfg.dx)
 
         # === RUN ALL CONTROL MODES ===
         results = {}
@@ -295,7 +246,7 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5BConfig] = None) -> str:
         # First pass: run informed to get reference duty cycle
         print("Running INFORMED (original demon)...")
         impulse, work, snr, duty, states = _run_control_mode(
-            "informed", cfg, seed, coupler1_profile, coupler2_profile
+            "informed", cfg, seed, drive
         )
         results["informed"] = (impulse, work, snr, duty)
         reference_duty = duty
@@ -311,8 +262,7 @@ def run(*, seed: int = 42, cfg: Optional[Experiment5BConfig] = None) -> str:
                 mode,
                 cfg,
                 seed,
-                coupler1_profile,
-                coupler2_profile,
+                drive,
                 reference_duty_cycle=reference_duty,
             )
             results[mode] = (impulse, work, snr, duty)
@@ -0,0 +1,320 @@
+"""Parameter sweeps over an experiment's frozen config dataclass.
+
+`lab.py sweep -e experiment4d_high_power --param gamma=0.0005:0.004:8
+--param g0=3,5,7` builds one config per grid point with
+`dataclasses.replace` on the experiment's default config, runs every
+point (in worker processes, see `core.parallel`) and writes one tidy
+table, `results.csv`: a row per run with the swept parameters, the seed,
+the run's status and outcome, and every metric it logged.
+
+A `--param` value is `start:stop:count` (evenly spaced, endpoints
+included), a comma-separated list, or a single value, converted to the
+type of the field's default. The design is the cartesian product of
+all values, or a Latin hypercube of `samples` points: ranges are then
+sampled continuously over [start, stop] (rounded for integer fields),
+lists by stratified choice.
+
+Each run keeps its own `FlightRecorder` folder, nested under the sweep
+folder, which also holds `sweep.json` (the spec) and the table. With a
+`ResultCache`, points whose config, seed and code are unchanged since an
+earlier sweep are restored from it rather than rerun.
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import datetime
+import itertools
+import json
+import os
+import time
+import traceback
+import typing
+import uuid
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.parallel import sweep_map, sweep_workers
+from core.result_cache import ResultCache
+from flight_recorder.mission_logger import METRICS_FILENAME, collecting_runs, recording_into
+
+DESIGNS = ("grid", "lhs")
+RESULTS_FILENAME = "results.csv"
+
+
+@dataclass(frozen=True)
+class SweepParameter:
+    """Values of one config field; `span` is set for `start:stop:count` ranges."""
+
+    name: str
+    values: Tuple[Any, ...]
+    span: Optional[Tuple[float, float]] = None
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    index: int
+    seed: int
+    overrides: Dict[str, Any]
+
+
+def config_class(run_fn: Callable[..., object]) -> type:
+    """The config dataclass an experiment's `run(cfg=...)` takes."""
+    hints = typing.get_type_hints(run_fn)
+    if "cfg" not in hints:
+        raise ValueError(f"{run_fn.__module__} does not take a config")
+    candidates = [t for t in typing.get_args(hints["cfg"]) if dataclasses.is_dataclass(t)]
+    if not candidates:
+        raise ValueError(f"{run_fn.__module__}'s cfg is not a dataclass")
+    return candidates[0]
+
+
+def _convert(kind: type, text: str) -> Any:
+    if kind is bool:
+        if text.lower() not in ("true", "false", "1", "0"):
+            raise ValueError(f"expected a boolean, got {text!r}")
+        return text.lower() in ("true", "1")
+    return kind(text)
+
+
+def parse_parameter(spec: str, defaults: Any) -> SweepParameter:
+    """Parse `name=start:stop:count`, `name=a,b,c` or `name=value` against `defaults`."""
+    name, sep, text = spec.partition("=")
+    name = name.strip()
+    if not sep or not text:
+        raise ValueError(f"--param must look like name=values, got {spec!r}")
+    fields = {f.name for f in dataclasses.fields(defaults)}
+    if name not in fields:
+        raise ValueError(f"{type(defaults).__name__} has no field {name!r}; fields: {', '.join(sorted(fields))}")
+    kind = type(getattr(defaults, name))
+    if kind not in (int, float, str, bool):
+        raise ValueError(f"cannot sweep {name!r} of type {kind.__name__}")
+
+    parts = text.split(":")
+    if len(parts) == 3 and kind in (int, float):
+        start, stop, count = float(parts[0]), float(parts[1]), int(parts[2])
+        if count < 1:
+            raise ValueError(f"{name}: a range needs at least one point")
+        values = np.linspace(start, stop, count)
+        if kind is int:
+            values = np.round(values)
+        # Drop linspace round-off (0.0022500000000000003) from the table
+        return SweepParameter(name, tuple(kind(float(f"{v:.12g}")) for v in values), span=(start, stop))
+    return SweepParameter(name, tuple(_convert(kind, v.strip()) for v in text.split(",")))
+
+
+def grid_design(parameters: Sequence[SweepParameter]) -> List[Dict[str, Any]]:
+    """Every combination of the parameter values."""
+    names = [p.name for p in parameters]
+    return [dict(zip(names, combo)) for combo in itertools.product(*(p.values for p in parameters))]
+
+
+def latin_hypercube(
+    parameters: Sequence[SweepParameter], samples: int, *, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """`samples` points with exactly one in each of `samples` strata of every parameter."""
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for param in parameters:
+        u = (rng.permutation(samples) + rng.random(samples)) / samples
+        if param.span is not None:
+            start, stop = param.span
+            kind = type(param.values[0])
+            values = start + u * (stop - start)
+            columns[param.name] = [kind(round(v)) if kind is int else float(f"{v:.12g}") for v in values]
+        else:
+            index = np.minimum((u * len(param.values)).astype(int), len(param.values) - 1)
+            columns[param.name] = [param.values[i] for i in index]
+    return [{name: columns[name][k] for name in columns} for k in range(samples)]
+
+
+@dataclass(frozen=True)
+class RunSummary:
+    """What one run reported, read back from its `metrics.json`."""
+
+    seed: int
+    status: str
+    outcome: str
+    elapsed: float
+    folder: Optional[str] = None
+    error: Optional[str] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+
+
+def _read_summary(seed: int, folder: str, elapsed: float, *, error: Optional[str], cached: bool) -> RunSummary:
+    with open(os.path.join(folder, METRICS_FILENAME), encoding="utf-8") as f:
+        summary = json.load(f)
+    return RunSummary(
+        seed,
+        summary["status"],
+        summary["outcome"],
+        elapsed,
+        folder=folder,
+        error=summary["error"] or error,
+        metrics=summary["metrics"],
+        cached=cached,
+    )
+
+
+def run_experiment(
+    experiment: str,
+    seed: int,
+    *,
+    cfg: Any = None,
+    warm_start: Optional[str] = None,
+    base_dir: str = "mission_logs",
+    cache: Optional[ResultCache] = None,
+    inline: bool = False,
+) -> RunSummary:
+    """Run one seed of `experiment`, its run folder under `base_dir`, and summarize it.
+
+    With a `cache`, an identical earlier run (same config, seed and code)
+    is restored from it instead, and a fresh run that finished without an
+    error is stored. Warm-started runs, and experiments without a config,
+    always run. With `inline`, the experiment's own sweep runs in this
+    process (`workers=1`), for callers that already run experiments in a
+    pool. An exception is printed and summarized rather than raised, so
+    the caller's other runs go on.
+    """
+    from experiments import get_experiments
+
+    run_fn = get_experiments()[experiment]
+    if cfg is None and (inline or (cache is not None and warm_start is None)):
+        try:
+            cfg = config_class(run_fn)()
+        except ValueError:
+            cfg = None
+    if inline and hasattr(cfg, "workers"):
+        cfg = dataclasses.replace(cfg, workers=1)
+    kwargs: Dict[str, Any] = {"seed": seed}
+    if warm_start is not None:
+        kwargs["warm_start"] = warm_start
+    if cfg is not None:
+        kwargs["cfg"] = cfg
+
+    start = time.perf_counter()
+    key = None
+    if cache is not None and warm_start is None and cfg is not None:
+        key = cache.key(experiment, run_fn, cfg, seed)
+        folder = cache.restore(key, base_dir)
+        if folder is not None:
+            return _read_summary(seed, folder, time.perf_counter() - start, error=None, cached=True)
+
+    error = None
+    with recording_into(base_dir), collecting_runs() as folders:
+        try:
+            run_fn(**kwargs)
+        except Exception as exc:  # the run's report has the details
+            traceback.print_exc()
+            error = f"{type(exc).__name__}: {exc}"
+    elapsed = time.perf_counter() - start
+    if not folders:
+        return RunSummary(seed, "CRITICAL FAILURE", "NO REPORT", elapsed, error=error)
+    summary = _read_summary(seed, folders[-1], elapsed, error=error, cached=False)
+    if key is not None and summary.error is None:
+        cache.store(key, summary.folder)
+    return summary
+
+
+def _run_point(
+    point: SweepPoint, *, experiment: str, folder: str, defaults: Any, cache: Optional[ResultCache]
+) -> Dict[str, Any]:
+    """Run one sweep point and return its results-table row."""
+    summary = run_experiment(
+        experiment,
+        point.seed,
+        cfg=dataclasses.replace(defaults, **point.overrides),
+        base_dir=os.path.join(folder, f"point_{point.index:04d}"),
+        cache=cache,
+    )
+    row: Dict[str, Any] = {"point": point.index, "seed": point.seed, **point.overrides}
+    row.update(status=summary.status, outcome=summary.outcome, error=summary.error, cached=summary.cached)
+    row.update(summary.metrics)
+    if summary.folder is not None:
+        row["run"] = os.path.basename(summary.folder)
+    return row
+
+
+def write_table(path: str, rows: Sequence[Dict[str, Any]]) -> str:
+    """Write `rows` as CSV, with the union of their keys as columns in first-seen order."""
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(columns), restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def run_sweep(
+    experiment: str,
+    parameter_specs: Sequence[str],
+    *,
+    design: str = "grid",
+    samples: int = 16,
+    seed: int = 42,
+    runs: int = 1,
+    workers: Optional[int] = 0,
+    base_dir: str = "mission_logs",
+    cache: Optional[ResultCache] = None,
+) -> str:
+    """Run a sweep of `experiment` and return its folder (see module docstring).
+
+    Every design point is run `runs` times with seeds `seed .. seed + runs - 1`.
+    Points found in `cache` are restored rather than rerun.
+    """
+    from experiments import get_experiments
+
+    if design not in DESIGNS:
+        raise ValueError(f"unknown design {design!r}; expected one of {DESIGNS}")
+    run_fn = get_experiments()[experiment]
+    defaults = config_class(run_fn)()
+    parameters = [parse_parameter(spec, defaults) for spec in parameter_specs]
+    if not parameters:
+        raise ValueError("a sweep needs at least one --param")
+    if design == "grid":
+        overrides = grid_design(parameters)
+    else:
+        overrides = latin_hypercube(parameters, samples, seed=seed)
+    points = [
+        SweepPoint(k * runs + r, seed + r, values)
+        for k, values in enumerate(overrides)
+        for r in range(runs)
+    ]
+
+    # Points are the unit of parallelism: an experiment's own sweep runs inline
+    n_workers = sweep_workers(workers, len(points))
+    if n_workers > 1 and hasattr(defaults, "workers"):
+        defaults = dataclasses.replace(defaults, workers=1)
+
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    folder = os.path.join(base_dir, f"{timestamp}_sweep_{experiment}_{uuid.uuid4().hex[:8]}")
+    os.makedirs(folder)
+    spec = {
+        "experiment": experiment,
+        "design": design,
+        "parameters": {p.name: list(p.values) for p in parameters},
+        "samples": samples if design == "lhs" else len(overrides),
+        "seed": seed,
+        "runs": runs,
+        "config": dataclasses.asdict(defaults),
+    }
+    with open(os.path.join(folder, "sweep.json"), "w", encoding="utf-8") as f:
+        json.dump(spec, f, indent=2, default=str)
+
+    print(f"Sweep of {experiment}: {len(points)} run(s) on {n_workers} worker(s) -> {folder}")
+    rows = []
+    point_fn = partial(_run_point, experiment=experiment, folder=folder, defaults=defaults, cache=cache)
+    for row in sweep_map(point_fn, points, workers=n_workers):
+        rows.append(row)
+        values = ", ".join(f"{name}={row[name]}" for name in overrides[0])
+        cached = " (cached)" if row["cached"] else ""
+        print(f"  [{row['point'] + 1}/{len(points)}] {values}, seed={row['seed']}: {row['status']}{cached}")
+    write_table(os.path.join(folder, RESULTS_FILENAME), rows)
+    return folder
@@ -1,21 +1,72 @@
 from __future__ import annotations
 
 import datetime
+import json
 import os
 import sys
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from io import StringIO
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+METRICS_FILENAME = "metrics.json"
+
+# Where new run folders go unless `base_dir` is given (see `recording_into`)
+_base_dir = "mission_logs"
+
+
+@contextmanager
+def recording_into(base_dir: str) -> Iterator[None]:
+    """Create the run folders of recorders started inside the block under `base_dir`."""
+    global _base_dir
+    saved, _base_dir = _base_dir, base_dir
+    try:
+        yield
+    finally:
+        _base_dir = saved
+
+
+# Folders of finished runs, when a `collecting_runs` block is open
+_collected: Optional[List[str]] = None
+
+
+@contextmanager
+def collecting_runs() -> Iterator[List[str]]:
+    """Yield a list that gathers the folders of recorders finishing inside the block."""
+    global _collected
+    saved, _collected = _collected, []
+    try:
+        yield _collected
+    finally:
+        _collected = saved
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
 
 
 @dataclass
 class FlightRecorder:
-    """Context manager that captures stdout + writes a Markdown report per run."""
+    """Context manager that captures stdout + writes a Markdown report per run.
+
+    Pass `folder` to continue an existing run (resume from checkpoint); its
+    report is rewritten in place. An exception carrying `report_status` /
+    `report_outcome` (such as the stability watchdog's) is reported with
+    those rather than as a crash. Next to the report, `metrics.json` holds
+    the status, outcome and logged metrics in machine-readable form
+    (`lab.py sweep` tabulates them).
+    """
 
     experiment_name: str
     author: str = "Hermes"
-    base_dir: str = "mission_logs"
+    base_dir: str = field(default_factory=lambda: _base_dir)
+    folder: Optional[str] = None
 
     id: str = field(init=False)
     timestamp: str = field(init=False)
@@ -26,10 +77,14 @@ class FlightRecorder:
     metrics: Dict[str, Any] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
-        self.id = uuid.uuid4().hex[:8]
         self.timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        safe_name = "".join(ch if (ch.isalnum() or ch in ("-", "_")) else "_" for ch in self.experiment_name)
-        self.folder_name = os.path.join(self.base_dir, f"{self.timestamp}_{safe_name}_{self.id}")
+        if self.folder is not None:
+            self.folder_name = self.folder
+            self.id = os.path.basename(os.path.normpath(self.folder)).rsplit("_", 1)[-1]
+        else:
+            self.id = uuid.uuid4().hex[:8]
+            safe_name = "".join(ch if (ch.isalnum() or ch in ("-", "_")) else "_" for ch in self.experiment_name)
+            self.folder_name = os.path.join(self.base_dir, f"{self.timestamp}_{safe_name}_{self.id}")
         self.console_output = StringIO()
         self.original_stdout = sys.stdout
 
@@ -87,6 +142,17 @@ class FlightRecorder:
                 f.write("\n## 4. Error Logs\n")
                 f.write(f"```\n{error}\n```\n")
 
+        summary = {
+            "experiment": self.experiment_name,
+            "id": self.id,
+            "status": status,
+            "outcome": outcome,
+            "error": error,
+            "metrics": self.metrics,
+        }
+        with open(os.path.join(self.folder_name, METRICS_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, default=_jsonable)
+
         return report_path
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -103,6 +169,11 @@ class FlightRecorder:
         error = None
         if exc_type is not None:
             error = str(exc_val)
+        # Exceptions may name their own report status and outcome
+        # (e.g. core.stability.NumericalInstabilityError)
+        if exc_val is not None:
+            status = getattr(exc_val, "report_status", status)
+            outcome = getattr(exc_val, "report_outcome", outcome)
 
         # If the experiment already saved a plot with a different name, it can override this via metrics.
         plot_filename = self.metrics.get("Plot Filename", "visual_telemetry.png")
@@ -113,6 +184,8 @@ class FlightRecorder:
             plot_filename=str(plot_filename),
             error=error,
         )
+        if _collected is not None:
+            _collected.append(self.folder_name)
 
         # Do not suppress exceptions.
         return False
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import inspect
 import sys
-from typing import Any, Dict
+from functools import partial
+from typing import Any, List, Optional
 
+import numpy as np
+
+from core.checkpoint import find_run_folder, load_checkpoint
+from core.parallel import sweep_map, sweep_workers
+from core.result_cache import ResultCache
 from experiments import get_experiments
+from experiments.sweep import DESIGNS, RunSummary, run_experiment, run_sweep
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -28,11 +36,135 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=42,
         help="Base RNG seed (increments by run index)",
     )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Continue an interrupted run from the last checkpoint in its mission_logs folder",
+    )
+    parser.add_argument(
+        "--warm-start",
+        metavar="CHECKPOINT",
+        help="Start from the field in a checkpoint (.npz or run folder) instead of vacuum noise",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for the runs (0: one per core)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun even if an identical run (config, seed, code) is in the result cache",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_sweep_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="lab.py sweep",
+        description="Sweep an experiment's config fields and tabulate the logged metrics",
+    )
+    parser.add_argument("--experiment", "-e", required=True, help="Experiment name")
+    parser.add_argument(
+        "--param",
+        "-p",
+        action="append",
+        default=[],
+        metavar="NAME=VALUES",
+        help="Config field to sweep: start:stop:count, a comma-separated list, or one value",
+    )
+    parser.add_argument("--design", choices=DESIGNS, default="grid", help="Cartesian grid or Latin hypercube")
+    parser.add_argument("--samples", type=int, default=16, help="Points of a Latin-hypercube design")
+    parser.add_argument("--runs", "-n", type=int, default=1, help="Seeds per design point")
+    parser.add_argument("--seed", type=int, default=42, help="Base RNG seed (increments by run index)")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes (0: one per core)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun every point even if an identical run is in the result cache",
+    )
     return parser.parse_args(argv)
 
 
+def sweep(argv: list[str]) -> int:
+    args = parse_sweep_args(argv)
+    experiments = get_experiments()
+    if args.experiment not in experiments:
+        available = ", ".join(sorted(experiments.keys()))
+        print(f"Unknown experiment: {args.experiment}. Available: {available}")
+        return 2
+    try:
+        folder = run_sweep(
+            args.experiment,
+            args.param,
+            design=args.design,
+            samples=args.samples,
+            seed=args.seed,
+            runs=args.runs,
+            workers=args.jobs,
+            cache=_cache(args),
+        )
+    except ValueError as exc:
+        print(f"Cannot sweep {args.experiment}: {exc}")
+        return 2
+    print(f"Results table written to {folder}.")
+    return 0
+
+
+def _print_spread(summaries: List[RunSummary]) -> None:
+    """Mean ± standard error over seeds of every numeric metric that varies."""
+    if len(summaries) < 2:
+        return
+    keys = [k for k, v in summaries[0].metrics.items() if isinstance(v, (int, float)) and not isinstance(v, bool)]
+    for key in keys:
+        values = [s.metrics.get(key) for s in summaries]
+        if not all(isinstance(v, (int, float)) for v in values):
+            continue
+        values = np.asarray(values, dtype=float)
+        if np.ptp(values) == 0.0:
+            continue
+        stderr = np.std(values, ddof=1) / np.sqrt(len(values))
+        print(f"  {key}: {np.mean(values):.6e} ± {stderr:.2e} (n={len(values)})")
+
+
+def _cache(args: argparse.Namespace) -> Optional[ResultCache]:
+    return None if args.no_cache else ResultCache()
+
+
+def _supports(run_fn: Any, option: str) -> bool:
+    return option in inspect.signature(run_fn).parameters
+
+
+def resume(run_id: str) -> int:
+    experiments = get_experiments()
+    try:
+        folder = find_run_folder(run_id)
+        meta = load_checkpoint(folder).meta
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Cannot resume run {run_id}: {exc}")
+        return 2
+
+    run_fn = experiments[meta["experiment"]]
+    run_fn(resume=folder)
+    print(f"Resumed run {run_id} of {meta['experiment']}.")
+    print(f"Report written to {folder}.")
+    return 0
+
+
 def main(argv: list[str]) -> int:
+    if argv[:1] == ["sweep"]:
+        return sweep(argv[1:])
     args = parse_args(argv)
+    if args.resume is not None:
+        return resume(args.resume)
 
     experiments = get_experiments()
     if args.experiment not in experiments:
@@ -41,15 +173,40 @@ def main(argv: list[str]) -> int:
         return 2
 
     run_fn = experiments[args.experiment]
+    if args.warm_start is not None and not _supports(run_fn, "warm_start"):
+        print(f"{args.experiment} does not support --warm-start.")
+        return 2
+
+    seeds = [args.seed + i for i in range(args.runs)]
+    try:
+        workers = sweep_workers(args.jobs, len(seeds))
+    except ValueError as exc:
+        print(exc)
+        return 2
+    if workers > 1:
+        print(f"Running {len(seeds)} run(s) of {args.experiment} on {workers} worker(s)...")
 
-    for i in range(args.runs):
-        seed = args.seed + i
-        kwargs: Dict[str, Any] = {"seed": seed}
-        run_fn(**kwargs)
+    # Each run captures its own stdout into its report, so only this
+    # progress reaches the console
+    summaries: List[RunSummary] = []
+    # Seeds are the unit of parallelism: an experiment's own sweep runs inline
+    run_seed = partial(
+        run_experiment, args.experiment, warm_start=args.warm_start, cache=_cache(args), inline=workers > 1
+    )
+    for summary in sweep_map(run_seed, seeds, workers=workers, ordered=False):
+        summaries.append(summary)
+        detail = summary.error or summary.outcome
+        timing = "cached" if summary.cached else f"{summary.elapsed:.1f} s"
+        print(
+            f"[{len(summaries)}/{len(seeds)}] seed {summary.seed}: {summary.status} - {detail} "
+            f"({timing}) {summary.folder or ''}".rstrip()
+        )
 
-    print(f"Completed {args.runs} run(s) of {args.experiment}.")
+    failed = [s for s in summaries if s.error is not None]
+    print(f"Completed {args.runs} run(s) of {args.experiment}" + (f", {len(failed)} failed." if failed else "."))
+    _print_spread(sorted((s for s in summaries if s.error is None), key=lambda s: s.seed))
     print("Reports written under mission_logs/.")
-    return 0
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":